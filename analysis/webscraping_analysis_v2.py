@@ -1,17 +1,20 @@
 import os
 import sys
-import json
 import re
 import time
 import pandas as pd
 from datetime import datetime
-from textblob import TextBlob
 
 import plotly.graph_objs as go
 import plotly.offline as pyo  # for .show() in some environments
 
+# --- reuse the dashboard's sentiment scorer and its on-disk cache
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'dashboard'))
+from sentiment import cached_scorer
+from review_stream import iter_batches, iter_records
+
 def list_json_files():
-    return [f for f in os.listdir('.') if f.lower().endswith('.json')]
+    return [f for f in os.listdir('.') if f.lower().endswith(('.json', '.jsonl'))]
 
 def choose_json_file():
     files = list_json_files()
@@ -70,9 +73,9 @@ def aspect_based_sentiment(df):
 
 def main():
     chosen_file = choose_json_file()
-    with open(chosen_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    df = pd.DataFrame(data)
+    # --- stream the export in bounded batches instead of json.load-ing the whole file
+    batches = [pd.DataFrame(batch) for batch in iter_batches(iter_records(chosen_file))]
+    df = pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
 
     # Ensure columns exist
     if 'review' not in df.columns:
@@ -87,7 +90,10 @@ def main():
 
     # Clean the review text and compute sentiment polarity
     df['clean_text'] = df['review'].apply(preprocess_text)
-    df['sentiment'] = df['clean_text'].apply(lambda x: TextBlob(x).sentiment.polarity)
+    # scores come from the dashboard's shared sentiment cache, only new texts hit TextBlob
+    scorer = cached_scorer()
+    df['sentiment'] = pd.Series(scorer.score(df['clean_text'].tolist()), index=df.index, dtype='float64')
+    print(f"sentiment cache: {scorer.cache.hits} hits, {scorer.cache.misses} misses")
 
     print(f"Analyzing file: {chosen_file}")
     avg_rating = df['rating'].mean(skipna=True)
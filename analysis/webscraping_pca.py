@@ -4,11 +4,14 @@ import json
 import re
 import pandas as pd
 import plotly.express as px
-from textblob import TextBlob
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.cluster import KMeans
 from sklearn.decomposition import PCA
 
+# --- reuse the dashboard's sentiment scorer and its on-disk cache
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'dashboard'))
+from sentiment import cached_scorer
+
 def list_json_files():
     return [f for f in os.listdir('.') if f.lower().endswith('.json')]
 
@@ -52,7 +55,10 @@ def main():
     df['clean_text'] = df['review'].apply(preprocess_text)
 
     # calc sentiment polarity for each processed review
-    df['sentiment'] = df['clean_text'].apply(lambda x: TextBlob(x).sentiment.polarity)
+    # scores come from the dashboard's shared sentiment cache, only new texts hit TextBlob
+    scorer = cached_scorer()
+    df['sentiment'] = pd.Series(scorer.score(df['clean_text'].tolist()), index=df.index, dtype='float64')
+    print(f"sentiment cache: {scorer.cache.hits} hits, {scorer.cache.misses} misses")
 
     # vectorize text with TF-IDF
     vectorizer = TfidfVectorizer(stop_words='english', min_df=2)
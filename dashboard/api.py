@@ -0,0 +1,110 @@
+"""
+JSON API for the Review Analytics Dashboard.
+Serves summary stats, per-source ratings and paginated, filterable
+reviews so the page can fetch data per tab instead of inlining it.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config import REVIEWS_MAX_PAGE_SIZE, REVIEWS_PAGE_SIZE
+from data_processor import DataProcessor
+
+
+def _json_default(value: Any) -> Any:
+    # numpy / pandas scalars -> plain Python values
+    if hasattr(value, 'item'):
+        return value.item()
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def to_json(payload: Any) -> bytes:
+    return json.dumps(payload, default=_json_default, ensure_ascii=False).encode('utf-8')
+
+
+def _param(params: Dict[str, List[str]], name: str) -> Optional[str]:
+    values = params.get(name)
+    return (values[0].strip() or None) if values else None
+
+
+def _int_param(params: Dict[str, List[str]], name: str, default: Optional[int] = None) -> Optional[int]:
+    value = _param(params, name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer")
+
+
+class DashboardAPI:
+    """Routes /api/* requests to the DataProcessor."""
+
+    def __init__(self, data_processor: DataProcessor):
+        self.data_processor = data_processor
+        self.routes: Dict[str, Callable[[Dict[str, List[str]]], Any]] = {
+            '/api/stats': self.stats,
+            '/api/ratings': self.ratings,
+            '/api/reviews': self.reviews,
+            '/api/search': self.search
+        }
+
+    def handle(self, path: str, params: Dict[str, List[str]]) -> Tuple[int, Any]:
+        """Return (HTTP status, JSON-able payload) for an API path and its query parameters."""
+        route = self.routes.get(path.rstrip('/'))
+        if route is None:
+            return 404, {'error': f"unknown endpoint: {path}"}
+        try:
+            return 200, route(params)
+        except ValueError as e:
+            return 400, {'error': str(e)}
+        except RuntimeError as e:
+            # A feature whose optional dependency is not installed
+            return 503, {'error': str(e)}
+
+    def stats(self, params: Dict[str, List[str]]) -> Dict[str, Any]:
+        stats = self.data_processor.get_summary_stats()
+        if stats:
+            stats['top_keywords'] = [[word, count] for word, count in stats['top_keywords']]
+        return stats
+
+    def ratings(self, params: Dict[str, List[str]]) -> Dict[str, Any]:
+        return self.data_processor.get_ratings_by_source()
+
+    def reviews(self, params: Dict[str, List[str]]) -> Dict[str, Any]:
+        limit = _int_param(params, 'limit', REVIEWS_PAGE_SIZE)
+        return self.data_processor.query_reviews(
+            source=_param(params, 'source'),
+            sentiment=_param(params, 'sentiment'),
+            rating=_int_param(params, 'rating'),
+            text=_param(params, 'q'),
+            date_from=_param(params, 'from'),
+            date_to=_param(params, 'to'),
+            offset=_int_param(params, 'offset', 0),
+            limit=min(limit, REVIEWS_MAX_PAGE_SIZE)
+        )
+
+    def search(self, params: Dict[str, List[str]]) -> Dict[str, Any]:
+        query = _param(params, 'q')
+        if not query:
+            raise ValueError("q is required")
+        mode = _param(params, 'mode') or 'keyword'
+        searches = {
+            'keyword': self.data_processor.search_reviews,
+            'semantic': self.data_processor.semantic_search_reviews
+        }
+        if mode not in searches:
+            raise ValueError(f"mode must be one of: {', '.join(searches)}")
+        limit = _int_param(params, 'limit', REVIEWS_PAGE_SIZE)
+        return searches[mode](
+            query,
+            source=_param(params, 'source'),
+            sentiment=_param(params, 'sentiment'),
+            rating=_int_param(params, 'rating'),
+            date_from=_param(params, 'from'),
+            date_to=_param(params, 'to'),
+            offset=_int_param(params, 'offset', 0),
+            limit=min(limit, REVIEWS_MAX_PAGE_SIZE)
+        )
@@ -0,0 +1,44 @@
+"""
+Aspect keyword matching module for the Review Analytics Dashboard.
+Matches each aspect's keywords against the whole review column in one
+compiled-regex pass with vectorised pandas string ops instead of a
+per-row Python loop.
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+
+class AspectMatcher:
+    """Vectorised multi-keyword matcher over a column of review texts."""
+
+    def __init__(self, aspect_keywords: Dict[str, List[str]]):
+        self.aspect_keywords = aspect_keywords
+        # One escaped alternation per aspect, longest keyword first so 'battery life'
+        # is counted as one mention rather than as 'battery'. No word boundaries:
+        # a review matches exactly when some keyword is a substring of it.
+        self.patterns = {aspect: self._compile(keywords) for aspect, keywords in aspect_keywords.items()}
+
+    @staticmethod
+    def _compile(keywords: List[str]) -> 're.Pattern':
+        alternatives = sorted(dict.fromkeys(keywords), key=len, reverse=True)
+        # An aspect without keywords must match nothing, not the empty string
+        return re.compile('|'.join(map(re.escape, alternatives)) or '(?!)')
+
+    def mention_counts(self, texts: pd.Series) -> pd.DataFrame:
+        """Number of aspect keyword occurrences in each review (one column per aspect).
+
+        Matching is case-insensitive substring matching, the same rule the
+        dashboard has always used, so 'app' also counts inside 'happy'.
+        """
+        lowered = texts.astype(str).str.lower()
+        counts = {aspect: lowered.str.count(pattern).to_numpy(dtype='int64')
+                  for aspect, pattern in self.patterns.items()}
+        return pd.DataFrame(counts, index=texts.index, columns=list(self.aspect_keywords))
+
+    def match(self, texts: pd.Series) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Return (boolean aspect matrix, mention counts) for the given texts."""
+        counts = self.mention_counts(texts)
+        return counts > 0, counts
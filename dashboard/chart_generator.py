@@ -114,97 +114,97 @@ class ChartGenerator:
         
         return chart_data, layout
     
-    def generate_chart_javascript(self, ratings_by_source: Dict[str, Dict[str, Any]], 
-                                 source_data: Dict[str, int]) -> str:
-        """Generate JavaScript code for all charts."""
-        
-        # Prepare source chart data
-        source_values = list(source_data.values())
-        source_labels = list(source_data.keys())
-        
+    def generate_chart_javascript(self) -> str:
+        """Generate JavaScript chart functions that plot data fetched from the API."""
         js_code = f"""
         // Plotly theme configuration
         var plotlyConfig = {json.dumps(self.get_plotly_config())};
         
         var plotlyLayout = {json.dumps(self.get_base_layout())};
         
-        // Source distribution chart
-        var sourceData = [{{
-            values: {source_values},
-            labels: {source_labels},
-            type: 'pie',
-            hole: 0.3,
-            marker: {{
-                colors: {json.dumps(self.colors['chart_colors'][:len(source_labels)])},
-                line: {{ color: '{self.colors["background_secondary"]}', width: 2 }}
-            }},
-            textfont: {{ 
-                color: '{self.colors["text_primary"]}',
-                family: 'Source Sans Pro, sans-serif',
-                size: 12
-            }},
-            textinfo: 'label+percent',
-            textposition: 'outside'
-        }}];
-        
-        var sourceLayout = Object.assign({{}}, plotlyLayout, {{
-            showlegend: false,
-            annotations: [{{
-                text: 'Reviews<br>by Platform',
-                x: 0.5, y: 0.5,
-                font: {{ size: 16, color: '{self.colors["text_secondary"]}' }},
-                showarrow: false
-            }}]
-        }});
-        
-        Plotly.newPlot('sourceChart', sourceData, sourceLayout, plotlyConfig);
-        
-        // Rating distribution charts for each source
-        var ratings_data = {json.dumps(ratings_by_source)};
-        var chart_id = 0;
+        var chartColors = {json.dumps(self.colors['chart_colors'])};
         
-        for (var source in ratings_data) {{
-            chart_id++;
-            var distribution = ratings_data[source].distribution;
-            var rating_labels = Object.keys(distribution);
-            var rating_values = Object.values(distribution);
-            
-            var ratingData = [{{
-                x: rating_labels,
-                y: rating_values,
-                type: 'bar',
+        // Source distribution chart
+        function renderSourceChart(sourceCounts) {{
+            var sourceLabels = Object.keys(sourceCounts);
+            var sourceData = [{{
+                values: Object.values(sourceCounts),
+                labels: sourceLabels,
+                type: 'pie',
+                hole: 0.3,
                 marker: {{
-                    color: '{self.colors["primary"]}',
-                    opacity: 0.8,
-                    line: {{ color: '{self.colors["primary"]}', width: 1 }}
+                    colors: chartColors.slice(0, sourceLabels.length),
+                    line: {{ color: '{self.colors["background_secondary"]}', width: 2 }}
+                }},
+                textfont: {{ 
+                    color: '{self.colors["text_primary"]}',
+                    family: 'Source Sans Pro, sans-serif',
+                    size: 12
                 }},
-                text: rating_values,
-                textposition: 'outside',
-                textfont: {{ color: '{self.colors["text_primary"]}', size: 11 }},
-                showlegend: false
+                textinfo: 'label+percent',
+                textposition: 'outside'
             }}];
             
-            var ratingLayout = Object.assign({{}}, plotlyLayout, {{
+            var sourceLayout = Object.assign({{}}, plotlyLayout, {{
                 showlegend: false,
-                xaxis: {{ 
-                    title: {{ text: 'Rating Stars', font: {{ color: '{self.colors["text_secondary"]}', size: 12 }} }},
-                    tickfont: {{ color: '{self.colors["text_primary"]}', size: 11 }},
-                    gridcolor: '{self.colors["border_primary"]}',
-                    linecolor: '{self.colors["border_secondary"]}',
-                    showgrid: true
-                }},
-                yaxis: {{ 
-                    title: {{ text: 'Count', font: {{ color: '{self.colors["text_secondary"]}', size: 12 }} }},
-                    tickfont: {{ color: '{self.colors["text_primary"]}', size: 11 }},
-                    gridcolor: '{self.colors["border_primary"]}',
-                    linecolor: '{self.colors["border_secondary"]}',
-                    showgrid: true
-                }},
-                height: {self.config['rating_chart_height']},
-                margin: {{ t: 20, r: 20, b: 50, l: 50 }}
+                annotations: [{{
+                    text: 'Reviews<br>by Platform',
+                    x: 0.5, y: 0.5,
+                    font: {{ size: 16, color: '{self.colors["text_secondary"]}' }},
+                    showarrow: false
+                }}]
             }});
             
-            Plotly.newPlot('ratingChart' + chart_id, ratingData, ratingLayout, plotlyConfig);
+            Plotly.newPlot('sourceChart', sourceData, sourceLayout, plotlyConfig);
+        }}
+        
+        // Rating distribution charts for each source
+        function renderRatingCharts(ratings_data) {{
+            var chart_id = 0;
+            
+            for (var source in ratings_data) {{
+                chart_id++;
+                var distribution = ratings_data[source].distribution;
+                var rating_labels = Object.keys(distribution);
+                var rating_values = Object.values(distribution);
+                
+                var ratingData = [{{
+                    x: rating_labels,
+                    y: rating_values,
+                    type: 'bar',
+                    marker: {{
+                        color: '{self.colors["primary"]}',
+                        opacity: 0.8,
+                        line: {{ color: '{self.colors["primary"]}', width: 1 }}
+                    }},
+                    text: rating_values,
+                    textposition: 'outside',
+                    textfont: {{ color: '{self.colors["text_primary"]}', size: 11 }},
+                    showlegend: false
+                }}];
+                
+                var ratingLayout = Object.assign({{}}, plotlyLayout, {{
+                    showlegend: false,
+                    xaxis: {{ 
+                        title: {{ text: 'Rating Stars', font: {{ color: '{self.colors["text_secondary"]}', size: 12 }} }},
+                        tickfont: {{ color: '{self.colors["text_primary"]}', size: 11 }},
+                        gridcolor: '{self.colors["border_primary"]}',
+                        linecolor: '{self.colors["border_secondary"]}',
+                        showgrid: true
+                    }},
+                    yaxis: {{ 
+                        title: {{ text: 'Count', font: {{ color: '{self.colors["text_secondary"]}', size: 12 }} }},
+                        tickfont: {{ color: '{self.colors["text_primary"]}', size: 11 }},
+                        gridcolor: '{self.colors["border_primary"]}',
+                        linecolor: '{self.colors["border_secondary"]}',
+                        showgrid: true
+                    }},
+                    height: {self.config['rating_chart_height']},
+                    margin: {{ t: 20, r: 20, b: 50, l: 50 }}
+                }});
+                
+                Plotly.newPlot('ratingChart' + chart_id, ratingData, ratingLayout, plotlyConfig);
+            }}
         }}
         """
         
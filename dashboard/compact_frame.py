@@ -0,0 +1,49 @@
+"""
+Compact dtypes for the Review Analytics Dashboard's review DataFrame.
+Downcasts numeric columns, stores free text as Arrow-backed strings and
+turns low-cardinality text columns into categoricals, with a per-column
+memory report to check the effect.
+"""
+
+from typing import Dict, Optional
+
+import pandas as pd
+
+from config import COMPACT_DTYPES
+
+TEXT_COLUMNS = ['source', 'author', 'review_text', 'country', 'version', 'sentiment_category']
+CATEGORY_COLUMNS = ['source', 'author', 'country', 'version', 'sentiment_category']
+
+
+def downcast_columns(df: pd.DataFrame, arrow_strings: Optional[bool] = None) -> pd.DataFrame:
+    """Narrow numeric dtypes and (optionally) move text columns to Arrow strings, in place."""
+    if arrow_strings is None:
+        arrow_strings = COMPACT_DTYPES['arrow_strings']
+    if 'rating' in df:
+        df['rating'] = pd.to_numeric(df['rating'], errors='coerce').round().astype('Int8')
+    if 'helpful' in df:
+        df['helpful'] = pd.to_numeric(pd.to_numeric(df['helpful'], errors='coerce').fillna(0),
+                                      downcast='integer')
+    if 'sentiment_score' in df:
+        df['sentiment_score'] = df['sentiment_score'].astype('float32')
+    if arrow_strings:
+        for column in TEXT_COLUMNS:
+            if column in df and not isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].astype('string[pyarrow]')
+    return df
+
+
+def categorize_columns(df: pd.DataFrame, max_ratio: Optional[float] = None) -> pd.DataFrame:
+    """Convert text columns with few distinct values (relative to rows) to categoricals, in place."""
+    if max_ratio is None:
+        max_ratio = COMPACT_DTYPES['category_max_ratio']
+    for column in CATEGORY_COLUMNS:
+        if column in df and len(df) and df[column].nunique(dropna=True) <= max_ratio * len(df):
+            df[column] = df[column].astype('category')
+    return df
+
+
+def memory_report(df: pd.DataFrame) -> Dict[str, Dict[str, object]]:
+    """Deep memory usage in bytes and dtype of every column."""
+    usage = df.memory_usage(index=False, deep=True)
+    return {column: {'dtype': str(df[column].dtype), 'bytes': int(usage[column])} for column in df.columns}
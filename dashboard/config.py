@@ -9,6 +9,8 @@ DEFAULT_PORT = 8050
 # DEFAULT_DATA_DIR = "./data" # --- relative path for data directory
 # --- use absolute path to ensure correct data directory location
 DEFAULT_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+# --- Parquet review store, relative to the data directory (built by `python review_store.py backfill`)
+REVIEW_STORE_DIR = "store"
 
 
 # Color scheme - Modern dark theme inspired by design
@@ -60,6 +62,73 @@ SENTIMENT_THRESHOLDS = {
     'negative_max': -0.1
 }
 
+# Sentiment scoring - process pool and cache settings
+# workers: None uses every CPU core; inputs shorter than parallel_min are scored serially
+# cache_file: SQLite score cache shared with the analysis/ scripts (None disables it)
+SENTIMENT_SCORING = {
+    'workers': None,
+    'chunk_size': 500,
+    'parallel_min': 2000,
+    'cache_file': os.path.join(os.path.dirname(__file__), "cache", "sentiment_cache.sqlite")
+}
+
+# Review DataFrame dtypes - text columns whose distinct values are at most
+# category_max_ratio of the rows become categoricals; arrow_strings stores
+# the remaining text as Arrow-backed strings
+COMPACT_DTYPES = {
+    'category_max_ratio': 0.5,
+    'arrow_strings': True
+}
+
+# Review deduplication - exact duplicates are always dropped,
+# near_duplicates adds a MinHash/LSH pass for edited reviews
+DEDUPLICATION = {
+    'near_duplicates': False,
+    'threshold': 0.8,
+    'num_perm': 64,
+    'bands': 16,
+    'shingle_size': 5
+}
+
+# Keyword counting - exact Counters by default; use_sketch switches to
+# count-min sketches (width x depth) that track the sketch_capacity top words,
+# with narrower sketches for each (source, month) window
+KEYWORD_COUNTING = {
+    'use_sketch': False,
+    'sketch_width': 1 << 16,
+    'window_sketch_width': 1 << 12,
+    'sketch_depth': 4,
+    'sketch_capacity': 500
+}
+
+# Full-text search - BM25 ranking parameters; index_file persists the inverted index
+# between runs (None keeps it in memory only)
+SEARCH_INDEX = {
+    'k1': 1.2,
+    'b': 0.75,
+    'index_file': os.path.join(os.path.dirname(__file__), "cache", "search_index.npz")
+}
+
+# Semantic search - model 'tfidf' (TF-IDF + truncated SVD, needs scikit-learn) or 'sentence'
+# (sentence-transformers model at sentence_model, loaded from local files only). Embeddings
+# are cached by text hash under index_dir; 'approximate' searches an IVF index instead of
+# every vector once the cache holds ivf_min_rows vectors
+SEMANTIC_SEARCH = {
+    'model': 'tfidf',
+    'sentence_model': 'all-MiniLM-L6-v2',
+    'dimensions': 128,
+    'max_features': 50000,
+    'fit_sample': 50000,
+    'refit_growth': 2.0,
+    'batch_size': 2048,
+    'min_score': 0.2,
+    'approximate': False,
+    'ivf_min_rows': 20000,
+    'ivf_lists': 256,
+    'ivf_probes': 16,
+    'index_dir': os.path.join(os.path.dirname(__file__), "cache", "semantic")
+}
+
 # Stop words for keyword extraction
 STOP_WORDS = {
     'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
@@ -76,6 +145,28 @@ SOURCE_PATTERNS = {
     'Zendesk': ['zendesk']
 }
 
+# /api/reviews paging - page size used by the Reviews tab and the largest page a client may ask for
+REVIEWS_PAGE_SIZE = 50
+REVIEWS_MAX_PAGE_SIZE = 200
+
+# Dashboard HTTP server: how the in-memory responses are pre-compressed (brotli only
+# if installed) and how often idle Server-Sent Events streams get a keep-alive (seconds)
+SERVER_CONFIG = {
+    'gzip_level': 9,
+    'brotli_quality': 11,
+    'compress_min_bytes': 1024,
+    'sse_keepalive': 15.0
+}
+
+# Data directory watcher: inotify through watchdog when installed, directory scans otherwise.
+# Changes are handed over once writes have been quiet for `debounce` seconds (at most `max_delay`)
+DATA_WATCHER = {
+    'use_watchdog': True,
+    'poll_interval': 2.0,
+    'debounce': 1.0,
+    'max_delay': 10.0
+}
+
 # Chart configuration
 CHART_CONFIG = {
     'plotly_config': {
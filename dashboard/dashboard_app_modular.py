@@ -5,13 +5,15 @@ Main application file - orchestrates all components.
 
 import os
 import sys
+import threading
 import webbrowser
-import http.server
-import socketserver
-from typing import Optional
+from typing import Dict, Optional, Set
 
+from api import DashboardAPI, to_json
 from config import DEFAULT_PORT, DEFAULT_DATA_DIR
+from dashboard_server import HTML_CONTENT_TYPE, JSON_CONTENT_TYPE, CachedResponse, DashboardServer
 from data_processor import DataProcessor
+from data_watcher import DataWatcher
 from html_generator import HTMLGenerator
 
 
@@ -25,25 +27,20 @@ class SimpleDashboard:
         self.port = port
         self.data_processor = DataProcessor(data_dir)
         self.html_generator = HTMLGenerator()
+        self.api = DashboardAPI(self.data_processor)
+        self.server: Optional[DashboardServer] = None
     
-    def load_data(self) -> bool:
-        """Load and process review data."""
-        return self.data_processor.load_data()
+    def load_data(self, changed_files: Optional[Set[str]] = None) -> bool:
+        """Load and process review data (only `changed_files` if given)."""
+        return self.data_processor.load_data(changed_files=changed_files)
     
     def generate_html(self) -> str:
         """Generate the HTML dashboard."""
         if not self.data_processor.is_data_loaded():
             return self._generate_no_data_html()
         
-        # Get all required data
-        stats = self.data_processor.get_summary_stats()
-        ratings_by_source = self.data_processor.get_ratings_by_source()
-        reviews_by_source = self.data_processor.get_reviews_by_source()
-        
-        # Generate complete HTML
-        return self.html_generator.generate_complete_html(
-            stats, ratings_by_source, reviews_by_source
-        )
+        # The page is a shell; each tab fetches its data from /api
+        return self.html_generator.generate_complete_html()
     
     def _generate_no_data_html(self) -> str:
         """Generate HTML for when no data is available."""
@@ -81,8 +78,14 @@ class SimpleDashboard:
         <p>Please add JSON review files to the data directory:<br><strong>{data_dir}</strong></p>
         <p>Supported formats: Google Play, App Store, and Trustpilot reviews</p>
     </div>
+    <script>
+        // Reload as soon as the watcher picks up data
+        if (window.EventSource) {
+            new EventSource('/api/events').addEventListener('stats', function() { location.reload(); });
+        }
+    </script>
 </body>
-</html>""".format(data_dir=self.data_dir)
+</html>""".replace('{data_dir}', self.data_dir)
     
     def _try_generate_sample_data(self) -> bool:
         """Try to generate sample data if available."""
@@ -105,28 +108,53 @@ class SimpleDashboard:
             if self._try_generate_sample_data():
                 data_loaded = self.load_data()
         
-        # Generate HTML
-        html_content = self.generate_html()
-        
-        # Save HTML file
-        html_file = 'dashboard.html'
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        print(f"Generated dashboard HTML: {html_file}")
+        # Render the page and summary responses into memory
+        snapshot = self.build_snapshot()
+        page_size = len(snapshot['/'].variants['identity'][0])
+        print(f"Rendered dashboard ({page_size / 1024:.1f} KB)")
         
         # Start HTTP server
-        self._start_server(html_file)
+        self._start_server(snapshot)
+    
+    def build_snapshot(self) -> Dict[str, CachedResponse]:
+        """Render the page and the summary API responses for the current data."""
+        page = CachedResponse(self.generate_html().encode('utf-8'), HTML_CONTENT_TYPE)
+        snapshot = {'/': page, '/dashboard.html': page}
+        for path in ('/api/stats', '/api/ratings'):
+            _, payload = self.api.handle(path, {})
+            snapshot[path] = CachedResponse(to_json(payload), JSON_CONTENT_TYPE)
+        return snapshot
     
-    def _start_server(self, html_file: str) -> None:
+    def _on_data_change(self, changed_files: Set[str]) -> None:
+        """Re-read the changed files, re-render and push the new stats to connected pages."""
+        print(f"Data changed: {', '.join(sorted(changed_files))}")
+        self.load_data(changed_files)
+        snapshot = self.build_snapshot()
+        if self.server is not None:
+            # Swap first, so pages that react to the event fetch the new data
+            self.server.publish(snapshot)
+            self.server.events.publish('stats', snapshot['/api/stats'].variants['identity'][0])
+            print(f"Pushed new stats to {len(self.server.events)} connected page(s)")
+        self._warm_semantic_index()
+    
+    def _warm_semantic_index(self) -> None:
+        """Embed new reviews ahead of the first natural-language query."""
+        if not self.data_processor.is_data_loaded() or not self.data_processor.semantic_index.available:
+            return
+        try:
+            self.data_processor.prepare_semantic_index()
+        except Exception as e:
+            print(f"Error preparing semantic search: {e}")
+    
+    def _start_server(self, snapshot: Dict[str, CachedResponse]) -> None:
         """Start the HTTP server."""
-        class DashboardHandler(http.server.SimpleHTTPRequestHandler):
-            def do_GET(self):
-                if self.path == '/':
-                    self.path = f'/{html_file}'
-                return super().do_GET()
-        
         try:
-            with socketserver.TCPServer(("", self.port), DashboardHandler) as httpd:
+            with DashboardServer(("", self.port), self.api) as httpd:
+                httpd.publish(snapshot)
+                self.server = httpd
+                watcher = DataWatcher(self.data_dir, self._on_data_change)
+                watcher.start()
+                threading.Thread(target=self._warm_semantic_index, daemon=True).start()
                 url = f"http://localhost:{self.port}"
                 print(f"\nDashboard running at: {url}")
                 
@@ -142,14 +170,17 @@ class SimpleDashboard:
                 else:
                     print("No data loaded - showing placeholder dashboard")
                 
-                print(f"\nRefresh the page to reload data")
+                print(f"\nWatching {self.data_dir} for changes ({watcher.mode}); open pages update live")
                 print("Press Ctrl+C to stop the server")
                 
                 # Open browser
                 webbrowser.open(url)
                 
                 # Serve forever
-                httpd.serve_forever()
+                try:
+                    httpd.serve_forever()
+                finally:
+                    watcher.stop()
                 
         except KeyboardInterrupt:
             print("\nDashboard stopped!")
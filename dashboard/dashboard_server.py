@@ -0,0 +1,216 @@
+"""
+HTTP server for the Review Analytics Dashboard.
+Serves the rendered page and summary API responses from memory, with
+ETags and pre-compressed gzip/brotli bodies, on a thread per request.
+Responses are grouped in a snapshot that is swapped in one assignment
+whenever the data is reloaded, and connected pages are told about new
+data over Server-Sent Events.
+"""
+
+import gzip
+import hashlib
+import http.server
+import queue
+import threading
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from api import DashboardAPI, to_json
+from config import SERVER_CONFIG
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+JSON_CONTENT_TYPE = 'application/json; charset=utf-8'
+HTML_CONTENT_TYPE = 'text/html; charset=utf-8'
+
+
+def accepted_encodings(header: Optional[str]) -> set:
+    """Content codings listed in an Accept-Encoding header, minus those refused with q=0."""
+    encodings = set()
+    for part in (header or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        q = params.strip()
+        if q.startswith('q='):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            encodings.add(coding.strip().lower())
+    return encodings
+
+
+class CachedResponse:
+    """A response body with its ETag and pre-compressed variants, built once per data version."""
+
+    def __init__(self, body: bytes, content_type: str, cache_control: str = 'no-cache'):
+        self.content_type = content_type
+        self.cache_control = cache_control
+        digest = hashlib.sha1(body).hexdigest()[:20]
+        # Each encoding is a separate representation, so each gets its own ETag
+        self.variants: Dict[str, Tuple[bytes, str]] = {'identity': (body, f'"{digest}"')}
+        if len(body) >= SERVER_CONFIG['compress_min_bytes']:
+            self.variants['gzip'] = (gzip.compress(body, SERVER_CONFIG['gzip_level'], mtime=0),
+                                     f'"{digest}-gzip"')
+            if brotli is not None:
+                self.variants['br'] = (brotli.compress(body, quality=SERVER_CONFIG['brotli_quality']),
+                                       f'"{digest}-br"')
+
+    def select(self, accept_encoding: Optional[str]) -> Tuple[str, bytes, str]:
+        """(encoding, body, etag) of the smallest variant the client accepts."""
+        accepted = accepted_encodings(accept_encoding)
+        for encoding in ('br', 'gzip'):
+            if encoding in self.variants and (encoding in accepted or '*' in accepted):
+                return (encoding,) + self.variants[encoding]
+        return ('identity',) + self.variants['identity']
+
+
+class EventBroadcaster:
+    """Fans Server-Sent Events out to every connected client."""
+
+    def __init__(self, backlog: int = 16):
+        self.backlog = backlog
+        self._lock = threading.Lock()
+        self._subscribers: List[queue.Queue] = []
+
+    def subscribe(self) -> queue.Queue:
+        subscription = queue.Queue(maxsize=self.backlog)
+        with self._lock:
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: queue.Queue) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def publish(self, event: str, data: bytes) -> None:
+        message = f'event: {event}\n'.encode('utf-8')
+        message += b''.join(b'data: ' + line + b'\n' for line in data.split(b'\n')) + b'\n'
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            # A client that stopped reading loses its oldest event, never blocks the publisher
+            try:
+                subscription.put_nowait(message)
+            except queue.Full:
+                try:
+                    subscription.get_nowait()
+                except queue.Empty:
+                    pass
+                subscription.put_nowait(message)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+
+class DashboardRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serves snapshot responses from memory and review queries through the API."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_HEAD(self):
+        self.do_GET(head=True)
+
+    def do_GET(self, head: bool = False):
+        parsed = urlparse(self.path)
+        # Read the snapshot once so a concurrent swap cannot mix two data versions
+        snapshot = self.server.snapshot
+        response = snapshot.get(parsed.path)
+        if response is not None:
+            self._send_cached(response, head)
+            return
+        if parsed.path == '/api/events' and not head:
+            self._stream_events()
+            return
+        if parsed.path.startswith('/api/'):
+            status, payload = self.server.api.handle(parsed.path, parse_qs(parsed.query))
+            self._send_body(status, to_json(payload), JSON_CONTENT_TYPE, head=head)
+            return
+        self._send_body(404, b'Not found', 'text/plain; charset=utf-8', head=head)
+
+    def _stream_events(self) -> None:
+        """Hold the connection open and forward published events until the client goes away."""
+        events = self.server.events
+        subscription = events.subscribe()
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        try:
+            self.wfile.write(b'retry: 5000\n\n')
+            while True:
+                try:
+                    message = subscription.get(timeout=SERVER_CONFIG['sse_keepalive'])
+                except queue.Empty:
+                    # Comment line: keeps proxies from timing out the idle stream
+                    message = b': keep-alive\n\n'
+                self.wfile.write(message)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+            pass
+        finally:
+            events.unsubscribe(subscription)
+
+    def _send_cached(self, response: CachedResponse, head: bool) -> None:
+        encoding, body, etag = response.select(self.headers.get('Accept-Encoding'))
+        if_none_match = self.headers.get('If-None-Match', '')
+        tags = {tag.strip().replace('W/', '', 1) for tag in if_none_match.split(',')}
+        if etag in tags or '*' in tags:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', response.cache_control)
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', response.content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', response.cache_control)
+        self.send_header('Vary', 'Accept-Encoding')
+        if encoding != 'identity':
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def _send_body(self, status: int, body: bytes, content_type: str, head: bool = False) -> None:
+        # Query results change with every request, so they are compressed on the fly
+        encoding = 'identity'
+        if len(body) >= SERVER_CONFIG['compress_min_bytes'] and \
+                'gzip' in accepted_encodings(self.headers.get('Accept-Encoding')):
+            body = gzip.compress(body, 6, mtime=0)
+            encoding = 'gzip'
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        if encoding != 'identity':
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+
+class DashboardServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server whose cached responses can be replaced while it runs."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], api: DashboardAPI):
+        super().__init__(address, DashboardRequestHandler)
+        self.api = api
+        self.snapshot: Dict[str, CachedResponse] = {}
+        self.events = EventBroadcaster()
+
+    def publish(self, snapshot: Dict[str, CachedResponse]) -> None:
+        """Swap in a new set of cached responses; requests in flight keep the old ones."""
+        self.snapshot = snapshot
@@ -4,66 +4,252 @@ Handles data loading, cleaning, sentiment analysis, and statistics generation.
 """
 
 import os
-import json
+import threading
+import numpy as np
 import pandas as pd
-import re
-from collections import Counter
-from textblob import TextBlob
-from typing import Dict, List, Any, Optional
-from config import ASPECT_KEYWORDS, SENTIMENT_THRESHOLDS, STOP_WORDS, SOURCE_PATTERNS
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+from config import (ASPECT_KEYWORDS, REVIEW_STORE_DIR, REVIEWS_PAGE_SIZE, SEARCH_INDEX, SEMANTIC_SEARCH,
+                    SENTIMENT_SCORING, SENTIMENT_THRESHOLDS, SOURCE_PATTERNS)
+from sentiment import SentimentScorer
+from sentiment_cache import SentimentCache
+from aspect_matcher import AspectMatcher
+from keywords import KeywordIndex
+from compact_frame import categorize_columns, downcast_columns, memory_report
+from dedup import ReviewDeduplicator, review_keys
+from review_store import ReviewStore, file_digest, standardize_reviews
+from review_stream import iter_records
+from search_index import SearchIndex
+from semantic_index import SemanticIndex
 
 
 class DataProcessor:
     """Handles all data processing operations for the dashboard."""
     
-    def __init__(self, data_dir: str = "./data"):
+    def __init__(self, data_dir: str = "./data", sentiment_workers: Optional[int] = None,
+                 sentiment_chunk_size: Optional[int] = None,
+                 sentiment_cache_file: Optional[str] = SENTIMENT_SCORING['cache_file'],
+                 near_duplicates: Optional[bool] = None,
+                 search_index_file: Optional[str] = SEARCH_INDEX['index_file'],
+                 semantic_index_dir: str = SEMANTIC_SEARCH['index_dir']):
         self.data_dir = data_dir
+        self.store = ReviewStore(os.path.join(data_dir, REVIEW_STORE_DIR))
         self.df = pd.DataFrame()
         self.aspect_df = pd.DataFrame()
+        self.aspect_flags = pd.DataFrame()
+        self.aspect_mentions = pd.DataFrame()
+        self.aspect_matcher = AspectMatcher(ASPECT_KEYWORDS)
+        self.keyword_index = KeywordIndex()
+        self.search_index = SearchIndex(search_index_file)
+        self.semantic_index = SemanticIndex(semantic_index_dir)
+        self.deduplicator = ReviewDeduplicator(near_duplicates)
+        self.duplicates_removed = 0
+        # (df, (ratings_by_source, reviews_by_source)), only valid while df is self.df
+        self._source_aggregates = None
+        # (df, date-descending index) for paging reviews
+        self._date_order = None
+        # (df, review_key index) for mapping search hits to rows
+        self._key_index = None
+        # (df, embedding rows) for semantic search, built on first use after each reload;
+        # _semantic_lock covers every prepare() and each search made with the rows
+        self._semantic_rows = None
+        self._semantic_lock = threading.Lock()
+        cache = SentimentCache(sentiment_cache_file) if sentiment_cache_file else None
+        self.sentiment_scorer = SentimentScorer(sentiment_workers, sentiment_chunk_size, cache=cache)
+        # Per-file state for incremental reloads: filename -> (mtime_ns, size, sha1)
+        self._file_signatures: Dict[str, Tuple[int, int, str]] = {}
+        self._file_frames: Dict[str, pd.DataFrame] = {}
+        self._file_aspects: Dict[str, Tuple[pd.DataFrame, pd.DataFrame]] = {}
     
-    def load_data(self) -> bool:
-        """Load and process review data from JSON files."""
-        all_data = []
+    def load_data(self, force: bool = False, changed_files: Optional[Iterable[str]] = None) -> bool:
+        """Load review data, re-reading only the files that changed since the last load.
         
+        `changed_files` (paths relative to data_dir, e.g. from a file watcher) limits the
+        check to those files; files not loaded yet are always checked.
+        """
         if not os.path.exists(self.data_dir):
             print(f"Data directory {self.data_dir} not found!")
             return False
         
-        for filename in os.listdir(self.data_dir):
-            if filename.endswith('.json'):
-                filepath = os.path.join(self.data_dir, filename)
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Determine source based on filename
-                    source = self._detect_source(filename)
-                    
-                    # Standardize data
-                    for review in data:
-                        all_data.append({
-                            'source': source,
-                            'author': review.get('author', 'Anonymous'),
-                            'rating': review.get('rating'),
-                            'review_text': review.get('review', ''),
-                            'date': review.get('date'),
-                            'helpful': review.get('helpful', 0)
-                        })
-                
-                except Exception as e:
-                    print(f"Error loading {filename}: {e}")
-        
-        if all_data:
-            self.df = pd.DataFrame(all_data)
-            self.df = self.df[self.df['review_text'].str.strip() != '']
-            self.df['date'] = pd.to_datetime(self.df['date'], errors='coerce')
-            self._analyze_sentiment()
-            self._analyze_aspects()
-            print(f"Loaded {len(self.df)} reviews from {self.df['source'].nunique()} sources")
-            return True
-        else:
+        if force:
+            self._file_frames.clear()
+            self._file_aspects.clear()
+            self._file_signatures.clear()
+        
+        filenames = self._data_files()
+        removed = [filename for filename in self._file_signatures if filename not in filenames]
+        for filename in removed:
+            self._file_frames.pop(filename, None)
+            self._file_aspects.pop(filename, None)
+            del self._file_signatures[filename]
+        
+        reported = None if changed_files is None else {os.path.normpath(path) for path in changed_files}
+        changed = {}
+        for filename in filenames:
+            if reported is not None and filename in self._file_signatures and filename not in reported:
+                continue
+            filepath = os.path.join(self.data_dir, filename)
+            stat = None
+            try:
+                stat = os.stat(filepath)
+                previous = self._file_signatures.get(filename)
+                # mtime and size are a cheap first check; the hash catches touched-but-identical files
+                if previous and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                digest = file_digest(filepath)
+                if not (previous and previous[2] == digest):
+                    changed[filename] = self._read_reviews(filepath, filename)
+                self._file_signatures[filename] = (stat.st_mtime_ns, stat.st_size, digest)
+            except Exception as e:
+                # A file that fails to parse keeps the rows from its last good version
+                # and is retried once it changes again
+                print(f"Error loading {filename}: {e}")
+                if stat is not None:
+                    self._file_signatures[filename] = (stat.st_mtime_ns, stat.st_size, '')
+        
+        if changed:
+            self._analyze_files(changed)
+        
+        if changed or removed or force or self.df.empty:
+            self._rebuild([filename for filename in filenames if filename in self._file_frames])
+        
+        if self.df.empty:
             print("No data found!")
             return False
+        print(f"Loaded {len(self.df)} reviews from {self.df['source'].nunique()} sources "
+              f"({len(changed)} file(s) re-read, {len(removed)} removed, "
+              f"{self.duplicates_removed} duplicate reviews skipped)")
+        return True
+    
+    def _data_files(self) -> List[str]:
+        """Files to load, relative to data_dir: the Parquet store partitions, plus the
+        JSON/JSONL exports that have not been backfilled into the store."""
+        # Sorted so the copy kept for a duplicated review does not depend on directory order
+        exports = sorted(filename for filename in os.listdir(self.data_dir) if filename.endswith(('.json', '.jsonl')))
+        store_files = self.store.files()
+        if not store_files:
+            return exports
+        # Store partitions come first, so their precomputed rows win over re-exported duplicates
+        return ([os.path.join(REVIEW_STORE_DIR, relpath) for relpath in store_files]
+                + self.store.pending_exports(self.data_dir, exports))
+    
+    def _read_reviews(self, filepath: str, filename: str) -> pd.DataFrame:
+        """Read one data file into a DataFrame of standardized reviews."""
+        if filename.endswith('.parquet'):
+            # Store partitions are already typed and carry precomputed sentiment
+            return self.store.read_file(os.path.relpath(filename, REVIEW_STORE_DIR))
+        return standardize_reviews(iter_records(filepath), self._detect_source(filename))
+    
+    def read_exports(self, paths: List[str]) -> Tuple[pd.DataFrame, List[str]]:
+        """Read, standardize and score scraper exports (JSON, JSONL or CSV) into one DataFrame.
+        
+        Exports that fail to parse are reported and skipped; the paths that were read are returned too.
+        """
+        frames, read = [], []
+        for path in paths:
+            try:
+                frames.append(standardize_reviews(iter_records(path), self._detect_source(os.path.basename(path))))
+                read.append(path)
+            except Exception as e:
+                print(f"Error loading {path}: {e}")
+        if not frames:
+            return pd.DataFrame(), read
+        df = pd.concat(frames, ignore_index=True)
+        df['review_key'] = review_keys(df)
+        # Overlapping exports are collapsed before any scoring work
+        df = df[~self.deduplicator.duplicate_mask(df)].reset_index(drop=True)
+        self._analyze_sentiment(df)
+        return df, read
+    
+    def _analyze_files(self, frames: Dict[str, pd.DataFrame]) -> None:
+        """Compute derived columns for re-read files only, in one batch.
+        
+        Each review key is analysed once: rows repeating a review from another loaded
+        file, or from earlier in this batch, copy its results instead of being rescored.
+        """
+        combined = pd.concat(frames.values(), ignore_index=True)
+        keys = review_keys(combined)
+        others = [filename for filename in self._file_frames if filename not in frames]
+        known = pd.concat([self._file_frames[filename]['review_key'] for filename in others]
+                          or [pd.Series(dtype='uint64')], ignore_index=True)
+        fresh = combined[~keys.duplicated() & ~keys.isin(known)].assign(review_key=keys)
+        
+        # Store partitions arrive with their sentiment precomputed
+        unscored = fresh if 'sentiment_score' not in fresh else fresh[fresh['sentiment_score'].isna()]
+        if not unscored.empty:
+            scored = unscored[['review_text']].copy()
+            self._analyze_sentiment(scored)
+            fresh = fresh.copy()
+            fresh.loc[scored.index, ['sentiment_score', 'sentiment_category']] = \
+                scored[['sentiment_score', 'sentiment_category']]
+        flags, mentions = self.aspect_matcher.match(fresh['review_text'])
+        
+        # Results per review key: the fresh rows, then the already-analysed copies of repeated reviews
+        sentiment = [fresh.set_index('review_key')[['sentiment_score', 'sentiment_category']]]
+        flag_parts = [flags.set_axis(fresh['review_key'])]
+        mention_parts = [mentions.set_axis(fresh['review_key'])]
+        wanted = set(keys[keys.isin(known)])
+        for filename in others:
+            frame = self._file_frames[filename]
+            repeated = frame['review_key'].isin(wanted).to_numpy()
+            if repeated.any():
+                frame_keys = frame['review_key'][repeated]
+                sentiment.append(frame[repeated].set_index('review_key')[['sentiment_score', 'sentiment_category']])
+                flag_parts.append(self._file_aspects[filename][0][repeated].set_axis(frame_keys))
+                mention_parts.append(self._file_aspects[filename][1][repeated].set_axis(frame_keys))
+        
+        def by_key(parts: List[pd.DataFrame]) -> pd.DataFrame:
+            table = pd.concat(parts)
+            return table[~table.index.duplicated()].reindex(keys).reset_index(drop=True)
+        
+        results = by_key(sentiment)
+        combined['sentiment_score'] = results['sentiment_score'].astype('float64')
+        combined['sentiment_category'] = results['sentiment_category'].astype(str)
+        combined['review_key'] = keys
+        frames.update(self._split(combined, frames))
+        flags = self._split(by_key(flag_parts).astype(bool), frames)
+        mentions = self._split(by_key(mention_parts).astype('int64'), frames)
+        for filename, frame in frames.items():
+            downcast_columns(frame)
+            self._file_frames[filename] = frame
+            self._file_aspects[filename] = (flags[filename], mentions[filename])
+    
+    @staticmethod
+    def _split(combined: pd.DataFrame, frames: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """Split a frame built by concatenating `frames` back into per-file pieces."""
+        parts = {}
+        offset = 0
+        for filename, frame in frames.items():
+            parts[filename] = combined.iloc[offset:offset + len(frame)].reset_index(drop=True)
+            offset += len(frame)
+        return parts
+    
+    def _rebuild(self, filenames: List[str]) -> None:
+        """Reassemble the combined frames from the per-file results."""
+        # Only releases the old frame; the caches are keyed on the frame they were built from
+        self._source_aggregates = None
+        self._date_order = None
+        previous = self.df
+        if not filenames:
+            self.keyword_index.clear()
+            self.search_index.clear()
+            self.search_index.save()
+            self.df = pd.DataFrame()
+            self.duplicates_removed = 0
+            self.aspect_flags = pd.DataFrame()
+            self.aspect_mentions = pd.DataFrame()
+            self.aspect_df = pd.DataFrame()
+            return
+        df = pd.concat([self._file_frames[filename] for filename in filenames], ignore_index=True)
+        flags = pd.concat([self._file_aspects[filename][0] for filename in filenames], ignore_index=True)
+        mentions = pd.concat([self._file_aspects[filename][1] for filename in filenames], ignore_index=True)
+        # Stats, aspects and sentiment summaries only cover unique reviews
+        unique = ~self.deduplicator.duplicate_mask(df)
+        self.duplicates_removed = int((~unique).sum())
+        self.df = categorize_columns(df[unique].reset_index(drop=True))
+        self.aspect_flags = flags[unique].reset_index(drop=True)
+        self.aspect_mentions = mentions[unique].reset_index(drop=True)
+        self._update_indexes(previous)
+        self._analyze_aspects()
     
     def _detect_source(self, filename: str) -> str:
         """Detect the source platform based on filename."""
@@ -75,15 +261,16 @@ class DataProcessor:
         
         return 'Unknown'
     
-    def _analyze_sentiment(self) -> None:
+    def _analyze_sentiment(self, df: pd.DataFrame) -> None:
         """Analyze sentiment using TextBlob."""
-        def get_sentiment(text: str) -> float:
-            if not text:
-                return 0
-            blob = TextBlob(str(text))
-            return blob.sentiment.polarity
-        
-        self.df['sentiment_score'] = self.df['review_text'].apply(get_sentiment)
+        cache = self.sentiment_scorer.cache
+        before = cache.stats() if cache else None
+        scores = self.sentiment_scorer.score(df['review_text'].tolist())
+        df['sentiment_score'] = pd.Series(scores, index=df.index, dtype='float64')
+        if cache:
+            after = cache.stats()
+            print(f"Sentiment cache: {after['hits'] - before['hits']} hits, "
+                  f"{after['misses'] - before['misses']} misses")
         
         def categorize_sentiment(score: float) -> str:
             if score > SENTIMENT_THRESHOLDS['positive_min']:
@@ -93,24 +280,28 @@ class DataProcessor:
             else:
                 return 'Neutral'
         
-        self.df['sentiment_category'] = self.df['sentiment_score'].apply(categorize_sentiment)
+        df['sentiment_category'] = df['sentiment_score'].apply(categorize_sentiment)
     
     def _analyze_aspects(self) -> None:
         """Perform aspect-based analysis."""
-        aspect_data = []
-        
-        for idx, row in self.df.iterrows():
-            text = str(row['review_text']).lower()
-            for aspect, keywords in ASPECT_KEYWORDS.items():
-                mentions = sum(1 for keyword in keywords if keyword in text)
-                if mentions > 0:
-                    aspect_data.append({
-                        'aspect': aspect,
-                        'sentiment': row['sentiment_score'],
-                        'source': row['source']
-                    })
-        
-        self.aspect_df = pd.DataFrame(aspect_data)
+        # One row per (review, mentioned aspect), in review order then aspect order
+        stacked = self.aspect_flags.stack()
+        stacked = stacked[stacked]
+        if stacked.empty:
+            self.aspect_df = pd.DataFrame()
+            return
+        review_index = stacked.index.get_level_values(0)
+        self.aspect_df = pd.DataFrame({
+            'aspect': stacked.index.get_level_values(1).to_numpy(),
+            'sentiment': self.df.loc[review_index, 'sentiment_score'].to_numpy(),
+            'source': self.df.loc[review_index, 'source'].to_numpy()
+        })
+    
+    def get_reviews_with_aspect(self, aspect: str) -> pd.DataFrame:
+        """Get the reviews that mention the given aspect."""
+        if self.aspect_flags.empty or aspect not in self.aspect_flags.columns:
+            return self.df.iloc[0:0]
+        return self.df[self.aspect_flags[aspect]]
     
     def get_summary_stats(self) -> Dict[str, Any]:
         """Get summary statistics."""
@@ -123,18 +314,33 @@ class DataProcessor:
             'avg_sentiment': self.df['sentiment_score'].mean(),
             'sources': self.df['source'].value_counts().to_dict(),
             'sentiment_dist': self.df['sentiment_category'].value_counts().to_dict(),
-            'rating_dist': self.df['rating'].value_counts().to_dict() if self.df['rating'].notna().any() else {},
+            'rating_dist': {int(rating): int(count) for rating, count in self.df['rating'].value_counts().items()}
+                           if self.df['rating'].notna().any() else {},
             'top_keywords': self.get_top_keywords()
         }
     
-    def get_top_keywords(self, n: int = 20) -> List[tuple]:
-        """Extract top keywords from reviews."""
-        all_text = ' '.join(self.df['review_text'].astype(str))
-        # Simple tokenization
-        words = re.findall(r'\b\w+\b', all_text.lower())
-        # Remove stop words and short words
-        words = [w for w in words if len(w) > 2 and w not in STOP_WORDS]
-        return Counter(words).most_common(n)
+    def _update_indexes(self, previous: pd.DataFrame) -> None:
+        """Feed only the reviews that entered or left the frame to the keyword and search indexes."""
+        if previous.empty:
+            self.keyword_index.clear()
+            self.keyword_index.add(self.df)
+            # The search index may have been loaded from disk and only needs the difference
+            self.search_index.sync(self.df)
+        else:
+            left = previous[~previous['review_key'].isin(self.df['review_key'])]
+            entered = self.df[~self.df['review_key'].isin(previous['review_key'])]
+            self.keyword_index.remove(left)
+            self.keyword_index.add(entered)
+            self.search_index.remove(left)
+            self.search_index.add(entered)
+            # Reviews that stayed may still have been re-rated or re-scored under the same key
+            self.search_index.refresh(self.df)
+        self.search_index.save()
+    
+    def get_top_keywords(self, n: int = 20, source: Optional[str] = None,
+                         window: Optional[str] = None) -> List[tuple]:
+        """Extract top keywords from reviews, optionally for one source and/or 'YYYY-MM' month."""
+        return self.keyword_index.most_common(n, source, window)
     
     def get_aspect_sentiment(self) -> Dict[str, float]:
         """Get aspect-based sentiment summary."""
@@ -144,14 +350,29 @@ class DataProcessor:
     
     def get_ratings_by_source(self) -> Dict[str, Dict[str, Any]]:
         """Get rating statistics by source."""
+        return self._aggregate_by_source()[0]
+    
+    def get_reviews_by_source(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get all reviews organized by source and sorted by date."""
+        return self._aggregate_by_source()[1]
+    
+    def _aggregate_by_source(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        """Rating statistics and date-sorted review records per source, in one groupby pass."""
+        # Read the frame once; a reload swapping self.df mid-way cannot mix two versions
+        df = self.df
+        cached = self._source_aggregates
+        if cached is not None and cached[0] is df:
+            return cached[1]
+        
         ratings_by_source = {}
+        reviews_by_source = {}
+        if df.empty:
+            return ratings_by_source, reviews_by_source
         
-        for source in self.df['source'].unique():
-            source_data = self.df[self.df['source'] == source]
+        for source, source_data in df.groupby('source', sort=False, observed=True):
             ratings = source_data['rating'].dropna()
-            
             if len(ratings) > 0:
-                rating_dist = ratings.value_counts().sort_index().to_dict()
+                rating_dist = {int(rating): int(count) for rating, count in ratings.value_counts().sort_index().items()}
                 # Ensure all ratings 1-5 are represented
                 for i in range(1, 6):
                     if i not in rating_dist:
@@ -162,31 +383,134 @@ class DataProcessor:
                     'total_ratings': len(ratings),
                     'distribution': rating_dist
                 }
+            
+            # Sort by date (most recent first)
+            source_data = source_data.sort_values('date', ascending=False, na_position='last')
+            reviews_by_source[source] = self._review_records(source_data)
         
-        return ratings_by_source
+        self._source_aggregates = (df, (ratings_by_source, reviews_by_source))
+        return ratings_by_source, reviews_by_source
     
-    def get_reviews_by_source(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Get all reviews organized by source and sorted by date."""
-        reviews_by_source = {}
+    def query_reviews(self, source: Optional[str] = None, sentiment: Optional[str] = None,
+                      rating: Optional[int] = None, text: Optional[str] = None,
+                      date_from: Optional[str] = None, date_to: Optional[str] = None,
+                      offset: int = 0, limit: int = REVIEWS_PAGE_SIZE) -> Dict[str, Any]:
+        """Get one page of reviews matching the filters, most recent first, plus the match count."""
+        if offset < 0 or limit < 0:
+            raise ValueError("offset and limit must not be negative")
+        if self.df.empty:
+            return {'total': 0, 'offset': offset, 'limit': limit, 'reviews': []}
         
-        for source in self.df['source'].unique():
-            source_data = self.df[self.df['source'] == source].copy()
-            # Sort by date (most recent first)
-            source_data = source_data.sort_values('date', ascending=False, na_position='last')
-            
-            reviews_list = []
-            for _, review in source_data.iterrows():
-                reviews_list.append({
-                    'author': review['author'],
-                    'rating': review['rating'] if pd.notna(review['rating']) else 'N/A',
-                    'date': review['date'].strftime('%Y-%m-%d') if pd.notna(review['date']) else 'N/A',
-                    'text': review['review_text'],
-                    'sentiment': review['sentiment_category']
-                })
-            
-            reviews_by_source[source] = reviews_list
+        # Work on one frame reference so a concurrent reload cannot mix two versions of the data
+        df = self.df
+        if self._date_order is None or self._date_order[0] is not df:
+            self._date_order = (df, df.sort_values('date', ascending=False, na_position='last', kind='stable').index)
+        df = df.loc[self._date_order[1]]
+        
+        matched = df[self._filter_mask(df, source, sentiment, rating, text, date_from, date_to)]
+        return {
+            'total': len(matched),
+            'offset': offset,
+            'limit': limit,
+            'reviews': self._review_records(matched.iloc[offset:offset + limit])
+        }
+    
+    @staticmethod
+    def _filter_mask(df: pd.DataFrame, source: Optional[str] = None, sentiment: Optional[str] = None,
+                     rating: Optional[int] = None, text: Optional[str] = None,
+                     date_from: Optional[str] = None, date_to: Optional[str] = None) -> pd.Series:
+        """True for the reviews that pass every given filter."""
+        mask = pd.Series(True, index=df.index)
+        if source:
+            mask &= df['source'] == source
+        if sentiment:
+            mask &= df['sentiment_category'] == sentiment
+        if rating is not None:
+            mask &= (df['rating'] == rating).fillna(False)
+        if text:
+            mask &= df['review_text'].str.contains(text, case=False, regex=False).fillna(False)
+        if date_from:
+            mask &= (df['date'] >= pd.to_datetime(date_from, utc=True)).fillna(False)
+        if date_to:
+            mask &= (df['date'] <= pd.to_datetime(date_to, utc=True)).fillna(False)
+        return mask.astype(bool)
+    
+    def search_reviews(self, query: str, source: Optional[str] = None, sentiment: Optional[str] = None,
+                       rating: Optional[int] = None, date_from: Optional[str] = None,
+                       date_to: Optional[str] = None, offset: int = 0,
+                       limit: int = REVIEWS_PAGE_SIZE) -> Dict[str, Any]:
+        """Get one page of reviews ranked by BM25 relevance to the query, plus the match count."""
+        if offset < 0 or limit < 0:
+            raise ValueError("offset and limit must not be negative")
+        total, hits = self.search_index.search(query, source, sentiment, rating, date_from, date_to,
+                                               offset, limit)
+        df = self.df
+        if df.empty or not hits:
+            return {'total': total, 'offset': offset, 'limit': limit, 'reviews': []}
         
-        return reviews_by_source
+        if self._key_index is None or self._key_index[0] is not df:
+            self._key_index = (df, pd.Index(df['review_key']))
+        rows = self._key_index[1].get_indexer([key for key, _ in hits])
+        # Hits the frame no longer has (a reload in progress) are left out
+        found = rows >= 0
+        reviews = self._review_records(df.iloc[rows[found]])
+        for review, (_, score) in zip(reviews, [hit for hit, keep in zip(hits, found) if keep]):
+            review['score'] = round(score, 3)
+        return {'total': total, 'offset': offset, 'limit': limit, 'reviews': reviews}
+    
+    def semantic_search_reviews(self, query: str, source: Optional[str] = None, sentiment: Optional[str] = None,
+                                rating: Optional[int] = None, date_from: Optional[str] = None,
+                                date_to: Optional[str] = None, offset: int = 0,
+                                limit: int = REVIEWS_PAGE_SIZE) -> Dict[str, Any]:
+        """Get one page of reviews ranked by embedding similarity to a natural-language query."""
+        if offset < 0 or limit < 0:
+            raise ValueError("offset and limit must not be negative")
+        df = self.df
+        if df.empty:
+            return {'total': 0, 'offset': offset, 'limit': limit, 'reviews': []}
+        self._check_semantic_available()
+        mask = self._filter_mask(df, source, sentiment, rating, None, date_from, date_to).to_numpy()
+        # Rows and search share one lock section: a reload preparing a newer frame may refit
+        # the model or compact the cache in between, which renumbers the rows
+        with self._semantic_lock:
+            rows = self._semantic_rows_for(df)
+            total, positions, scores = self.semantic_index.search(query, rows, mask, offset, limit)
+        reviews = self._review_records(df.iloc[positions])
+        for review, score in zip(reviews, scores.tolist()):
+            review['score'] = round(score, 3)
+        return {'total': total, 'offset': offset, 'limit': limit, 'reviews': reviews}
+    
+    def prepare_semantic_index(self, df: Optional[pd.DataFrame] = None) -> np.ndarray:
+        """Embed any reviews the semantic index has not seen; returns their embedding rows."""
+        df = self.df if df is None else df
+        self._check_semantic_available()
+        with self._semantic_lock:
+            return self._semantic_rows_for(df)
+    
+    def _check_semantic_available(self) -> None:
+        if not self.semantic_index.available:
+            raise RuntimeError("semantic search needs scikit-learn (or sentence-transformers for the 'sentence' model)")
+    
+    def _semantic_rows_for(self, df: pd.DataFrame) -> np.ndarray:
+        """Embedding rows of `df`; the caller holds _semantic_lock, the only way the cache changes."""
+        if self._semantic_rows is None or self._semantic_rows[0] is not df:
+            self._semantic_rows = (df, self.semantic_index.prepare(df['review_text'].astype(str).tolist()))
+        return self._semantic_rows[1]
+    
+    @staticmethod
+    def _review_records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Display records for the given reviews, in frame order."""
+        return pd.DataFrame({
+            'author': frame['author'],
+            'rating': frame['rating'].astype(object).where(frame['rating'].notna(), 'N/A'),
+            'date': frame['date'].dt.strftime('%Y-%m-%d').fillna('N/A'),
+            'text': frame['review_text'],
+            'sentiment': frame['sentiment_category']
+        }).to_dict('records')
+    
+    def get_memory_report(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-column dtype and deep memory usage of the review DataFrame."""
+        return memory_report(self.df)
     
     def is_data_loaded(self) -> bool:
         """Check if data has been loaded."""
@@ -200,6 +524,8 @@ class DataProcessor:
         return {
             'status': 'Data loaded',
             'total_reviews': len(self.df),
+            'duplicates_removed': self.duplicates_removed,
+            'memory_bytes': int(self.df.memory_usage(deep=True).sum()),
             'sources': list(self.df['source'].unique()),
             'date_range': {
                 'start': self.df['date'].min(),
@@ -0,0 +1,144 @@
+"""
+Data directory watcher for the Review Analytics Dashboard.
+Collects changed file paths from inotify (through watchdog, when it is
+installed) or from periodic directory scans, waits for a burst of writes
+to settle and then hands the changed paths to a callback, one batch at a
+time.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from config import DATA_WATCHER
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # optional - the directory scan below is the fallback
+    FileSystemEventHandler = object
+    Observer = None
+
+
+class _EventCollector(FileSystemEventHandler):
+    """Forwards watchdog file events to the watcher."""
+
+    def __init__(self, watcher: 'DataWatcher'):
+        self.watcher = watcher
+
+    def on_any_event(self, event) -> None:
+        if event.is_directory:
+            return
+        self.watcher.notify(event.src_path)
+        dest_path = getattr(event, 'dest_path', None)
+        if dest_path:
+            self.watcher.notify(dest_path)
+
+
+class DataWatcher:
+    """Watches a directory tree and reports changed files (relative paths) in debounced batches."""
+
+    def __init__(self, data_dir: str, on_change: Callable[[Set[str]], None],
+                 debounce: Optional[float] = None, max_delay: Optional[float] = None,
+                 poll_interval: Optional[float] = None, use_watchdog: Optional[bool] = None):
+        self.data_dir = os.path.abspath(data_dir)
+        self.on_change = on_change
+        self.debounce = DATA_WATCHER['debounce'] if debounce is None else debounce
+        self.max_delay = DATA_WATCHER['max_delay'] if max_delay is None else max_delay
+        self.poll_interval = DATA_WATCHER['poll_interval'] if poll_interval is None else poll_interval
+        if use_watchdog is None:
+            use_watchdog = DATA_WATCHER['use_watchdog']
+        self.use_watchdog = use_watchdog and Observer is not None
+        self._pending: Set[str] = set()
+        self._first_event = 0.0
+        self._last_event = 0.0
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._threads = []
+        self._observer = None
+        self._scan_state: Dict[str, Tuple[int, int]] = {}
+
+    @property
+    def mode(self) -> str:
+        return 'inotify (watchdog)' if self.use_watchdog else f'polling every {self.poll_interval:g}s'
+
+    def start(self) -> None:
+        if self.use_watchdog:
+            os.makedirs(self.data_dir, exist_ok=True)
+            self._observer = Observer()
+            self._observer.schedule(_EventCollector(self), self.data_dir, recursive=True)
+            self._observer.start()
+        else:
+            self._scan_state = self._scan()
+            self._spawn(self._poll)
+        self._spawn(self._dispatch)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+        for thread in self._threads:
+            thread.join()
+
+    def _spawn(self, target: Callable[[], None]) -> None:
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def notify(self, path: str) -> None:
+        """Record a changed path; the callback runs once writes have been quiet for `debounce` seconds."""
+        relpath = os.path.relpath(os.path.abspath(path), self.data_dir)
+        if relpath.startswith(os.pardir):
+            return
+        with self._condition:
+            now = time.monotonic()
+            if not self._pending:
+                self._first_event = now
+            self._pending.add(relpath)
+            self._last_event = now
+            self._condition.notify_all()
+
+    def _dispatch(self) -> None:
+        while not self._stopped.is_set():
+            with self._condition:
+                while not self._pending and not self._stopped.is_set():
+                    self._condition.wait()
+                # Wait for the burst to settle, but never hold changes back longer than max_delay
+                while not self._stopped.is_set():
+                    now = time.monotonic()
+                    deadline = min(self._last_event + self.debounce, self._first_event + self.max_delay)
+                    if now >= deadline:
+                        break
+                    self._condition.wait(deadline - now)
+                if self._stopped.is_set():
+                    return
+                changed, self._pending = self._pending, set()
+            try:
+                self.on_change(changed)
+            except Exception as e:
+                print(f"Error handling data changes: {e}")
+
+    def _poll(self) -> None:
+        while not self._stopped.wait(self.poll_interval):
+            state = self._scan()
+            previous, self._scan_state = self._scan_state, state
+            for relpath in set(state) | set(previous):
+                if state.get(relpath) != previous.get(relpath):
+                    self.notify(os.path.join(self.data_dir, relpath))
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """(mtime_ns, size) of every file under data_dir."""
+        state = {}
+        for root, _, files in os.walk(self.data_dir):
+            for filename in files:
+                filepath = os.path.join(root, filename)
+                try:
+                    stat = os.stat(filepath)
+                except OSError:
+                    continue
+                state[os.path.relpath(filepath, self.data_dir)] = (stat.st_mtime_ns, stat.st_size)
+        return state
@@ -0,0 +1,92 @@
+"""
+Review deduplication for the Review Analytics Dashboard.
+Exact duplicates (overlapping exports of the same reviews) are found with
+a hash index over (source, author, date, normalised text). An optional
+MinHash/LSH pass also catches edited reviews: same source and author,
+nearly the same text.
+"""
+
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import DEDUPLICATION
+from sentiment_cache import normalize_text
+
+# Mersenne prime for the MinHash permutations; keeps a * x + b inside uint64
+MINHASH_PRIME = (1 << 31) - 1
+
+
+def review_keys(df: pd.DataFrame) -> pd.Series:
+    """64-bit hash of (source, author, date, normalised text) for every review."""
+    fields = pd.DataFrame({
+        'source': df['source'].astype(str),
+        'author': df['author'].fillna('').astype(str),
+        'date': df['date'].dt.strftime('%Y-%m-%dT%H:%M:%S').fillna(''),
+        'text': df['review_text'].astype(str).map(normalize_text).str.casefold()
+    }, index=df.index)
+    return pd.util.hash_pandas_object(fields, index=False)
+
+
+class ReviewDeduplicator:
+    """Marks repeated reviews, keeping the first occurrence of each."""
+
+    def __init__(self, near_duplicates: Optional[bool] = None, threshold: Optional[float] = None,
+                 num_perm: Optional[int] = None, bands: Optional[int] = None,
+                 shingle_size: Optional[int] = None):
+        settings = DEDUPLICATION
+        self.near_duplicates = settings['near_duplicates'] if near_duplicates is None else near_duplicates
+        self.threshold = threshold or settings['threshold']
+        self.num_perm = num_perm or settings['num_perm']
+        self.bands = bands or settings['bands']
+        self.shingle_size = shingle_size or settings['shingle_size']
+        if self.num_perm % self.bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        rng = np.random.default_rng(1)
+        self._a = rng.integers(1, MINHASH_PRIME, self.num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, MINHASH_PRIME, self.num_perm, dtype=np.uint64)
+
+    def duplicate_mask(self, df: pd.DataFrame) -> pd.Series:
+        """True for every review that repeats an earlier one."""
+        if df.empty:
+            return pd.Series(False, index=df.index)
+        keys = df['review_key'] if 'review_key' in df else review_keys(df)
+        mask = keys.duplicated()
+        if self.near_duplicates:
+            mask |= self._near_duplicate_mask(df, ~mask)
+        return mask
+
+    def _near_duplicate_mask(self, df: pd.DataFrame, candidates: pd.Series) -> pd.Series:
+        # LSH buckets are scoped to (source, author), so each lookup only
+        # compares against that author's reviews and the pass stays linear
+        rows = self.num_perm // self.bands
+        buckets: Dict[Tuple, List[np.ndarray]] = {}
+        mask = pd.Series(False, index=df.index)
+        subset = df.loc[candidates, ['source', 'author', 'review_text']]
+        for index, source, author, text in subset.itertuples(name=None):
+            signature = self.signature(text)
+            owner = (source, author)
+            band_keys = [(owner, band, signature[band * rows:(band + 1) * rows].tobytes())
+                         for band in range(self.bands)]
+            if any(self._similar(signature, other)
+                   for key in band_keys for other in buckets.get(key, ())):
+                mask[index] = True
+                continue
+            for key in band_keys:
+                buckets.setdefault(key, []).append(signature)
+        return mask
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature over character shingles of the normalised text."""
+        text = normalize_text(text).casefold()
+        size = self.shingle_size
+        shingles = {text[i:i + size] for i in range(max(1, len(text) - size + 1))}
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) % MINHASH_PRIME for s in shingles),
+                             dtype=np.uint64, count=len(shingles))
+        return ((self._a[:, None] * hashes[None, :] + self._b[:, None]) % MINHASH_PRIME).min(axis=1)
+
+    def _similar(self, signature: np.ndarray, other: np.ndarray) -> bool:
+        # Share of equal MinHash slots estimates the Jaccard similarity
+        return float(np.mean(signature == other)) >= self.threshold
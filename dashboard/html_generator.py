@@ -4,7 +4,7 @@ Handles CSS styles and HTML template generation.
 """
 
 from typing import Dict, List, Any
-from config import COLORS
+from config import COLORS, REVIEWS_PAGE_SIZE
 from chart_generator import ChartGenerator
 
 
@@ -285,6 +285,40 @@ class HTMLGenerator:
             margin-top: 12px;
             font-size: 14px;
         }}
+        .review-filters {{
+            display: flex;
+            gap: 12px;
+            flex-wrap: wrap;
+            margin-bottom: 25px;
+        }}
+        .review-filters select, .review-filters input {{
+            padding: 10px 14px;
+            background: {self.colors['background_secondary']};
+            border: 1px solid {self.colors['border_primary']};
+            border-radius: 8px;
+            color: {self.colors['text_primary']};
+            font-size: 14px;
+        }}
+        .review-filters input {{ flex: 1; min-width: 220px; }}
+        .review-filters input[type="date"] {{ flex: 0 0 auto; min-width: 0; color-scheme: dark; }}
+        .review-filters label {{ display: flex; align-items: center; gap: 8px; color: {self.colors['text_secondary']}; font-size: 14px; }}
+        /* Virtual scrolling: only pages near the viewport are in the DOM */
+        .reviews-sizer {{ position: relative; }}
+        .reviews-page {{ position: absolute; left: 0; right: 0; }}
+        .search-status {{ color: {self.colors['text_secondary']}; margin-bottom: 20px; }}
+        .search-score {{ color: {self.colors['text_secondary']}; font-size: 12px; }}
+        .reviews-empty {{ color: {self.colors['text_secondary']}; padding: 20px 0; }}
+        .load-more-btn {{
+            margin: 10px 0 30px;
+            background: {self.colors['gradient_primary']};
+            color: white;
+            border: none;
+            padding: 12px 24px;
+            border-radius: 8px;
+            font-size: 14px;
+            cursor: pointer;
+        }}
+        .load-more-btn:hover {{ background: {self.colors['gradient_hover']}; }}
         
         .refresh-btn {{ 
             position: fixed; 
@@ -344,78 +378,384 @@ class HTMLGenerator:
         }}
         """
     
-    def generate_ratings_cards_html(self, ratings_by_source: Dict[str, Dict[str, Any]]) -> str:
-        """Generate HTML for rating cards."""
-        ratings_cards_html = ""
-        chart_id = 0
-        
-        for source, data in ratings_by_source.items():
-            chart_id += 1
-            ratings_cards_html += f"""
-            <div class="source-rating-card">
-                <h3>{source}</h3>
-                <div class="source-stats">
-                    <div class="source-stat">
-                        <div class="stat-value">{data['avg_rating']:.1f}/5</div>
-                        <div class="stat-label">Average Rating</div>
-                    </div>
-                    <div class="source-stat">
-                        <div class="stat-value">{data['total_ratings']}</div>
-                        <div class="stat-label">Total Ratings</div>
-                    </div>
-                </div>
-                <div class="rating-distribution">
-                    <h4>Rating Distribution</h4>
-                    <div id="ratingChart{chart_id}"></div>
-                </div>
-            </div>
-            """
+    def get_app_javascript(self) -> str:
+        """JavaScript that fetches each tab's data and renders it, with virtual scrolling for reviews."""
+        return """
+        // Tabs fetch their data the first time they are opened
+        var loadedTabs = {};
+        var tabLoaders = {
+            overview: loadOverview,
+            ratings: loadRatings,
+            reviews: loadReviews,
+            query: loadQuery
+        };
+        var jsonCache = {};
         
-        return ratings_cards_html
-    
-    def generate_reviews_html(self, reviews_by_source: Dict[str, List[Dict[str, Any]]]) -> str:
-        """Generate HTML for reviews section."""
-        reviews_html = ""
-        
-        for source, reviews in reviews_by_source.items():
-            reviews_list = ''.join([f"""
-            <div class="review-item">
-                <div class="review-header">
-                    <span class="review-author">{review['author']}</span>
-                    <span class="review-rating">{'★' * int(float(review['rating'])) if review['rating'] != 'N/A' and review['rating'] is not None else 'N/A'}</span>
-                    <span class="review-date">{review['date']}</span>
-                    <span class="sentiment-badge {review['sentiment'].lower()}">{review['sentiment']}</span>
-                </div>
-                <div class="review-text">{review['text']}</div>
-            </div>
-            """ for review in reviews])
-            
-            reviews_html += f"""
-            <div class="source-reviews">
-                <h3>{source} Reviews ({len(reviews)} total)</h3>
-                <div class="reviews-list">
-                    {reviews_list}
-                </div>
-            </div>
-            """
+        function activeTab() {
+            var tab = document.querySelector('.tab-content.active');
+            return tab ? tab.id : null;
+        }
         
-        return reviews_html
-    
-    def generate_complete_html(self, stats: Dict[str, Any], 
-                              ratings_by_source: Dict[str, Dict[str, Any]], 
-                              reviews_by_source: Dict[str, List[Dict[str, Any]]]) -> str:
-        """Generate the complete HTML dashboard."""
+        // Live updates: the server pushes fresh stats whenever the data directory changes
+        if (window.EventSource) {
+            new EventSource('/api/events').addEventListener('stats', function(event) {
+                var stats = JSON.parse(event.data);
+                if (!stats.total_reviews) {
+                    location.reload();
+                    return;
+                }
+                jsonCache = {'/api/stats': Promise.resolve(stats)};
+                // The open tab is refreshed now, the others when they are next opened
+                loadedTabs = {};
+                loadTab(activeTab());
+            });
+        }
+        
+        function loadTab(tabName) {
+            if (tabName === 'reviews') {
+                // Pages that arrived while the tab was hidden are measured and placed now
+                reviewLists.forEach(function(list) {
+                    list.layout();
+                    list.schedule();
+                });
+            }
+            if (loadedTabs[tabName] || !tabLoaders[tabName]) return;
+            loadedTabs[tabName] = true;
+            tabLoaders[tabName]().catch(function(error) {
+                loadedTabs[tabName] = false;
+                console.error(error);
+            });
+        }
+        
+        function fetchJSON(url) {
+            return fetch(url).then(function(response) {
+                if (!response.ok) throw new Error(url + ' returned HTTP ' + response.status);
+                return response.json();
+            });
+        }
+        
+        function fetchCached(url) {
+            if (!jsonCache[url]) {
+                jsonCache[url] = fetchJSON(url).catch(function(error) {
+                    delete jsonCache[url];
+                    throw error;
+                });
+            }
+            return jsonCache[url];
+        }
+        
+        function el(tag, className, text) {
+            var node = document.createElement(tag);
+            if (className) node.className = className;
+            if (text !== undefined && text !== null) node.textContent = text;
+            return node;
+        }
+        
+        function statCard(value, label, valueClass) {
+            var card = el('div', 'stat-card');
+            card.appendChild(el('div', 'stat-value ' + valueClass, value));
+            card.appendChild(el('div', 'stat-label', label));
+            return card;
+        }
+        
+        function renderStatCards(container, stats) {
+            var sentiment = stats.avg_sentiment;
+            var sentimentClass = sentiment > 0.1 ? 'positive' : sentiment < -0.1 ? 'negative' : 'neutral';
+            var sentimentLabel = sentiment > 0.1 ? 'Good' : sentiment < -0.1 ? 'Bad' : 'Neutral';
+            container.innerHTML = '';
+            container.appendChild(statCard(String(stats.total_reviews), 'Total Reviews', 'primary'));
+            container.appendChild(statCard(stats.avg_rating.toFixed(1) + '/5', 'Average Rating', 'primary'));
+            container.appendChild(statCard((sentiment >= 0 ? '+' : '') + sentiment.toFixed(2) + ' (' + sentimentLabel + ')',
+                                           'Sentiment Score', sentimentClass));
+            container.appendChild(statCard(String(Object.keys(stats.sources).length), 'Data Sources', 'primary'));
+        }
+        
+        function loadOverview() {
+            return fetchCached('/api/stats').then(function(stats) {
+                renderStatCards(document.getElementById('overviewStats'), stats);
+                renderSourceChart(stats.sources);
+            });
+        }
+        
+        function loadRatings() {
+            return Promise.all([fetchCached('/api/stats'), fetchCached('/api/ratings')]).then(function(results) {
+                renderStatCards(document.getElementById('ratingsStats'), results[0]);
+                var cards = document.getElementById('ratingCards');
+                var chartId = 0;
+                cards.innerHTML = '';
+                Object.keys(results[1]).forEach(function(source) {
+                    var data = results[1][source];
+                    chartId++;
+                    var card = el('div', 'source-rating-card');
+                    card.appendChild(el('h3', null, source));
+                    var sourceStats = el('div', 'source-stats');
+                    [[data.avg_rating.toFixed(1) + '/5', 'Average Rating'], [String(data.total_ratings), 'Total Ratings']]
+                        .forEach(function(stat) {
+                            var box = el('div', 'source-stat');
+                            box.appendChild(el('div', 'stat-value', stat[0]));
+                            box.appendChild(el('div', 'stat-label', stat[1]));
+                            sourceStats.appendChild(box);
+                        });
+                    card.appendChild(sourceStats);
+                    var distribution = el('div', 'rating-distribution');
+                    distribution.appendChild(el('h4', null, 'Rating Distribution'));
+                    distribution.appendChild(el('div')).id = 'ratingChart' + chartId;
+                    card.appendChild(distribution);
+                    cards.appendChild(card);
+                });
+                renderRatingCharts(results[1]);
+            });
+        }
+        
+        // Reviews tab: one virtually scrolled list per source, fed page by page from /api/reviews
+        var reviewLists = [];
+        var filterTimer = null;
+        
+        function loadReviews() {
+            return fetchCached('/api/stats').then(function(stats) {
+                var container = document.getElementById('reviewLists');
+                container.innerHTML = '';
+                reviewLists = Object.keys(stats.sources).map(function(source) {
+                    var section = el('div', 'source-reviews');
+                    var title = el('h3', null, source + ' Reviews');
+                    var list = el('div', 'reviews-list');
+                    section.appendChild(title);
+                    section.appendChild(list);
+                    container.appendChild(section);
+                    return new ReviewList(list, source, title);
+                });
+                applyReviewFilters();
+            });
+        }
+        
+        function reviewFilters() {
+            var filters = {};
+            var sentiment = document.getElementById('filterSentiment').value;
+            var rating = document.getElementById('filterRating').value;
+            var text = document.getElementById('filterText').value.trim();
+            if (sentiment) filters.sentiment = sentiment;
+            if (rating) filters.rating = rating;
+            if (text) filters.q = text;
+            return filters;
+        }
+        
+        function applyReviewFilters() {
+            var filters = reviewFilters();
+            reviewLists.forEach(function(list) { list.reset(filters); });
+        }
+        
+        function scheduleReviewFilters() {
+            clearTimeout(filterTimer);
+            filterTimer = setTimeout(applyReviewFilters, 300);
+        }
+        
+        function reviewItem(review) {
+            var item = el('div', 'review-item');
+            var header = el('div', 'review-header');
+            var hasRating = review.rating !== 'N/A' && review.rating !== null;
+            header.appendChild(el('span', 'review-author', review.author));
+            header.appendChild(el('span', 'review-rating', hasRating ? '\u2605'.repeat(Math.floor(Number(review.rating))) : 'N/A'));
+            header.appendChild(el('span', 'review-date', review.date));
+            header.appendChild(el('span', 'sentiment-badge ' + String(review.sentiment).toLowerCase(), review.sentiment));
+            item.appendChild(header);
+            item.appendChild(el('div', 'review-text', review.text));
+            return item;
+        }
+        
+        // Query tab: BM25 (keyword) or embedding-similarity (natural language) results from /api/search, one page at a time
+        var searchState = {offset: 0, generation: 0};
         
-        # Prepare data for display
-        sentiment_class = 'positive' if stats['avg_sentiment'] > 0.1 else 'negative' if stats['avg_sentiment'] < -0.1 else 'neutral'
-        sentiment_label = 'Good' if stats['avg_sentiment'] > 0.1 else 'Bad' if stats['avg_sentiment'] < -0.1 else 'Neutral'
+        function loadQuery() {
+            return fetchCached('/api/stats').then(function(stats) {
+                var select = document.getElementById('searchSource');
+                var selected = select.value;
+                select.length = 1;
+                Object.keys(stats.sources).forEach(function(source) {
+                    select.appendChild(new Option(source, source));
+                });
+                select.value = selected in stats.sources ? selected : '';
+            });
+        }
         
-        source_data = stats['sources']
+        function runSearch(more) {
+            var query = document.getElementById('searchQuery').value.trim();
+            var results = document.getElementById('searchResults');
+            var status = document.getElementById('searchStatus');
+            var moreButton = document.getElementById('searchMore');
+            if (!more) {
+                searchState = {offset: 0, generation: searchState.generation + 1};
+                results.innerHTML = '';
+                moreButton.style.display = 'none';
+            }
+            if (!query) {
+                status.textContent = 'Type something to search for.';
+                return;
+            }
+            var params = new URLSearchParams({q: query, offset: searchState.offset, limit: REVIEW_PAGE_SIZE});
+            [['mode', 'searchMode'], ['source', 'searchSource'], ['sentiment', 'searchSentiment'], ['rating', 'searchRating']]
+                .forEach(function(filter) {
+                    var value = document.getElementById(filter[1]).value;
+                    if (value) params.set(filter[0], value);
+                });
+            var dateFrom = document.getElementById('searchFrom').value;
+            var dateTo = document.getElementById('searchTo').value;
+            if (dateFrom) params.set('from', dateFrom);
+            // The API's upper bound is inclusive, so the whole "to" day is covered
+            if (dateTo) params.set('to', dateTo + 'T23:59:59.999');
+            var scoreLabel = params.get('mode') === 'semantic' ? 'similarity ' : 'score ';
+            var generation = searchState.generation;
+            var started = performance.now();
+            fetchJSON('/api/search?' + params.toString()).then(function(result) {
+                if (generation !== searchState.generation) return;
+                result.reviews.forEach(function(review) {
+                    var item = reviewItem(review);
+                    item.querySelector('.review-header').appendChild(el('span', 'search-score', scoreLabel + review.score.toFixed(2)));
+                    results.appendChild(item);
+                });
+                searchState.offset += result.reviews.length;
+                status.textContent = result.total + ' matching reviews (' + Math.round(performance.now() - started) + ' ms)';
+                moreButton.style.display = searchState.offset < result.total ? '' : 'none';
+            }).catch(function(error) {
+                status.textContent = 'Search failed: ' + error.message;
+            });
+        }
         
-        # Generate sections
-        ratings_cards_html = self.generate_ratings_cards_html(ratings_by_source)
-        reviews_html = self.generate_reviews_html(reviews_by_source)
-        chart_js = self.chart_generator.generate_chart_javascript(ratings_by_source, source_data)
+        function ReviewList(container, source, title) {
+            var list = this;
+            this.container = container;
+            this.source = source;
+            this.title = title;
+            this.sizer = el('div', 'reviews-sizer');
+            container.appendChild(this.sizer);
+            this.generation = 0;
+            this.measuredRows = 0;
+            this.measuredHeight = 0;
+            this.scheduled = false;
+            container.addEventListener('scroll', function() { list.schedule(); });
+        }
+        
+        ReviewList.prototype.reset = function(filters) {
+            this.filters = filters;
+            this.generation++;
+            this.total = null;
+            this.heights = [];
+            this.offsets = [];
+            this.data = {};
+            this.pages = {};
+            this.requested = {};
+            this.sizer.innerHTML = '';
+            this.sizer.style.height = '0px';
+            this.container.scrollTop = 0;
+            this.loadPage(0);
+        };
+        
+        ReviewList.prototype.pageCount = function() {
+            return this.total ? Math.ceil(this.total / REVIEW_PAGE_SIZE) : 0;
+        };
+        
+        ReviewList.prototype.pageHeight = function(page) {
+            if (this.heights[page] !== undefined) return this.heights[page];
+            // Unmeasured pages are sized from the average row height seen so far
+            var rowHeight = this.measuredRows ? this.measuredHeight / this.measuredRows : 160;
+            return Math.min(REVIEW_PAGE_SIZE, this.total - page * REVIEW_PAGE_SIZE) * rowHeight;
+        };
+        
+        ReviewList.prototype.loadPage = function(page) {
+            if (this.requested[page]) return;
+            this.requested[page] = true;
+            var list = this;
+            var generation = this.generation;
+            var params = new URLSearchParams(this.filters);
+            params.set('source', this.source);
+            params.set('offset', page * REVIEW_PAGE_SIZE);
+            params.set('limit', REVIEW_PAGE_SIZE);
+            fetchJSON('/api/reviews?' + params.toString()).then(function(result) {
+                if (generation !== list.generation) return;
+                list.total = result.total;
+                list.title.textContent = list.source + ' Reviews (' + result.total + ' total)';
+                list.data[page] = result.reviews;
+                if (!result.total) {
+                    list.sizer.appendChild(el('div', 'reviews-empty', 'No reviews match these filters.'));
+                    list.sizer.style.height = 'auto';
+                    return;
+                }
+                list.renderPage(page);
+                list.layout();
+                list.schedule();
+            }).catch(function(error) {
+                list.requested[page] = false;
+                console.error(error);
+            });
+        };
+        
+        ReviewList.prototype.renderPage = function(page) {
+            var node = el('div', 'reviews-page');
+            this.data[page].forEach(function(review) { node.appendChild(reviewItem(review)); });
+            node.style.top = (this.offsets[page] || 0) + 'px';
+            this.sizer.appendChild(node);
+            this.pages[page] = node;
+        };
+        
+        ReviewList.prototype.measure = function() {
+            // A hidden tab has no layout (every height reads 0), so pages are measured once visible
+            if (this.sizer.offsetParent === null) return;
+            for (var page in this.pages) {
+                if (this.heights[page] !== undefined) continue;
+                var height = this.pages[page].offsetHeight;
+                this.heights[page] = height;
+                this.measuredRows += this.data[page].length;
+                this.measuredHeight += height;
+            }
+        };
+        
+        ReviewList.prototype.layout = function() {
+            this.measure();
+            var top = 0;
+            this.offsets = [];
+            for (var page = 0; page < this.pageCount(); page++) {
+                this.offsets.push(top);
+                if (this.pages[page]) this.pages[page].style.top = top + 'px';
+                top += this.pageHeight(page);
+            }
+            this.sizer.style.height = top + 'px';
+        };
+        
+        ReviewList.prototype.schedule = function() {
+            if (this.scheduled) return;
+            this.scheduled = true;
+            var list = this;
+            requestAnimationFrame(function() { list.update(); });
+        };
+        
+        ReviewList.prototype.update = function() {
+            this.scheduled = false;
+            if (!this.total) return;
+            var viewHeight = this.container.clientHeight || 600;
+            var from = this.container.scrollTop - viewHeight;
+            var to = this.container.scrollTop + 2 * viewHeight;
+            var rendered = false;
+            for (var page = 0; page < this.pageCount(); page++) {
+                var top = this.offsets[page];
+                var visible = top + this.pageHeight(page) >= from && top <= to;
+                if (visible && !this.pages[page]) {
+                    if (this.data[page]) {
+                        this.renderPage(page);
+                        rendered = true;
+                    } else {
+                        this.loadPage(page);
+                    }
+                } else if (!visible && this.pages[page]) {
+                    this.sizer.removeChild(this.pages[page]);
+                    delete this.pages[page];
+                }
+            }
+            if (rendered) this.layout();
+        };
+        """
+    
+    def generate_complete_html(self) -> str:
+        """Generate the dashboard page; its data is fetched per tab from the /api endpoints."""
+        chart_js = self.chart_generator.generate_chart_javascript()
         
         html_content = f"""<!DOCTYPE html>
 <html lang="en">
@@ -447,24 +787,7 @@ class HTMLGenerator:
         
         <!-- Overview Tab -->
         <div id="overview" class="tab-content active">
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="stat-value primary">{stats['total_reviews']}</div>
-                    <div class="stat-label">Total Reviews</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value primary">{stats['avg_rating']:.1f}/5</div>
-                    <div class="stat-label">Average Rating</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value {sentiment_class}">{stats['avg_sentiment']:+.2f} ({sentiment_label})</div>
-                    <div class="stat-label">Sentiment Score</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value primary">{len(source_data)}</div>
-                    <div class="stat-label">Data Sources</div>
-                </div>
-            </div>
+            <div class="stats-grid" id="overviewStats"></div>
             
             <div class="chart-box">
                 <h3>Platforms</h3>
@@ -474,31 +797,31 @@ class HTMLGenerator:
         
         <!-- Ratings Tab -->
         <div id="ratings" class="tab-content">
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="stat-value primary">{stats['total_reviews']}</div>
-                    <div class="stat-label">Total Reviews</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value primary">{stats['avg_rating']:.1f}/5</div>
-                    <div class="stat-label">Average Rating</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value {sentiment_class}">{stats['avg_sentiment']:+.2f} ({sentiment_label})</div>
-                    <div class="stat-label">Sentiment Score</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-value primary">{len(source_data)}</div>
-                    <div class="stat-label">Data Sources</div>
-                </div>
-            </div>
+            <div class="stats-grid" id="ratingsStats"></div>
             
-            {ratings_cards_html}
+            <div id="ratingCards"></div>
         </div>
         
         <!-- Reviews Tab -->
         <div id="reviews" class="tab-content">
-            {reviews_html}
+            <div class="review-filters">
+                <select id="filterSentiment" onchange="applyReviewFilters()">
+                    <option value="">All sentiments</option>
+                    <option value="Positive">Positive</option>
+                    <option value="Neutral">Neutral</option>
+                    <option value="Negative">Negative</option>
+                </select>
+                <select id="filterRating" onchange="applyReviewFilters()">
+                    <option value="">All ratings</option>
+                    <option value="5">5 stars</option>
+                    <option value="4">4 stars</option>
+                    <option value="3">3 stars</option>
+                    <option value="2">2 stars</option>
+                    <option value="1">1 star</option>
+                </select>
+                <input type="search" id="filterText" placeholder="Filter reviews by text" oninput="scheduleReviewFilters()">
+            </div>
+            <div id="reviewLists"></div>
         </div>
         
         <!-- Analysis & Insights Tab -->
@@ -526,23 +849,49 @@ class HTMLGenerator:
         <!-- Query Tab -->
         <div id="query" class="tab-content">
             <div style="padding: 40px 20px;">
-                <h2 style="color: #3B82F6; margin-bottom: 30px; text-align: center;">Work in progress...</h2>
+                <h2 style="color: #3B82F6; margin-bottom: 30px; text-align: center;">Search Reviews</h2>
                 <div style="max-width: 800px; margin: 0 auto;">
                     <div style="background: #1A1F2E; border: 1px solid #334155; border-radius: 12px; padding: 30px; margin-bottom: 30px;">
-                        <h3 style="color: #F8FAFC; margin-bottom: 20px;">Natural langauge queries</h3>
+                        <h3 style="color: #F8FAFC; margin-bottom: 20px;">Keyword and natural language queries</h3>
                         <div style="margin-bottom: 20px;">
-                            <input type="text" placeholder="Ask questions about your reviews (e.g., 'What are users saying about the UI?')" 
-                                   style="width: 100%; padding: 15px; background: #0B0E1A; border: 1px solid #475569; border-radius: 8px; color: #F8FAFC; font-size: 14px;" disabled>
+                            <input type="text" id="searchQuery" placeholder="Search your reviews or ask a question (e.g. 'What are users saying about the UI?')" 
+                                   onkeydown="if (event.key === 'Enter') runSearch(false)"
+                                   style="width: 100%; padding: 15px; background: #0B0E1A; border: 1px solid #475569; border-radius: 8px; color: #F8FAFC; font-size: 14px;">
+                        </div>
+                        <div class="review-filters">
+                            <select id="searchMode">
+                                <option value="keyword">Keyword search</option>
+                                <option value="semantic">Natural language</option>
+                            </select>
+                            <select id="searchSource">
+                                <option value="">All sources</option>
+                            </select>
+                            <select id="searchSentiment">
+                                <option value="">All sentiments</option>
+                                <option value="Positive">Positive</option>
+                                <option value="Neutral">Neutral</option>
+                                <option value="Negative">Negative</option>
+                            </select>
+                            <select id="searchRating">
+                                <option value="">All ratings</option>
+                                <option value="5">5 stars</option>
+                                <option value="4">4 stars</option>
+                                <option value="3">3 stars</option>
+                                <option value="2">2 stars</option>
+                                <option value="1">1 star</option>
+                            </select>
+                            <label>From <input type="date" id="searchFrom"></label>
+                            <label>To <input type="date" id="searchTo"></label>
                         </div>
-                        <button style="background: #3B82F6; color: white; border: none; padding: 12px 24px; border-radius: 8px; cursor: not-allowed; opacity: 0.6;" disabled>
+                        <button onclick="runSearch(false)" style="background: #3B82F6; color: white; border: none; padding: 12px 24px; border-radius: 8px; cursor: pointer;">
                             Search Reviews
                         </button>
                     </div>
                     
-                    <div style="text-align: center; padding: 40px 20px; color: #94A3B8;">
-                        <p style="font-size: 16px; line-height: 1.6;">
-                            Tab for natural language queries.
-                        </p>
+                    <div class="search-status" id="searchStatus"></div>
+                    <div id="searchResults"></div>
+                    <div style="text-align: center;">
+                        <button id="searchMore" class="load-more-btn" style="display: none;" onclick="runSearch(true)">Load more</button>
                     </div>
                 </div>
             </div>
@@ -624,9 +973,16 @@ class HTMLGenerator:
             
             // Add active class to clicked tab
             event.target.classList.add('active');
+            
+            loadTab(tabName);
         }}
         
+        var REVIEW_PAGE_SIZE = {REVIEWS_PAGE_SIZE};
+        {self.get_app_javascript()}
+        
         {chart_js}
+        
+        loadTab('overview');
     </script>
 </body>
 </html>"""
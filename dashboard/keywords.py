@@ -0,0 +1,154 @@
+"""
+Streaming keyword counting for the Review Analytics Dashboard.
+Tokenizes reviews one at a time into per-source, per-month counters that
+can be updated as reviews arrive or leave, instead of joining the whole
+corpus into one string. Very large corpora can swap the exact counters
+for a count-min sketch that only tracks the heaviest keywords.
+"""
+
+import hashlib
+import re
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import KEYWORD_COUNTING, STOP_WORDS
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+
+def tokenize(text: str) -> Iterator[str]:
+    """Lowercased words of a review, without stop words and words of two letters or less."""
+    for word in WORD_PATTERN.findall(str(text).lower()):
+        if len(word) > 2 and word not in STOP_WORDS:
+            yield word
+
+
+class SketchCounter:
+    """Count-min sketch with a bounded set of heavy-hitter candidates.
+
+    Counts are overestimates bounded by the sketch width; only the
+    `capacity` most frequent keywords are remembered by name.
+    """
+
+    def __init__(self, width: Optional[int] = None, depth: Optional[int] = None,
+                 capacity: Optional[int] = None):
+        self.width = width or KEYWORD_COUNTING['sketch_width']
+        self.depth = depth or KEYWORD_COUNTING['sketch_depth']
+        self.capacity = capacity or KEYWORD_COUNTING['sketch_capacity']
+        self.table = np.zeros((self.depth, self.width), dtype=np.int32)
+        self._rows = np.arange(self.depth)
+        self.candidates: Dict[str, int] = {}
+
+    def _columns(self, word: str) -> List[int]:
+        # Double hashing: row i uses h1 + i * h2, independent enough for count-min
+        digest = hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest()
+        h1 = int.from_bytes(digest[:4], 'little')
+        h2 = int.from_bytes(digest[4:], 'little') | 1
+        return [(h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def estimate(self, word: str) -> int:
+        return int(self.table[self._rows, self._columns(word)].min())
+
+    def update(self, words: Iterable[str], sign: int = 1) -> None:
+        rows = self._rows
+        for word, count in Counter(words).items():
+            columns = self._columns(word)
+            self.table[rows, columns] += sign * count
+            estimate = int(self.table[rows, columns].min())
+            if estimate <= 0:
+                self.candidates.pop(word, None)
+            elif word in self.candidates or sign > 0:
+                self.candidates[word] = estimate
+        # Prune lazily so the candidate set stays O(capacity)
+        if len(self.candidates) > 2 * self.capacity:
+            self.candidates = dict(Counter(self.candidates).most_common(self.capacity))
+
+    def subtract(self, words: Iterable[str]) -> None:
+        self.update(words, sign=-1)
+
+    def merge(self, other: 'SketchCounter') -> None:
+        self.table += other.table
+        for word in set(self.candidates) | set(other.candidates):
+            self.candidates[word] = self.estimate(word)
+
+    def most_common(self, n: int) -> List[Tuple[str, int]]:
+        estimates = {word: self.estimate(word) for word in self.candidates}
+        return Counter({word: count for word, count in estimates.items() if count > 0}).most_common(n)
+
+    def __bool__(self) -> bool:
+        return bool(self.table.any())
+
+
+class KeywordIndex:
+    """Keyword counts for the whole corpus and per (source, month) window."""
+
+    def __init__(self, use_sketch: Optional[bool] = None):
+        self.use_sketch = KEYWORD_COUNTING['use_sketch'] if use_sketch is None else use_sketch
+        self.total = self._new_counter()
+        self.windows: Dict[Tuple[str, Optional[str]], object] = {}
+
+    def _new_counter(self, window: bool = False):
+        if not self.use_sketch:
+            return Counter()
+        # One (source, month) holds a small slice of the corpus, so its sketch can be narrower
+        return SketchCounter(width=KEYWORD_COUNTING['window_sketch_width'] if window else None)
+
+    def clear(self) -> None:
+        self.total = self._new_counter()
+        self.windows = {}
+
+    def add(self, df: pd.DataFrame) -> None:
+        """Count the keywords of newly arrived reviews."""
+        for window, words in self._review_words(df):
+            counter = self.windows.get(window)
+            if counter is None:
+                counter = self.windows[window] = self._new_counter(window=True)
+            counter.update(words)
+            self.total.update(words)
+
+    def remove(self, df: pd.DataFrame) -> None:
+        """Take back the keywords of reviews that left the corpus."""
+        for window, words in self._review_words(df):
+            counter = self.windows.get(window)
+            if counter is None:
+                continue
+            self._subtract(counter, words)
+            self._subtract(self.total, words)
+            if not counter:
+                del self.windows[window]
+
+    @staticmethod
+    def _subtract(counter, words: List[str]) -> None:
+        counter.subtract(words)
+        if isinstance(counter, Counter):
+            for word in set(words):
+                if counter[word] <= 0:
+                    del counter[word]
+
+    @staticmethod
+    def _review_words(df: pd.DataFrame) -> Iterator[Tuple[Tuple[str, Optional[str]], List[str]]]:
+        if df.empty:
+            return
+        months = df['date'].dt.strftime('%Y-%m').astype(object).where(df['date'].notna(), None)
+        for source, month, text in zip(df['source'].astype(object), months, df['review_text']):
+            yield (source, month), list(tokenize(text))
+
+    def most_common(self, n: int = 20, source: Optional[str] = None,
+                    window: Optional[str] = None) -> List[Tuple[str, int]]:
+        """Top keywords overall, or restricted to a source and/or a 'YYYY-MM' month."""
+        if source is None and window is None:
+            return self.total.most_common(n)
+        selected = self._new_counter(window=True)
+        for (counter_source, month), counter in self.windows.items():
+            if (source is None or counter_source == source) and (window is None or month == window):
+                if self.use_sketch:
+                    selected.merge(counter)
+                else:
+                    selected.update(counter)
+        return selected.most_common(n)
+
+    def window_names(self) -> List[str]:
+        return sorted({month for _, month in self.windows if month is not None})
@@ -0,0 +1,237 @@
+"""
+Columnar review store for the Review Analytics Dashboard.
+Keeps reviews as typed Parquet files partitioned by source and month
+(store/<source>/<YYYY-MM>.parquet) with sentiment precomputed, and
+backfills the store from the JSON/JSONL/CSV exports the scrapers write.
+Backfilled exports are listed in store/backfill.json, so exports added
+afterwards are still picked up by the dashboard until the next backfill.
+
+    python review_store.py backfill [--data-dir DIR] [EXPORT ...]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Any, Dict, Iterable, List
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from config import DEFAULT_DATA_DIR, REVIEW_STORE_DIR
+from review_stream import INGEST_BATCH_SIZE, READ_CHUNK_SIZE, iter_batches
+
+STORE_COLUMNS = ['source', 'author', 'rating', 'review_text', 'date', 'helpful',
+                 'country', 'version', 'sentiment_score', 'sentiment_category']
+
+STORE_SCHEMA = pa.schema([
+    ('source', pa.string()),
+    ('author', pa.string()),
+    ('rating', pa.int8()),
+    ('review_text', pa.string()),
+    ('date', pa.timestamp('us', tz='UTC')),
+    ('helpful', pa.int32()),
+    ('country', pa.string()),
+    ('version', pa.string()),
+    ('sentiment_score', pa.float64()),
+    ('sentiment_category', pa.string())
+])
+
+UNDATED_PARTITION = 'undated'
+MANIFEST_FILE = 'backfill.json'
+
+
+def file_digest(filepath: str) -> str:
+    digest = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def export_signature(filepath: str) -> Dict[str, Any]:
+    stat = os.stat(filepath)
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha1': file_digest(filepath)}
+
+
+def standardize_reviews(records: Iterable[Dict[str, Any]], source: str,
+                        batch_size: int = INGEST_BATCH_SIZE) -> pd.DataFrame:
+    """Map export records onto the dashboard's review columns and drop empty reviews.
+
+    Records are consumed in bounded batches, so a streamed export is never
+    held as one list of dicts.
+    """
+    frames = [_standardize_batch(batch, source) for batch in iter_batches(records, batch_size)]
+    if not frames:
+        return _standardize_batch([], source)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _standardize_batch(records: List[Dict[str, Any]], source: str) -> pd.DataFrame:
+    frame = pd.DataFrame({
+        'source': source,
+        'author': [review.get('author', 'Anonymous') for review in records],
+        'rating': [review.get('rating') for review in records],
+        'review_text': [review.get('review', '') for review in records],
+        'date': [review.get('date') for review in records],
+        'helpful': [review.get('helpful', 0) for review in records],
+        'country': [review.get('country') for review in records],
+        'version': [review.get('version') for review in records]
+    }, columns=STORE_COLUMNS[:8])
+    frame = frame[frame['review_text'].astype(str).str.strip() != ''].reset_index(drop=True)
+    # Parsed per export (in UTC) so one source's offset format cannot turn another's dates into NaT
+    frame['date'] = pd.to_datetime(frame['date'], errors='coerce', utc=True)
+    return frame
+
+
+def source_slug(source: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', source.lower()).strip('-') or 'unknown'
+
+
+class ReviewStore:
+    """Parquet files partitioned by source and month under one directory."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def files(self) -> List[str]:
+        """Partition files relative to the store directory, in a stable order."""
+        if not os.path.isdir(self.path):
+            return []
+        found = []
+        for root, _, filenames in os.walk(self.path):
+            for filename in filenames:
+                if filename.endswith('.parquet'):
+                    found.append(os.path.relpath(os.path.join(root, filename), self.path))
+        return sorted(found)
+
+    def read_file(self, relpath: str) -> pd.DataFrame:
+        """Read one partition, memory-mapped."""
+        table = pq.read_table(os.path.join(self.path, relpath), memory_map=True)
+        return table.to_pandas(ignore_metadata=True)
+
+    def read(self) -> pd.DataFrame:
+        frames = [self.read_file(relpath) for relpath in self.files()]
+        if not frames:
+            return pd.DataFrame(columns=STORE_COLUMNS)
+        return pd.concat(frames, ignore_index=True)
+
+    def manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Exports the store was last backfilled from: path relative to the data dir -> signature."""
+        try:
+            with open(os.path.join(self.path, MANIFEST_FILE), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def write_manifest(self, manifest: Dict[str, Dict[str, Any]]) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        target = os.path.join(self.path, MANIFEST_FILE)
+        temp = target + '.tmp'
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(temp, target)
+
+    def pending_exports(self, data_dir: str, filenames: List[str]) -> List[str]:
+        """The exports among `filenames` that are not in the store: never backfilled, or changed since."""
+        manifest = self.manifest()
+        pending = []
+        for filename in filenames:
+            entry = manifest.get(filename)
+            if entry is not None:
+                try:
+                    stat = os.stat(os.path.join(data_dir, filename))
+                    if (stat.st_mtime_ns, stat.st_size) == (entry['mtime_ns'], entry['size']):
+                        continue
+                    # Touched or copied but identical content is still backfilled
+                    if stat.st_size == entry['size'] and \
+                            file_digest(os.path.join(data_dir, filename)) == entry['sha1']:
+                        continue
+                except (OSError, KeyError, TypeError):
+                    pass
+            pending.append(filename)
+        return pending
+
+    def write(self, df: pd.DataFrame, replace: bool = False) -> List[str]:
+        """Write reviews as partition files; overwrites the partitions they fall into.
+
+        With replace=True every other existing partition is removed as well,
+        so the store holds exactly the given reviews.
+        """
+        df = self._typed(df)
+        months = df['date'].dt.strftime('%Y-%m').fillna(UNDATED_PARTITION)
+        written = []
+        for (source, month), part in df.groupby([df['source'], months], sort=True):
+            relpath = os.path.join(source_slug(source), f"{month}.parquet")
+            target = os.path.join(self.path, relpath)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            table = pa.Table.from_pandas(part, schema=STORE_SCHEMA, preserve_index=False)
+            # Readers never see a half-written partition
+            temp = target + '.tmp'
+            pq.write_table(table, temp, compression='zstd')
+            os.replace(temp, target)
+            written.append(relpath)
+        if replace:
+            for relpath in set(self.files()) - set(written):
+                os.remove(os.path.join(self.path, relpath))
+        return written
+
+    @staticmethod
+    def _typed(df: pd.DataFrame) -> pd.DataFrame:
+        df = df.reindex(columns=STORE_COLUMNS).copy()
+        df['rating'] = pd.to_numeric(df['rating'], errors='coerce')
+        df['helpful'] = pd.to_numeric(df['helpful'], errors='coerce').fillna(0).astype('int32')
+        for column in ('author', 'country', 'version'):
+            df[column] = df[column].astype('string').replace('', pd.NA)
+        return df
+
+
+def backfill(data_dir: str, exports: List[str]) -> None:
+    from data_processor import DataProcessor
+
+    if not exports:
+        exports = sorted(os.path.join(data_dir, filename) for filename in os.listdir(data_dir)
+                         if filename.endswith(('.json', '.jsonl')))
+    if not exports:
+        print(f"No exports found in {data_dir}")
+        raise SystemExit(1)
+
+    started = time.perf_counter()
+    processor = DataProcessor(data_dir)
+    df, read = processor.read_exports(exports)
+    skipped = [path for path in exports if path not in read]
+    if not read:
+        print(f"None of the {len(exports)} export(s) could be read; the store was left unchanged")
+        raise SystemExit(1)
+    store = ReviewStore(os.path.join(data_dir, REVIEW_STORE_DIR))
+    written = store.write(df, replace=True)
+    # Skipped exports stay out of the manifest, so the dashboard keeps loading them directly
+    store.write_manifest({os.path.relpath(path, data_dir): export_signature(path) for path in read})
+    print(f"Wrote {len(df)} reviews from {len(read)} export(s) into {len(written)} partition(s) "
+          f"under {store.path} in {time.perf_counter() - started:.2f}s")
+    if skipped:
+        print(f"Skipped {len(skipped)} export(s) that failed to parse: {', '.join(skipped)}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Columnar Parquet review store for the dashboard.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    backfill_parser = subparsers.add_parser('backfill', help="rebuild the store from JSON/JSONL/CSV exports")
+    backfill_parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR)
+    backfill_parser.add_argument('exports', nargs='*',
+                                 help="export files (default: every .json/.jsonl file in the data dir)")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    if args.command == 'backfill':
+        backfill(args.data_dir, args.exports)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Streaming export reader for the Review Analytics Dashboard.
+Yields review records one at a time from JSON array, JSONL and CSV
+exports, so large exports are never materialised as one Python list.
+JSON arrays are parsed with ijson when it is installed and with an
+incremental stdlib decoder otherwise.
+"""
+
+import csv
+import json
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
+
+try:
+    import ijson
+except ImportError:  # optional - the stdlib decoder below is the fallback
+    ijson = None
+
+READ_CHUNK_SIZE = 1 << 16
+INGEST_BATCH_SIZE = 10000
+
+# CSV export headers -> JSON export field names
+CSV_FIELDS = {
+    'date': 'date',
+    'user name': 'author',
+    'author': 'author',
+    'score': 'rating',
+    'rating': 'rating',
+    'title': 'title',
+    'review text': 'review',
+    'review': 'review',
+    'version': 'version',
+    'helpful count': 'helpful',
+    'helpful': 'helpful',
+    'country': 'country'
+}
+
+WHITESPACE = ' \t\r\n'
+
+
+def iter_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the review dicts of a JSON array, JSONL or CSV export, one at a time."""
+    if path.lower().endswith('.csv'):
+        yield from _iter_csv(path)
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        first = _first_char(f)
+    if first == '[':
+        yield from _iter_json_array(path)
+    elif first:
+        yield from _iter_jsonl(path)
+
+
+def iter_batches(records: Iterable[Any], batch_size: int = INGEST_BATCH_SIZE) -> Iterator[List[Any]]:
+    """Group an iterable into lists of at most batch_size items."""
+    records = iter(records)
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _first_char(f) -> str:
+    while True:
+        chunk = f.read(READ_CHUNK_SIZE)
+        if not chunk:
+            return ''
+        stripped = chunk.lstrip(WHITESPACE + '\ufeff')
+        if stripped:
+            return stripped[0]
+
+
+def _iter_csv(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            yield {CSV_FIELDS[key.strip().lower()]: value for key, value in row.items()
+                   if key and key.strip().lower() in CSV_FIELDS}
+
+
+def _iter_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _iter_json_array(path: str) -> Iterator[Any]:
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+        return
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        yield from _decode_array(f)
+
+
+def _decode_array(f) -> Iterator[Any]:
+    """Decode the elements of a top-level JSON array from a text stream, one at a time."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    eof = False
+    opened = False
+
+    def refill():
+        nonlocal buffer, position, eof
+        chunk = f.read(READ_CHUNK_SIZE)
+        buffer = buffer[position:] + chunk
+        position = 0
+        eof = not chunk
+
+    while True:
+        # Skip whitespace (and the separator between elements)
+        while True:
+            while position < len(buffer) and buffer[position] in WHITESPACE + (',' if opened else ''):
+                position += 1
+            if position < len(buffer) or eof:
+                break
+            refill()
+        if position >= len(buffer):
+            raise ValueError("Unexpected end of file inside a JSON array")
+
+        if not opened:
+            if buffer[position] != '[':
+                raise ValueError("Expected a JSON array")
+            opened = True
+            position += 1
+            continue
+        if buffer[position] == ']':
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            refill()
+            continue
+        # A bare number could still continue in the next chunk
+        if end == len(buffer) and not eof:
+            refill()
+            continue
+        position = end
+        yield item
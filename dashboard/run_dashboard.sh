@@ -8,7 +8,12 @@ if [ ! -d "dashboard_env" ]; then
     echo "Creating virtual environment..."
     python3 -m venv dashboard_env
     echo "Installing dependencies..."
-    dashboard_env/bin/pip install pandas numpy textblob
+    dashboard_env/bin/pip install pandas numpy textblob pyarrow
+    # scikit-learn: natural-language search on the Query tab (returns 503 without it)
+    # ijson: streaming JSON reader (stdlib fallback otherwise)
+    # watchdog: inotify data watcher (directory polling otherwise)
+    # brotli is also optional and not installed here; gzip is always served
+    dashboard_env/bin/pip install scikit-learn ijson watchdog
 fi
 
 # Run the dashboard app
@@ -0,0 +1,347 @@
+"""
+Full-text search for the Review Analytics Dashboard.
+An inverted index over the review text, tokenized the same way as the
+keyword counts, ranked with BM25 and filtered by source, sentiment,
+rating and date. It is updated with only the reviews that enter or leave
+the data and persisted to disk, so a restart does not re-tokenize the
+whole corpus.
+"""
+
+import hashlib
+import os
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import SEARCH_INDEX, STOP_WORDS
+from keywords import tokenize
+
+# Bump when the file layout changes; the tokenizer fingerprint covers STOP_WORDS
+INDEX_VERSION = 1
+NO_DATE = np.iinfo(np.int64).min
+# Per-review arrays, all indexed by document number
+DOC_ARRAYS = ['keys', 'alive', 'lengths', 'sources', 'sentiments', 'ratings', 'dates']
+
+
+def _tokenizer_fingerprint() -> str:
+    return hashlib.sha1(f"{INDEX_VERSION}:{' '.join(sorted(STOP_WORDS))}".encode('utf-8')).hexdigest()
+
+
+def _timestamp_value(value: str) -> int:
+    """A date filter as UTC nanoseconds since the epoch."""
+    timestamp = pd.Timestamp(value)
+    timestamp = timestamp.tz_localize('UTC') if timestamp.tzinfo is None else timestamp.tz_convert('UTC')
+    return timestamp.value
+
+
+class SearchIndex:
+    """BM25-ranked inverted index over review text, keyed by review_key."""
+
+    def __init__(self, index_file: Optional[str] = SEARCH_INDEX['index_file'],
+                 k1: Optional[float] = None, b: Optional[float] = None):
+        self.index_file = index_file
+        self.k1 = SEARCH_INDEX['k1'] if k1 is None else k1
+        self.b = SEARCH_INDEX['b'] if b is None else b
+        self._lock = threading.RLock()
+        self.clear()
+        if index_file and os.path.exists(index_file):
+            self.load()
+
+    def clear(self) -> None:
+        with self._lock:
+            # term -> (document numbers, term frequencies), both sorted by document number
+            self.postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+            self.keys = np.empty(0, dtype=np.uint64)
+            self.alive = np.empty(0, dtype=bool)
+            self.lengths = np.empty(0, dtype=np.int32)
+            self.sources = np.empty(0, dtype=np.int16)
+            self.sentiments = np.empty(0, dtype=np.int16)
+            self.ratings = np.empty(0, dtype=np.int8)
+            self.dates = np.empty(0, dtype=np.int64)
+            self.source_names: List[str] = []
+            self.sentiment_names: List[str] = []
+            self._documents: Dict[int, int] = {}
+            self.count = 0
+            self.total_length = 0
+            self.dirty = True
+
+    def __len__(self) -> int:
+        return self.count
+
+    def sync(self, df: pd.DataFrame) -> None:
+        """Bring the index (e.g. one loaded from disk) in line with the given reviews."""
+        with self._lock:
+            if df.empty:
+                if self.count:
+                    self.clear()
+                return
+            current = set(df['review_key'].tolist())
+            stale = [document for key, document in self._documents.items() if key not in current]
+            if stale:
+                # The stale reviews' text is gone, so every posting list is checked
+                self._remove_documents(np.array(stale, dtype=np.int32), list(self.postings))
+            self.add(df)
+            self.refresh(df)
+
+    def add(self, df: pd.DataFrame) -> None:
+        """Index newly arrived reviews; reviews already in the index are skipped."""
+        if df.empty:
+            return
+        with self._lock:
+            new = ~df['review_key'].isin(list(self._documents)).to_numpy()
+            df = df[new]
+            if df.empty:
+                return
+            first = len(self.keys)
+            term_documents = defaultdict(list)
+            term_frequencies = defaultdict(list)
+            lengths = np.empty(len(df), dtype=np.int32)
+            for offset, text in enumerate(df['review_text']):
+                counts = Counter(tokenize(text))
+                lengths[offset] = sum(counts.values())
+                for term, frequency in counts.items():
+                    term_documents[term].append(first + offset)
+                    term_frequencies[term].append(frequency)
+            for term, documents in term_documents.items():
+                ids = np.array(documents, dtype=np.int32)
+                frequencies = np.array(term_frequencies[term], dtype=np.int32)
+                if term in self.postings:
+                    old_ids, old_frequencies = self.postings[term]
+                    ids = np.concatenate([old_ids, ids])
+                    frequencies = np.concatenate([old_frequencies, frequencies])
+                self.postings[term] = (ids, frequencies)
+
+            keys = df['review_key'].to_numpy(dtype=np.uint64)
+            self.keys = np.concatenate([self.keys, keys])
+            self.alive = np.concatenate([self.alive, np.ones(len(df), dtype=bool)])
+            self.lengths = np.concatenate([self.lengths, lengths])
+            self.sources = np.concatenate([self.sources, self._encode(df['source'], self.source_names)])
+            self.sentiments = np.concatenate([self.sentiments,
+                                              self._encode(df['sentiment_category'], self.sentiment_names)])
+            self.ratings = np.concatenate([self.ratings, self._rating_values(df['rating'])])
+            self.dates = np.concatenate([self.dates, self._date_values(df['date'])])
+            self._documents.update(zip(keys.tolist(), range(first, first + len(df))))
+            self.count += len(df)
+            self.total_length += int(lengths.sum())
+            self.dirty = True
+
+    def refresh(self, df: pd.DataFrame) -> None:
+        """Update the filter fields of indexed reviews from `df`.
+
+        Source, sentiment, rating and date are not part of review_key, so a review
+        can be re-scored or re-rated without leaving and re-entering the index.
+        """
+        if df.empty:
+            return
+        with self._lock:
+            documents = np.fromiter((self._documents.get(key, -1) for key in df['review_key'].tolist()),
+                                    dtype=np.int64, count=len(df))
+            found = documents >= 0
+            if not found.any():
+                return
+            documents, df = documents[found], df[found]
+            fields = {
+                'sources': self._encode(df['source'], self.source_names),
+                'sentiments': self._encode(df['sentiment_category'], self.sentiment_names),
+                'ratings': self._rating_values(df['rating']),
+                'dates': self._date_values(df['date'])
+            }
+            for name, values in fields.items():
+                current = getattr(self, name)
+                if not np.array_equal(current[documents], values):
+                    current[documents] = values
+                    self.dirty = True
+
+    def remove(self, df: pd.DataFrame) -> None:
+        """Drop reviews that left the data; only the posting lists of their words are touched."""
+        if df.empty:
+            return
+        with self._lock:
+            documents = [self._documents[key] for key in df['review_key'].tolist() if key in self._documents]
+            if not documents:
+                return
+            terms = set()
+            for text in df['review_text']:
+                terms.update(tokenize(text))
+            self._remove_documents(np.array(documents, dtype=np.int32), terms)
+
+    def _remove_documents(self, documents: np.ndarray, terms) -> None:
+        for term in terms:
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            keep = ~np.isin(posting[0], documents)
+            if not keep.any():
+                del self.postings[term]
+            elif not keep.all():
+                self.postings[term] = (posting[0][keep], posting[1][keep])
+        self.alive[documents] = False
+        for key in self.keys[documents].tolist():
+            del self._documents[key]
+        self.count -= len(documents)
+        self.total_length -= int(self.lengths[documents].sum())
+        self.dirty = True
+        # Removed reviews leave holes in the per-review arrays; close them once they dominate
+        if len(self.keys) - self.count > max(self.count, 1000):
+            self._compact()
+
+    def _compact(self) -> None:
+        keep = self.alive
+        renumber = (np.cumsum(keep) - 1).astype(np.int32)
+        self.postings = {term: (renumber[ids], frequencies) for term, (ids, frequencies) in self.postings.items()}
+        for name in DOC_ARRAYS:
+            setattr(self, name, getattr(self, name)[keep])
+        self._documents = dict(zip(self.keys.tolist(), range(len(self.keys))))
+
+    @staticmethod
+    def _encode(values: pd.Series, names: List[str]) -> np.ndarray:
+        """Small integer codes for a text column, extending `names` with unseen values."""
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Encode each category once and map the category codes through it
+            category_codes = SearchIndex._encode(pd.Series(values.cat.categories), names)
+            codes = values.cat.codes.to_numpy()
+            return np.append(category_codes, np.int16(-1))[codes].astype(np.int16)
+        lookup = {name: code for code, name in enumerate(names)}
+        codes = []
+        for value in values.astype(object):
+            if pd.isna(value):
+                codes.append(-1)
+                continue
+            if value not in lookup:
+                lookup[value] = len(names)
+                names.append(value)
+            codes.append(lookup[value])
+        return np.array(codes, dtype=np.int16)
+
+    @staticmethod
+    def _rating_values(ratings: pd.Series) -> np.ndarray:
+        """Star ratings as int8; missing ratings become 0."""
+        return pd.to_numeric(ratings, errors='coerce').fillna(0).to_numpy(dtype=np.int8)
+
+    @staticmethod
+    def _date_values(dates: pd.Series) -> np.ndarray:
+        """UTC nanoseconds since the epoch; missing dates become NO_DATE."""
+        dates = pd.to_datetime(dates, utc=True).dt.tz_localize(None).astype('datetime64[ns]')
+        return dates.to_numpy().view(np.int64)
+
+    def search(self, query: str, source: Optional[str] = None, sentiment: Optional[str] = None,
+               rating: Optional[int] = None, date_from: Optional[str] = None, date_to: Optional[str] = None,
+               offset: int = 0, limit: int = 20) -> Tuple[int, List[Tuple[int, float]]]:
+        """(number of matches, [(review_key, score), ...]) for one page of BM25-ranked results."""
+        terms = set(tokenize(query))
+        low = _timestamp_value(date_from) if date_from else None
+        high = _timestamp_value(date_to) if date_to else None
+        with self._lock:
+            postings = [self.postings[term] for term in terms if term in self.postings]
+            if not postings or not self.count:
+                return 0, []
+            candidates = np.unique(np.concatenate([ids for ids, _ in postings]))
+            mask = np.ones(len(candidates), dtype=bool)
+            if source:
+                mask &= self.sources[candidates] == self._code(source, self.source_names)
+            if sentiment:
+                mask &= self.sentiments[candidates] == self._code(sentiment, self.sentiment_names)
+            if rating is not None:
+                mask &= self.ratings[candidates] == rating
+            if low is not None or high is not None:
+                dates = self.dates[candidates]
+                mask &= dates != NO_DATE
+                if low is not None:
+                    mask &= dates >= low
+                if high is not None:
+                    mask &= dates <= high
+            candidates = candidates[mask]
+            if not len(candidates):
+                return 0, []
+
+            # BM25: idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / average length))
+            average_length = self.total_length / self.count
+            scores = np.zeros(len(candidates))
+            for ids, frequencies in postings:
+                idf = np.log(1 + (self.count - len(ids) + 0.5) / (len(ids) + 0.5))
+                positions = np.searchsorted(candidates, ids)
+                found = positions < len(candidates)
+                found[found] = candidates[positions[found]] == ids[found]
+                tf = frequencies[found].astype(np.float64)
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[ids[found]] / average_length)
+                scores[positions[found]] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+            total = len(candidates)
+            top = min(offset + limit, total)
+            if top == 0:
+                return total, []
+            best = np.argpartition(-scores, top - 1)[:top] if top < total else np.arange(total)
+            # Highest score first; ties keep index order so pages are stable
+            best = best[np.lexsort((best, -scores[best]))][offset:offset + limit]
+            return total, list(zip(self.keys[candidates[best]].tolist(), scores[best].tolist()))
+
+    @staticmethod
+    def _code(value: str, names: List[str]) -> int:
+        return names.index(value) if value in names else -2
+
+    def save(self) -> None:
+        """Write the index to `index_file` (atomically) if it changed since the last save."""
+        if not self.index_file or not self.dirty:
+            return
+        with self._lock:
+            if len(self.keys) > self.count:
+                self._compact()
+            terms = sorted(self.postings)
+            postings = [self.postings[term] for term in terms]
+            arrays = {name: getattr(self, name) for name in DOC_ARRAYS if name != 'alive'}
+            names = {'source_names': self.source_names, 'sentiment_names': self.sentiment_names}
+            self.dirty = False
+        counts = np.array([len(ids) for ids, _ in postings], dtype=np.int64)
+        os.makedirs(os.path.dirname(self.index_file) or '.', exist_ok=True)
+        tmp_path = f"{self.index_file}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(
+                    f,
+                    fingerprint=np.frombuffer(_tokenizer_fingerprint().encode('ascii'), dtype=np.uint8),
+                    # Tokens are \w+ runs and names come from filenames, so newlines can join them
+                    terms=np.frombuffer('\n'.join(terms).encode('utf-8'), dtype=np.uint8),
+                    offsets=np.concatenate([[0], np.cumsum(counts)]),
+                    ids=np.concatenate([ids for ids, _ in postings]) if postings else np.empty(0, np.int32),
+                    frequencies=(np.concatenate([frequencies for _, frequencies in postings])
+                                 if postings else np.empty(0, np.int32)),
+                    **{name: np.frombuffer('\n'.join(values).encode('utf-8'), dtype=np.uint8)
+                       for name, values in names.items()},
+                    **arrays
+                )
+            os.replace(tmp_path, self.index_file)
+        except OSError as e:
+            self.dirty = True
+            print(f"Could not save search index: {e}")
+
+    def load(self) -> None:
+        """Read the index saved by `save()`; a missing, stale or unreadable file leaves it empty."""
+        try:
+            with np.load(self.index_file) as data:
+                if data['fingerprint'].tobytes().decode('ascii') != _tokenizer_fingerprint():
+                    print("Search index was built with a different tokenizer, rebuilding")
+                    return
+                terms = data['terms'].tobytes().decode('utf-8').split('\n') if data['terms'].size else []
+                offsets, ids, frequencies = data['offsets'], data['ids'], data['frequencies']
+                arrays = {name: data[name] for name in DOC_ARRAYS if name != 'alive'}
+                names = {name: data[name].tobytes().decode('utf-8').split('\n') if data[name].size else []
+                         for name in ('source_names', 'sentiment_names')}
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Could not load search index: {e}")
+            return
+        with self._lock:
+            self.clear()
+            self.postings = {term: (ids[offsets[i]:offsets[i + 1]], frequencies[offsets[i]:offsets[i + 1]])
+                             for i, term in enumerate(terms)}
+            for name, values in arrays.items():
+                setattr(self, name, values)
+            self.alive = np.ones(len(self.keys), dtype=bool)
+            self.source_names = names['source_names']
+            self.sentiment_names = names['sentiment_names']
+            self._documents = dict(zip(self.keys.tolist(), range(len(self.keys))))
+            self.count = len(self.keys)
+            self.total_length = int(self.lengths.sum())
+            self.dirty = False
@@ -0,0 +1,343 @@
+"""
+Semantic search for the Review Analytics Dashboard.
+Embeds reviews offline on the CPU - TF-IDF + truncated SVD by default, or
+a local sentence-embedding model - and ranks them by cosine similarity to
+a natural-language query. Embeddings are computed in batches and cached on
+disk by text hash in a memory-mapped float32 matrix, searched exactly or
+through an inverted-file (k-means) index.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from importlib.metadata import PackageNotFoundError, version
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import SEMANTIC_SEARCH
+from keywords import tokenize
+from sentiment_cache import cache_key
+
+try:
+    from sklearn.decomposition import TruncatedSVD
+    from sklearn.feature_extraction.text import TfidfVectorizer
+except ImportError:  # optional - needed for the TF-IDF + SVD embedder
+    TfidfVectorizer = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # optional - only used when SEMANTIC_SEARCH['model'] is 'sentence'
+    SentenceTransformer = None
+
+DIGEST_SIZE = 20
+
+
+def _analyzer(text: str) -> List[str]:
+    # Module level so the fitted vectorizer can be pickled
+    return list(tokenize(text))
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return (vectors / np.where(norms == 0, 1, norms)).astype(np.float32)
+
+
+class TfidfSvdEmbedder:
+    """TF-IDF over the dashboard's tokens reduced with truncated SVD (latent semantic analysis)."""
+
+    def __init__(self, dimensions: int):
+        if TfidfVectorizer is None:
+            raise RuntimeError("TF-IDF + SVD embeddings need scikit-learn (pip install scikit-learn)")
+        self.dimensions = dimensions
+        self.vectorizer = None
+        self.svd = None
+        # Number of reviews in the corpus the model was fitted for
+        self.fitted_on = 0
+        self.model_id = None
+
+    def fit(self, texts: List[str]) -> None:
+        # Tiny corpora would lose most of their vocabulary to min_df=2
+        self.vectorizer = TfidfVectorizer(analyzer=_analyzer, sublinear_tf=True,
+                                          min_df=2 if len(texts) >= 100 else 1,
+                                          max_features=SEMANTIC_SEARCH['max_features'])
+        matrix = self.vectorizer.fit_transform(texts)
+        # Only kept for introspection, and can be most of the pickled model's size
+        self.vectorizer.stop_words_ = None
+        components = max(1, min(self.dimensions, matrix.shape[1] - 1, matrix.shape[0] - 1))
+        self.svd = TruncatedSVD(n_components=components, random_state=42).fit(matrix)
+        self.dimensions = components
+        fingerprint = hashlib.sha1(self.svd.components_.astype(np.float32).tobytes())
+        self.model_id = f"tfidf-svd-{fingerprint.hexdigest()[:16]}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        return _normalize(self.svd.transform(self.vectorizer.transform(texts)))
+
+
+class SentenceEmbedder:
+    """A sentence-transformers model loaded from local files only."""
+
+    def __init__(self, model_name: str):
+        if SentenceTransformer is None:
+            raise RuntimeError("Sentence embeddings need sentence-transformers (pip install sentence-transformers)")
+        self.model = SentenceTransformer(model_name, device='cpu', local_files_only=True)
+        self.dimensions = self.model.get_sentence_embedding_dimension()
+        self.model_id = f"sentence-{os.path.basename(os.path.normpath(model_name))}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = self.model.encode(texts, batch_size=64, convert_to_numpy=True, normalize_embeddings=True)
+        return vectors.astype(np.float32)
+
+
+class EmbeddingCache:
+    """Append-only float32 vectors on disk, one row per distinct text hash, memory-mapped for search."""
+
+    def __init__(self, directory: str, model_id: str, dimensions: int):
+        self.directory = directory
+        self.model_id = model_id
+        self.dimensions = dimensions
+        self.vectors_path = os.path.join(directory, 'vectors.f32')
+        self.keys_path = os.path.join(directory, 'keys.bin')
+        self.meta_path = os.path.join(directory, 'meta.json')
+        os.makedirs(directory, exist_ok=True)
+        if self._read_meta() != {'model_id': model_id, 'dimensions': dimensions} or \
+                not (os.path.exists(self.vectors_path) and os.path.exists(self.keys_path)):
+            # Vectors from another model are meaningless for this one
+            self._reset()
+        self._load()
+
+    def _read_meta(self) -> Optional[Dict]:
+        try:
+            with open(self.meta_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _reset(self) -> None:
+        for path in (self.vectors_path, self.keys_path):
+            open(path, 'wb').close()
+        self._write_meta()
+
+    def _write_meta(self) -> None:
+        with open(self.meta_path, 'w', encoding='utf-8') as f:
+            json.dump({'model_id': self.model_id, 'dimensions': self.dimensions}, f)
+
+    def _load(self) -> None:
+        with open(self.keys_path, 'rb') as f:
+            digests = f.read()
+        # A write cut short leaves a partial row; only whole rows present in both files count
+        rows = min(len(digests) // DIGEST_SIZE,
+                   os.path.getsize(self.vectors_path) // (4 * self.dimensions))
+        self.rows = {digests[i * DIGEST_SIZE:(i + 1) * DIGEST_SIZE]: i for i in range(rows)}
+        self.size = rows
+        self._map()
+
+    def _map(self) -> None:
+        self.matrix = (np.memmap(self.vectors_path, dtype=np.float32, mode='r', shape=(self.size, self.dimensions))
+                       if self.size else np.empty((0, self.dimensions), dtype=np.float32))
+
+    def lookup(self, digests: List[bytes]) -> np.ndarray:
+        return np.fromiter((self.rows.get(digest, -1) for digest in digests), dtype=np.int64, count=len(digests))
+
+    def append(self, digests: List[bytes], vectors: np.ndarray) -> None:
+        # Vectors first: a crash between the writes leaves an unreferenced vector, never a wrong one
+        with open(self.vectors_path, 'r+b') as f:
+            f.seek(self.size * 4 * self.dimensions)
+            f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+            f.truncate()
+        with open(self.keys_path, 'r+b') as f:
+            f.seek(self.size * DIGEST_SIZE)
+            f.write(b''.join(digests))
+            f.truncate()
+        self.rows.update(zip(digests, range(self.size, self.size + len(digests))))
+        self.size += len(digests)
+        self._map()
+
+    def compact(self, keep: List[bytes]) -> None:
+        """Rewrite the files with only the given hashes, dropping vectors of texts that are gone."""
+        keep = list(dict.fromkeys(digest for digest in keep if digest in self.rows))
+        vectors = np.array(self.matrix[[self.rows[digest] for digest in keep]]) if keep else \
+            np.empty((0, self.dimensions), dtype=np.float32)
+        # Without meta.json an interrupted rewrite (files out of step) resets the cache on next open
+        os.remove(self.meta_path)
+        for path, data in ((self.vectors_path, vectors.tobytes()), (self.keys_path, b''.join(keep))):
+            with open(f"{path}.tmp", 'wb') as f:
+                f.write(data)
+            os.replace(f"{path}.tmp", path)
+        self._write_meta()
+        self.rows = {digest: row for row, digest in enumerate(keep)}
+        self.size = len(keep)
+        self._map()
+
+
+class SemanticIndex:
+    """Embeds review texts on demand and ranks them by cosine similarity to a query."""
+
+    def __init__(self, directory: str = SEMANTIC_SEARCH['index_dir'], model: Optional[str] = None):
+        self.directory = directory
+        self.model = model or SEMANTIC_SEARCH['model']
+        self.embedder = None
+        self.cache: Optional[EmbeddingCache] = None
+        self._lock = threading.RLock()
+        # (centroids, cache rows ordered by list, list offsets), rebuilt after the cache changes
+        self._ivf = None
+
+    @property
+    def available(self) -> bool:
+        return (SentenceTransformer if self.model == 'sentence' else TfidfVectorizer) is not None
+
+    def prepare(self, texts: List[str]) -> np.ndarray:
+        """Cache row of every text's embedding, embedding (in batches) the texts not cached yet."""
+        with self._lock:
+            self._load_embedder(texts)
+            digests = [bytes.fromhex(cache_key(text, self.embedder.model_id)) for text in texts]
+            rows = self.cache.lookup(digests)
+            missing = {}
+            for digest, text, row in zip(digests, texts, rows):
+                if row < 0 and digest not in missing:
+                    missing[digest] = text
+            if missing:
+                batch_size = SEMANTIC_SEARCH['batch_size']
+                pending = list(missing.items())
+                for start in range(0, len(pending), batch_size):
+                    batch = pending[start:start + batch_size]
+                    self.cache.append([digest for digest, _ in batch],
+                                      self.embedder.embed([text for _, text in batch]))
+                print(f"Semantic index: embedded {len(missing)} new review(s)")
+                self._ivf = None
+            # Vectors of reviews that left the data are dropped once they dominate the file
+            if self.cache.size > 2 * len(set(digests)) + 1000:
+                self.cache.compact(digests)
+                self._ivf = None
+            return self.cache.lookup(digests)
+
+    def _load_embedder(self, texts: List[str]) -> None:
+        if self.model == 'sentence':
+            if self.embedder is None:
+                self.embedder = SentenceEmbedder(SEMANTIC_SEARCH['sentence_model'])
+                self._open_cache()
+            return
+        if self.embedder is None:
+            self.embedder = self._load_model()
+        # A model fitted on a much smaller corpus misses too much vocabulary; refit it
+        if self.embedder is None or len(texts) > SEMANTIC_SEARCH['refit_growth'] * self.embedder.fitted_on:
+            embedder = TfidfSvdEmbedder(SEMANTIC_SEARCH['dimensions'])
+            sample = texts
+            if len(texts) > SEMANTIC_SEARCH['fit_sample']:
+                picks = np.random.default_rng(42).choice(len(texts), SEMANTIC_SEARCH['fit_sample'], replace=False)
+                sample = [texts[i] for i in picks]
+            print(f"Semantic index: fitting TF-IDF + SVD on {len(sample)} reviews")
+            embedder.fit(sample)
+            # Refits are triggered by corpus growth, so remember the corpus size, not the sample's
+            embedder.fitted_on = len(texts)
+            self.embedder = embedder
+            self._save_model()
+            self.cache = None
+        if self.cache is None or self.cache.model_id != self.embedder.model_id:
+            self._open_cache()
+
+    def _open_cache(self) -> None:
+        self.cache = EmbeddingCache(self.directory, self.embedder.model_id, self.embedder.dimensions)
+        self._ivf = None
+
+    def _model_path(self) -> str:
+        return os.path.join(self.directory, 'tfidf_svd.pkl')
+
+    def _model_versions_path(self) -> str:
+        return os.path.join(self.directory, 'tfidf_svd.json')
+
+    @staticmethod
+    def _library_versions() -> Dict[str, str]:
+        """Versions the pickled model depends on; a model saved under others is refitted."""
+        versions = {}
+        for package in ('scikit-learn', 'numpy'):
+            try:
+                versions[package] = version(package)
+            except PackageNotFoundError:
+                versions[package] = ''
+        return versions
+
+    def _load_model(self) -> Optional[TfidfSvdEmbedder]:
+        try:
+            with open(self._model_versions_path(), encoding='utf-8') as f:
+                saved_versions = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if saved_versions != self._library_versions():
+            print(f"Semantic index: model was saved with {saved_versions}, refitting")
+            return None
+        try:
+            with open(self._model_path(), 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            # Any unpickling failure (moved modules, changed classes) just means a refit
+            print(f"Semantic index: could not load the saved model ({e!r}), refitting")
+            return None
+
+    def _save_model(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        with open(f"{self._model_path()}.tmp", 'wb') as f:
+            pickle.dump(self.embedder, f)
+        os.replace(f"{self._model_path()}.tmp", self._model_path())
+        with open(f"{self._model_versions_path()}.tmp", 'w', encoding='utf-8') as f:
+            json.dump(self._library_versions(), f)
+        os.replace(f"{self._model_versions_path()}.tmp", self._model_versions_path())
+
+    def search(self, query: str, rows: np.ndarray, candidates: np.ndarray,
+               offset: int = 0, limit: int = 20) -> Tuple[int, np.ndarray, np.ndarray]:
+        """(number of matches, positions into `rows`, similarities) for one page of results.
+
+        `rows` are cache rows from `prepare()`; `candidates` masks the positions that pass the filters.
+        """
+        with self._lock:
+            if self.embedder is None or not len(rows):
+                return 0, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+            query_vector = self.embedder.embed([query])[0]
+            matrix = self.cache.matrix
+            if SEMANTIC_SEARCH['approximate'] and self.cache.size >= SEMANTIC_SEARCH['ivf_min_rows']:
+                probed = self._probe(query_vector)
+                similarities = np.full(self.cache.size, -np.inf, dtype=np.float32)
+                similarities[probed] = matrix[probed] @ query_vector
+            else:
+                similarities = matrix @ query_vector
+        scores = similarities[rows]
+        positions = np.flatnonzero(candidates & (scores >= SEMANTIC_SEARCH['min_score']))
+        total = len(positions)
+        top = min(offset + limit, total)
+        if top == 0:
+            return total, positions[:0], scores[:0]
+        best = np.argpartition(-scores[positions], top - 1)[:top] if top < total else np.arange(total)
+        best = best[np.lexsort((best, -scores[positions[best]]))][offset:offset + limit]
+        return total, positions[best], scores[positions[best]]
+
+    def _probe(self, query_vector: np.ndarray) -> np.ndarray:
+        """Cache rows in the inverted lists whose centroids are closest to the query."""
+        if self._ivf is None:
+            self._build_ivf()
+        centroids, order, offsets = self._ivf
+        probes = min(SEMANTIC_SEARCH['ivf_probes'], len(centroids))
+        nearest = np.argpartition(-(centroids @ query_vector), probes - 1)[:probes]
+        return np.concatenate([order[offsets[i]:offsets[i + 1]] for i in nearest])
+
+    def _build_ivf(self) -> None:
+        # Spherical k-means on a sample of the vectors, then every vector goes to its nearest centroid
+        matrix = self.cache.matrix
+        size = self.cache.size
+        lists = max(1, min(SEMANTIC_SEARCH['ivf_lists'], int(np.sqrt(size))))
+        rng = np.random.default_rng(42)
+        sample = np.array(matrix[np.sort(rng.choice(size, min(size, 50 * lists), replace=False))])
+        centroids = sample[rng.choice(len(sample), lists, replace=False)]
+        for _ in range(10):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            empty = ~sums.any(axis=1)
+            sums[empty] = centroids[empty]
+            centroids = _normalize(sums)
+        assignment = np.concatenate([np.argmax(matrix[start:start + 65536] @ centroids.T, axis=1)
+                                     for start in range(0, size, 65536)])
+        order = np.argsort(assignment, kind='stable')
+        offsets = np.searchsorted(assignment[order], np.arange(lists + 1))
+        self._ivf = (centroids, order, offsets)
@@ -0,0 +1,75 @@
+"""
+Sentiment scoring module for the Review Analytics Dashboard.
+Scores review text with TextBlob polarity, fanning large inputs out to a
+chunked process pool and keeping small inputs serial. Scores can be
+served from a persistent SentimentCache so unchanged reviews are skipped.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import version
+from typing import List, Optional, Sequence
+
+from textblob import TextBlob
+from config import SENTIMENT_SCORING
+from sentiment_cache import SentimentCache, cache_key, normalize_text
+
+# Part of every cache key - bump when the scoring function changes
+SCORER_VERSION = f"textblob-{version('textblob')}-polarity-v2"
+
+
+def polarity(text: str) -> float:
+    """TextBlob polarity of a single review (0 for empty text)."""
+    if not text:
+        return 0
+    return TextBlob(str(text)).sentiment.polarity
+
+
+def _score_chunk(texts: Sequence[str]) -> List[float]:
+    return [polarity(text) for text in texts]
+
+
+class SentimentScorer:
+    """Scores texts serially or on a process pool, with identical results either way."""
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: Optional[int] = None,
+                 parallel_min: Optional[int] = None, cache: Optional[SentimentCache] = None):
+        self.workers = workers or SENTIMENT_SCORING['workers'] or os.cpu_count() or 1
+        self.chunk_size = chunk_size or SENTIMENT_SCORING['chunk_size']
+        self.parallel_min = parallel_min if parallel_min is not None else SENTIMENT_SCORING['parallel_min']
+        self.cache = cache
+
+    def score(self, texts: Sequence[str]) -> List[float]:
+        """Score texts in order, consulting the cache first when one is configured."""
+        # The normalised text is what gets scored, so it is exactly what the cache key covers
+        texts = [normalize_text(text) if text else '' for text in texts]
+        if self.cache is None:
+            return self._score_uncached(texts)
+
+        keys = [cache_key(text, SCORER_VERSION) for text in texts]
+        cached = self.cache.get_many(keys)
+        # Duplicate texts within one load (overlapping exports) are scored once
+        missing = {key: text for key, text in zip(keys, texts) if key not in cached}
+        if missing:
+            new_scores = self._score_uncached(list(missing.values()))
+            fresh = list(zip(missing.keys(), new_scores))
+            self.cache.put_many(fresh)
+            cached.update(fresh)
+        return [cached[key] for key in keys]
+
+    def _score_uncached(self, texts: List[str]) -> List[float]:
+        # Pool startup is only paid for inputs big enough to amortise it
+        if self.workers <= 1 or len(texts) < self.parallel_min:
+            return _score_chunk(texts)
+
+        chunks = [texts[i:i + self.chunk_size] for i in range(0, len(texts), self.chunk_size)]
+        scores = []
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(chunks))) as executor:
+            for chunk_scores in executor.map(_score_chunk, chunks):
+                scores.extend(chunk_scores)
+        return scores
+
+
+def cached_scorer(cache_path: Optional[str] = None, **kwargs) -> SentimentScorer:
+    """Scorer backed by the shared on-disk cache (used by the dashboard and analysis scripts)."""
+    return SentimentScorer(cache=SentimentCache(cache_path or SENTIMENT_SCORING['cache_file']), **kwargs)
@@ -0,0 +1,66 @@
+"""
+Persistent sentiment cache for the Review Analytics Dashboard.
+Stores polarity scores in SQLite keyed by a hash of the normalised review
+text plus the scorer version, so unchanged and duplicated reviews are
+only ever scored once.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, Tuple
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form used for cache keys: NFC, whitespace collapsed."""
+    return ' '.join(unicodedata.normalize('NFC', str(text)).split())
+
+
+def cache_key(text: str, version: str) -> str:
+    return hashlib.sha1(f"{version}\x1f{normalize_text(text)}".encode('utf-8')).hexdigest()
+
+
+class SentimentCache:
+    """Content-addressed score store with hit/miss accounting."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, score REAL NOT NULL)')
+        self._conn.commit()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, float]:
+        """Look up scores for the given keys; missing keys are counted as misses."""
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            # SQLite caps bound parameters per statement, so query in batches
+            for i in range(0, len(keys), 500):
+                batch = keys[i:i + 500]
+                placeholders = ','.join('?' * len(batch))
+                rows = self._conn.execute(
+                    f'SELECT key, score FROM scores WHERE key IN ({placeholders})', batch
+                ).fetchall()
+                found.update(rows)
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items: List[Tuple[str, float]]) -> None:
+        with self._lock:
+            self._conn.executemany('INSERT OR REPLACE INTO scores (key, score) VALUES (?, ?)', items)
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def close(self) -> None:
+        self._conn.close()
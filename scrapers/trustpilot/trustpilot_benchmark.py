@@ -0,0 +1,232 @@
+"""
+Record/replay benchmark for Trustpilot card extraction.
+
+    python trustpilot_benchmark.py record --url URL --pages 3
+    python trustpilot_benchmark.py run [--selenium] [--save-baseline]
+
+`record` saves real review pages once into a fixtures directory. `run`
+replays them with no network: it times the lxml extraction path per
+field, reports cards/second and field fill rates, and compares the fill
+rates against a saved baseline to catch regressions. With --selenium the
+fixtures are also served from a local http.server and pushed through
+scrape_page in both extraction modes.
+"""
+import argparse
+import functools
+import glob
+import http.server
+import json
+import os
+import threading
+import time
+
+from trustpilot_parser import (
+    find_cards, parse_document, parse_rating, parse_title, parse_review_text, parse_date
+)
+from trustpilot_selector_cache import SelectorRanking
+
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+BASELINE_FILE = "baseline.json"
+FIELDS = {
+    'rating': parse_rating,
+    'title': parse_title,
+    'review': parse_review_text,
+    'date': parse_date
+}
+
+
+def fixture_files(fixtures_dir):
+    return sorted(glob.glob(os.path.join(fixtures_dir, "page_*.html")))
+
+
+def record(url, pages, fixtures_dir, engine):
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    from trustpilot_reviews_scraper import page_url, setup_driver
+    from trustpilot_http import create_session, fetch_page
+    from trustpilot_parser import REVIEWS_LIST_SELECTOR
+
+    os.makedirs(fixtures_dir, exist_ok=True)
+    session = create_session() if engine == 'http' else None
+    driver = setup_driver() if engine == 'selenium' else None
+    try:
+        for page in range(1, pages + 1):
+            target = page_url(url, page)
+            if session is not None:
+                html = fetch_page(session, target)
+            else:
+                driver.get(target)
+                try:
+                    WebDriverWait(driver, 10).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, REVIEWS_LIST_SELECTOR))
+                    )
+                    html = driver.page_source
+                except TimeoutException:
+                    html = None
+            if html is None:
+                print(f"Reached a 404 page at: {target}")
+                break
+            path = os.path.join(fixtures_dir, f"page_{page:03d}.html")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(html)
+            print(f"recorded {target} -> {path}")
+            time.sleep(2)
+    finally:
+        if session is not None:
+            session.close()
+        if driver is not None:
+            driver.quit()
+
+
+def run_parser_benchmark(files, repeat, use_ranking):
+    field_seconds = {field: 0.0 for field in FIELDS}
+    field_filled = {field: 0 for field in FIELDS}
+    parse_seconds = 0.0
+    cards_total = 0
+    for _ in range(repeat):
+        ranking = SelectorRanking() if use_ranking else None
+        for path in files:
+            with open(path, 'r', encoding='utf-8') as f:
+                html = f.read()
+            started = time.perf_counter()
+            document = parse_document(html)
+            cards = find_cards(document)
+            parse_seconds += time.perf_counter() - started
+            for card in cards:
+                for field, extract in FIELDS.items():
+                    started = time.perf_counter()
+                    value = extract(card) if field == 'date' else extract(card, ranking)
+                    field_seconds[field] += time.perf_counter() - started
+                    if value:
+                        field_filled[field] += 1
+            cards_total += len(cards)
+    total_seconds = parse_seconds + sum(field_seconds.values())
+    return {
+        'cards': cards_total // repeat,
+        'cards_per_second': cards_total / total_seconds if total_seconds else 0.0,
+        'parse_ms_per_page': 1000 * parse_seconds / (repeat * len(files)),
+        'field_us_per_card': {field: 1e6 * seconds / cards_total if cards_total else 0.0
+                              for field, seconds in field_seconds.items()},
+        'fill_rate': {field: filled / cards_total if cards_total else 0.0
+                      for field, filled in field_filled.items()}
+    }
+
+
+def serve_fixtures(fixtures_dir):
+    handler = functools.partial(QuietHandler, directory=fixtures_dir)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def run_selenium_benchmark(files, fixtures_dir):
+    from trustpilot_reviews_scraper import scrape_page, setup_driver
+
+    server = serve_fixtures(fixtures_dir)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    driver = setup_driver()
+    results = {}
+    try:
+        for extraction in ('html', 'dom'):
+            cards = 0
+            started = time.perf_counter()
+            for path in files:
+                reviews = scrape_page(driver, f"{base}/{os.path.basename(path)}", extraction=extraction)
+                cards += len(reviews or [])
+            elapsed = time.perf_counter() - started
+            results[extraction] = {
+                'cards': cards,
+                'seconds': elapsed,
+                'cards_per_second': cards / elapsed if elapsed else 0.0
+            }
+    finally:
+        driver.quit()
+        server.shutdown()
+    return results
+
+
+def compare_fill_rates(current, baseline, tolerance):
+    regressions = []
+    for field, rate in baseline.get('fill_rate', {}).items():
+        if current['fill_rate'].get(field, 0.0) < rate - tolerance:
+            regressions.append((field, rate, current['fill_rate'].get(field, 0.0)))
+    return regressions
+
+
+def print_report(report):
+    print(f"cards: {report['cards']} per pass, {report['cards_per_second']:.0f} cards/s, "
+          f"{report['parse_ms_per_page']:.2f} ms/page to parse the document")
+    print("per-field extraction time and fill rate:")
+    for field in FIELDS:
+        print(f"  {field:<7} {report['field_us_per_card'][field]:>9.1f} us/card  "
+              f"{100 * report['fill_rate'][field]:>6.1f}% filled")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Record/replay benchmark for Trustpilot card extraction.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = subparsers.add_parser('record', help="save live review pages as fixtures")
+    record_parser.add_argument('--url', required=True)
+    record_parser.add_argument('--pages', type=int, default=3)
+    record_parser.add_argument('--engine', choices=['http', 'selenium'], default='selenium',
+                               help="selenium records the rendered DOM, http the raw server response")
+    record_parser.add_argument('--fixtures-dir', default=DEFAULT_FIXTURES_DIR)
+
+    run_parser = subparsers.add_parser('run', help="benchmark extraction against saved fixtures")
+    run_parser.add_argument('--fixtures-dir', default=DEFAULT_FIXTURES_DIR)
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--no-ranking', action='store_true',
+                            help="walk the full selector chains instead of using the adaptive ranking")
+    run_parser.add_argument('--selenium', action='store_true',
+                            help="also replay the fixtures through scrape_page via a local http.server")
+    run_parser.add_argument('--save-baseline', action='store_true',
+                            help=f"store this run's fill rates as {BASELINE_FILE} in the fixtures dir")
+    run_parser.add_argument('--tolerance', type=float, default=0.02,
+                            help="allowed fill-rate drop per field before it counts as a regression")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    if args.command == 'record':
+        record(args.url, args.pages, args.fixtures_dir, args.engine)
+        return
+
+    files = fixture_files(args.fixtures_dir)
+    if not files:
+        print(f"No fixtures found in {args.fixtures_dir} --> run 'record' first.")
+        raise SystemExit(1)
+    print(f"replaying {len(files)} fixture page(s) from {args.fixtures_dir} x{args.repeat}")
+    report = run_parser_benchmark(files, max(1, args.repeat), not args.no_ranking)
+    print_report(report)
+
+    if args.selenium:
+        for extraction, result in run_selenium_benchmark(files, args.fixtures_dir).items():
+            print(f"selenium scrape_page ({extraction}): {result['cards']} cards in "
+                  f"{result['seconds']:.2f}s ({result['cards_per_second']:.1f} cards/s)")
+
+    baseline_path = os.path.join(args.fixtures_dir, BASELINE_FILE)
+    if args.save_baseline:
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump({'fill_rate': report['fill_rate'], 'cards': report['cards']}, f, indent=2)
+        print(f"baseline saved to: {baseline_path}")
+    elif os.path.exists(baseline_path):
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            regressions = compare_fill_rates(report, json.load(f), args.tolerance)
+        for field, before, after in regressions:
+            print(f"REGRESSION: {field} fill rate {100 * before:.1f}% -> {100 * after:.1f}%")
+        if regressions:
+            raise SystemExit(1)
+        print("no fill-rate regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Append-only per-page checkpoint for long Trustpilot crawls.
+Every completed page is written as one JSONL line as soon as it is
+scraped, so a crash only loses the page in flight and --resume can pick
+up from the last completed page. Only a page -> file offset index is
+kept in memory; reviews are streamed back from disk when exporting.
+"""
+import json
+import os
+import threading
+
+
+def checkpoint_path(company_name, out_dir="."):
+    return os.path.join(out_dir, f"{company_name}_trustpilot_checkpoint.jsonl")
+
+
+class PageCheckpoint:
+    def __init__(self, path, resume=False):
+        self.path = path
+        self.offsets = {}
+        self.finished = False
+        self.lock = threading.Lock()
+        if resume and os.path.exists(path):
+            self._load()
+        else:
+            open(path, 'w', encoding='utf-8').close()
+
+    def _load(self):
+        valid_end = 0
+        with open(self.path, 'rb') as f:
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # --- torn write from a crash: drop it and everything after
+                    break
+                if entry.get('end'):
+                    self.finished = True
+                else:
+                    self.offsets[entry['page']] = offset
+                valid_end = f.tell()
+        with open(self.path, 'r+b') as f:
+            f.truncate(valid_end)
+
+    def next_page(self):
+        # --- first page after the contiguous run of completed pages
+        page = 1
+        while page in self.offsets:
+            page += 1
+        return page
+
+    def write_page(self, page, reviews):
+        line = (json.dumps({'page': page, 'reviews': reviews}, ensure_ascii=False) + "\n").encode('utf-8')
+        with self.lock:
+            with open(self.path, 'ab') as f:
+                self.offsets[page] = f.tell()
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def mark_end(self):
+        with self.lock:
+            with open(self.path, 'ab') as f:
+                f.write(b'{"end": true}\n')
+            self.finished = True
+
+    @property
+    def pages_completed(self):
+        return len(self.offsets)
+
+    def iter_reviews(self):
+        with open(self.path, 'rb') as f:
+            for page in sorted(self.offsets):
+                f.seek(self.offsets[page])
+                yield from json.loads(f.readline())['reviews']
+
+    def remove(self):
+        os.remove(self.path)
@@ -0,0 +1,103 @@
+"""
+Browserless fetch path for Trustpilot review pages.
+Pages are fetched over a keep-alive requests.Session and the review data
+is read from the server-rendered __NEXT_DATA__ JSON, falling back to the
+card selectors in trustpilot_parser.py when the JSON is missing.
+"""
+import json
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from trustpilot_parser import parse_document, is_404_document, parse_reviews_document
+
+HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/126.0 Safari/537.36"),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+REQUEST_TIMEOUT = 15
+
+
+class PageBlocked(Exception):
+    """403 from the server: the page is refused to plain HTTP clients."""
+
+
+class PageThrottled(Exception):
+    """429 from the server; retry_after is the Retry-After delay in seconds, if one was sent."""
+
+    def __init__(self, url, retry_after=None):
+        super().__init__(f"HTTP 429 at {url}")
+        self.retry_after = retry_after
+
+
+def retry_after_seconds(value):
+    # --- only the delta-seconds form; an HTTP-date falls back to the limiter's own backoff
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def create_session(pool_size=4):
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def fetch_page(session, url):
+    # --- None marks the end of pagination, same contract as scrape_page
+    response = session.get(url, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 404:
+        return None
+    if response.status_code == 403:
+        raise PageBlocked(f"HTTP 403 at {url}")
+    if response.status_code == 429:
+        raise PageThrottled(url, retry_after_seconds(response.headers.get("Retry-After")))
+    response.raise_for_status()
+    return response.text
+
+
+def extract_next_data(document):
+    scripts = document.xpath("//script[@id='__NEXT_DATA__']/text()")
+    if not scripts:
+        return None
+    try:
+        return json.loads(scripts[0])
+    except ValueError:
+        return None
+
+
+def review_from_json(review):
+    dates = review.get("dates") or {}
+    return {
+        "rating": review.get("rating"),
+        "title": (review.get("title") or "").strip(),
+        "review": (review.get("text") or "").strip(),
+        "date": dates.get("publishedDate") or ""
+    }
+
+
+def parse_embedded_reviews(document):
+    next_data = extract_next_data(document)
+    if not next_data:
+        return None
+    reviews = next_data.get("props", {}).get("pageProps", {}).get("reviews")
+    if reviews is None:
+        return None
+    return [review_from_json(review) for review in reviews]
+
+
+def parse_http_page(html, ranking=None):
+    """Extract {rating, title, review, date} records, preferring the embedded JSON."""
+    document = parse_document(html)
+    if is_404_document(document):
+        return None
+    reviews = parse_embedded_reviews(document)
+    if reviews is None:
+        reviews = parse_reviews_document(document, ranking)
+    return reviews
@@ -0,0 +1,103 @@
+"""
+Lean headless Chrome profile for the Trustpilot scraper.
+scrape_page only needs the review DOM, so images, fonts, media and
+third-party analytics/ad requests are blocked through CDP and the driver
+returns at DOMContentLoaded (pageLoadStrategy=eager). PageLoadMeter
+reports what each page cost and how much that saves against a full
+profile.
+"""
+import json
+
+BLOCKED_URL_PATTERNS = [
+    # images, fonts and media
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm",
+    # analytics, tag managers and ads
+    "*googletagmanager.com*", "*google-analytics.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*googleadservices.com*", "*facebook.net*",
+    "*connect.facebook.com*", "*hotjar.com*", "*segment.io*", "*segment.com*",
+    "*optimizely.com*", "*amplitude.com*", "*bing.com/bat*", "*clarity.ms*",
+    "*cookielaw.org*", "*onetrust.com*", "*sentry.io*", "*datadoghq*",
+]
+
+PAGE_COST_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+let bytes = nav ? nav.transferSize : 0;
+for (const entry of resources) { bytes += entry.transferSize || 0; }
+return {
+    bytes: bytes,
+    ms: nav ? nav.domContentLoadedEventEnd - nav.startTime : 0,
+    requests: resources.length + 1
+};
+"""
+
+
+def apply_lean_options(chrome_options):
+    chrome_options.page_load_strategy = 'eager'
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2
+    })
+    # --- performance log lets PageLoadMeter count blocked requests
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def enable_request_blocking(driver):
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+
+def measure_page_cost(driver):
+    cost = driver.execute_script(PAGE_COST_SCRIPT) or {}
+    return {
+        'bytes': int(cost.get('bytes') or 0),
+        'ms': float(cost.get('ms') or 0),
+        'requests': int(cost.get('requests') or 0)
+    }
+
+
+def count_blocked_requests(driver):
+    blocked = 0
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"]).get("message", {})
+        if message.get("method") == "Network.loadingFailed" and message.get("params", {}).get("blockedReason"):
+            blocked += 1
+    return blocked
+
+
+class PageLoadMeter:
+    def __init__(self, baseline=None):
+        # --- baseline: measure_page_cost() of the same page in a full profile, if available
+        self.baseline = baseline
+        self.pages = 0
+        self.total_bytes = 0
+        self.total_ms = 0.0
+        self.total_blocked = 0
+
+    def record(self, driver, url):
+        cost = measure_page_cost(driver)
+        blocked = count_blocked_requests(driver)
+        self.pages += 1
+        self.total_bytes += cost['bytes']
+        self.total_ms += cost['ms']
+        self.total_blocked += blocked
+        report = f"lean browser: {cost['bytes'] / 1024:.0f} KB in {cost['ms']:.0f} ms, {blocked} request(s) blocked"
+        if self.baseline:
+            saved_bytes = self.baseline['bytes'] - cost['bytes']
+            saved_ms = self.baseline['ms'] - cost['ms']
+            report += f" (saved {saved_bytes / 1024:.0f} KB, {saved_ms:.0f} ms vs full profile)"
+        print(f"{report} --> {url}")
+
+    def summary(self):
+        if not self.pages:
+            return
+        avg_bytes = self.total_bytes / self.pages
+        avg_ms = self.total_ms / self.pages
+        report = (f"lean browser summary: {self.pages} page(s), avg {avg_bytes / 1024:.0f} KB "
+                  f"and {avg_ms:.0f} ms per page, {self.total_blocked} request(s) blocked")
+        if self.baseline:
+            report += (f", avg saved {(self.baseline['bytes'] - avg_bytes) / 1024:.0f} KB "
+                       f"and {self.baseline['ms'] - avg_ms:.0f} ms per page")
+        print(report)
@@ -0,0 +1,242 @@
+"""
+Offline extraction of Trustpilot review cards from a page_source snapshot.
+Runs the same selector fallback chain as the Selenium path in
+trustpilot_reviews_scraper.py, but against a local lxml tree.
+"""
+import re
+from functools import lru_cache
+
+import lxml.html
+from lxml.cssselect import CSSSelector
+
+REVIEWS_LIST_SELECTOR = "div[class^='styles_wrapper'][data-reviews-list-start='true']"
+ERROR_404_SELECTOR = "div[class^='errors_error404']"
+CARD_SELECTOR = "div[class^='styles_cardWrapper']"
+
+RATING_SELECTORS = [
+    "div[class*='star-rating'] img",
+    "div[data-service-review-rating] img",
+    "img[alt*='star']",
+    "img[alt*='Rated']",
+    "div[class*='rating'] img",
+    "[class*='stars'] img",
+    "div[data-service-review-rating]"
+]
+RATING_FALLBACK_SELECTOR = "[class*='rating'], [class*='star'], [data-rating]"
+RATING_ATTRIBUTES = ['data-rating', 'data-stars', 'data-score']
+
+TITLE_SELECTORS = [
+    "h2[data-service-review-title-typography='true']",
+    "h2[class^='typography_heading']",
+    "h3[class^='typography_heading']",
+    "h2[class*='heading']",
+    "h3[class*='heading']",
+    "div[data-service-review-title-typography='true']",
+    "span[data-service-review-title-typography='true']",
+    "[class*='review-title']",
+    "[class*='reviewTitle']"
+]
+TITLE_FALLBACK_SELECTOR = "h1, h2, h3, h4, h5, h6"
+
+TEXT_SELECTORS = [
+    "div[data-service-review-text-typography='true']",
+    "p[data-service-review-text-typography='true']",
+    "div[class*='review-content']",
+    "p[class*='review-content']",
+    "div[class^='typography_body-l']",
+    "p[class^='typography_body-l']",
+    "div[class^='typography_body']",
+    "p[class^='typography_body']",
+    "span[class*='typography_body']"
+]
+TEXT_FALLBACK_SELECTOR = "div, p"
+
+DATE_SELECTOR = "time"
+
+
+def extract_rating(rating_text):
+    # Try multiple patterns to extract rating
+    patterns = [
+        r'Rated (\d+)',
+        r'(\d+) out of',
+        r'(\d+) star',
+        r'rating-(\d+)',
+        r'stars-(\d+)'
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, rating_text, re.IGNORECASE)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def rating_from_class(class_name):
+    for i in range(1, 6):  # ratings 1-5
+        if f"rating-{i}" in class_name or f"stars-{i}" in class_name or f"star-{i}" in class_name:
+            return i
+    return None
+
+
+def is_title_candidate(text):
+    # Skip if it looks like metadata or very short
+    return bool(text and len(text) > 3 and len(text) < 200 and
+                not re.match(r'^\d+\s*(star|stars)', text.lower()) and
+                not re.match(r'^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', text))
+
+
+def is_text_candidate(text):
+    # Skip elements that are likely metadata (short text, dates, etc.)
+    return bool(text and len(text) > 20 and
+                not re.match(r'^\d+\s*(star|stars|out of)', text.lower()) and
+                not re.match(r'^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', text) and
+                'verified' not in text.lower() and
+                'helpful' not in text.lower())
+
+
+@lru_cache(maxsize=None)
+def _compile(selector):
+    # --- CSS -> XPath translation is the expensive part, do it once per selector
+    return CSSSelector(selector)
+
+
+def _all(node, selector):
+    # --- CSSSelector matches descendant-or-self, find_element only looks at descendants
+    return [match for match in _compile(selector)(node) if match is not node]
+
+
+def _first(node, selector):
+    # --- mirrors WebElement.find_element: first descendant match or None
+    matches = _all(node, selector)
+    return matches[0] if matches else None
+
+
+def _text(node):
+    return node.text_content().strip()
+
+
+def _rating_from_attributes(node):
+    for attr in RATING_ATTRIBUTES:
+        attr_value = node.get(attr)
+        if attr_value and attr_value.isdigit():
+            return int(attr_value)
+    return None
+
+
+def ordered_selectors(ranking, field, selectors):
+    return ranking.order(field, selectors) if ranking is not None else selectors
+
+
+def record_selector(ranking, field, selector, hit):
+    if ranking is not None:
+        ranking.record(field, selector, hit)
+
+
+def _rating_from_element(rating_element):
+    if rating_element.tag == 'img':
+        alt_text = rating_element.get("alt")
+        if alt_text:
+            rating = extract_rating(alt_text)
+            if rating:
+                return rating
+    return _rating_from_attributes(rating_element)
+
+
+def parse_rating(card, ranking=None):
+    for selector in ordered_selectors(ranking, 'rating', RATING_SELECTORS):
+        rating_element = _first(card, selector)
+        rating = _rating_from_element(rating_element) if rating_element is not None else None
+        record_selector(ranking, 'rating', selector, bool(rating))
+        if rating:
+            return rating
+
+    # If still no rating found, try to find it in class names or other attributes
+    for elem in _all(card, RATING_FALLBACK_SELECTOR):
+        rating = rating_from_class(elem.get("class") or "") or _rating_from_attributes(elem)
+        if rating:
+            return rating
+    return None
+
+
+def parse_title(card, ranking=None):
+    for selector in ordered_selectors(ranking, 'title', TITLE_SELECTORS):
+        title_element = _first(card, selector)
+        potential_title = _text(title_element) if title_element is not None else ""
+        hit = bool(potential_title) and len(potential_title) > 2
+        record_selector(ranking, 'title', selector, hit)
+        if hit:
+            return potential_title
+
+    # If no specific selector worked, look for any heading elements with substantial text
+    for element in _all(card, TITLE_FALLBACK_SELECTOR):
+        text = _text(element)
+        if is_title_candidate(text):
+            return text
+    return ""
+
+
+def parse_review_text(card, ranking=None):
+    for selector in ordered_selectors(ranking, 'review', TEXT_SELECTORS):
+        review_element = _first(card, selector)
+        potential_text = _text(review_element) if review_element is not None else ""
+        # Check if this looks like actual review content (not just metadata)
+        hit = bool(potential_text) and len(potential_text) > 10
+        record_selector(ranking, 'review', selector, hit)
+        if hit:
+            return potential_text
+
+    # If no specific selector worked, try to find any text content in the card
+    for element in _all(card, TEXT_FALLBACK_SELECTOR):
+        text = _text(element)
+        if is_text_candidate(text):
+            return text
+    return ""
+
+
+def parse_date(card):
+    date_element = _first(card, DATE_SELECTOR)
+    if date_element is None:
+        return ""
+    return date_element.get("datetime") or ""
+
+
+def parse_card(card, ranking=None):
+    return {
+        "rating": parse_rating(card, ranking),
+        "title": parse_title(card, ranking),
+        "review": parse_review_text(card, ranking),
+        "date": parse_date(card)
+    }
+
+
+def parse_document(html):
+    document = lxml.html.fromstring(html)
+    # --- approximate WebElement.text, which renders <br> as a line break
+    for br in document.iter('br'):
+        br.tail = "\n" + (br.tail or "")
+    return document
+
+
+def is_404_document(document):
+    return _first(document, ERROR_404_SELECTOR) is not None
+
+
+def is_404_page(html):
+    return is_404_document(parse_document(html))
+
+
+def has_reviews_list(html):
+    return _first(parse_document(html), REVIEWS_LIST_SELECTOR) is not None
+
+
+def find_cards(document):
+    return _all(document, CARD_SELECTOR)
+
+
+def parse_reviews_document(document, ranking=None):
+    return [parse_card(card, ranking) for card in find_cards(document)]
+
+
+def parse_reviews_html(html, ranking=None):
+    """Extract {rating, title, review, date} records from a review page's HTML."""
+    return parse_reviews_document(parse_document(html), ranking)
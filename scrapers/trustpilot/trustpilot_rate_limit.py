@@ -0,0 +1,135 @@
+"""
+Adaptive, pool-wide pacing for Trustpilot page requests.
+Each host gets a token bucket whose refill rate follows AIMD: it creeps
+up additively while pages come back with reviews and is cut
+multiplicatively on timeouts / empty pages, which is how throttling
+shows up in scrape_page, and on HTTP 429 responses. Failures also trigger an exponential backoff
+with jitter. Every decision is printed and can be appended to a JSONL
+log for tuning.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_RATE = 0.5        # requests per second, i.e. the old fixed 2s sleep
+DEFAULT_MIN_RATE = 0.05
+DEFAULT_MAX_RATE = 1.0
+ADDITIVE_INCREASE = 0.05
+MULTIPLICATIVE_DECREASE = 0.5
+BACKOFF_BASE = 2.0
+BACKOFF_MAX = 60.0
+MAX_THROTTLE_RETRIES = 5  # retries of one page after a 429 or an empty page
+
+
+class HostBucket:
+    def __init__(self, rate, min_rate, max_rate):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+        self.failures = 0
+        self.backoff_until = 0.0
+
+
+class AdaptiveRateLimiter:
+    def __init__(self, rate=DEFAULT_RATE, min_rate=DEFAULT_MIN_RATE, max_rate=DEFAULT_MAX_RATE,
+                 host_limits=None, log_path=None):
+        # --- host_limits: {host: max_rate}, caps the AIMD ceiling for that host
+        if min(rate, min_rate, max_rate, *(host_limits or {}).values()) <= 0:
+            raise ValueError("request rates must be greater than 0")
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.host_limits = host_limits or {}
+        self.log_path = log_path
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def _bucket(self, host):
+        if host not in self.buckets:
+            max_rate = min(self.max_rate, self.host_limits.get(host, self.max_rate))
+            self.buckets[host] = HostBucket(min(self.rate, max_rate), min(self.min_rate, max_rate), max_rate)
+        return self.buckets[host]
+
+    def acquire(self, url):
+        host = urlsplit(url).netloc
+        with self.lock:
+            bucket = self._bucket(host)
+            now = time.monotonic()
+            bucket.tokens = min(1.0, bucket.tokens + (now - bucket.updated) * bucket.rate)
+            bucket.updated = now
+            # --- reserve a token; a negative balance is the queue of callers ahead of us
+            bucket.tokens -= 1.0
+            wait = max(0.0, -bucket.tokens / bucket.rate, bucket.backoff_until - now)
+        if wait > 0:
+            time.sleep(wait)
+
+    def success(self, url):
+        host = urlsplit(url).netloc
+        with self.lock:
+            bucket = self._bucket(host)
+            old_rate = bucket.rate
+            bucket.rate = new_rate = min(bucket.max_rate, bucket.rate + ADDITIVE_INCREASE)
+            bucket.failures = 0
+        if new_rate != old_rate:
+            self._log(host, 'increase', old_rate, new_rate)
+
+    def failure(self, url, reason, retry_after=None):
+        host = urlsplit(url).netloc
+        with self.lock:
+            bucket = self._bucket(host)
+            old_rate = bucket.rate
+            bucket.rate = new_rate = max(bucket.min_rate, bucket.rate * MULTIPLICATIVE_DECREASE)
+            bucket.failures += 1
+            backoff = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (bucket.failures - 1))
+            backoff *= random.uniform(0.5, 1.5)
+            if retry_after is not None:
+                backoff = max(backoff, retry_after)
+            bucket.backoff_until = time.monotonic() + backoff
+        self._log(host, 'backoff', old_rate, new_rate, reason=reason, backoff=backoff)
+
+    def _log(self, host, decision, old_rate, new_rate, reason=None, backoff=None):
+        message = f"pacing: {host} {decision} {old_rate:.2f} -> {new_rate:.2f} req/s"
+        if reason:
+            message += f" after {reason}, sleeping {backoff:.1f}s"
+        print(message)
+        if self.log_path:
+            entry = {
+                'time': time.time(), 'host': host, 'decision': decision,
+                'old_rate': old_rate, 'new_rate': new_rate, 'reason': reason, 'backoff': backoff
+            }
+            with self.lock:
+                with open(self.log_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry) + "\n")
+
+
+def positive_rate(value):
+    # --- argparse type for the rate flags; a rate of 0 would never refill the bucket
+    try:
+        rate = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid rate: {value!r}")
+    if rate <= 0:
+        raise argparse.ArgumentTypeError(f"rate must be greater than 0, got {value}")
+    return rate
+
+
+def host_limit(value):
+    # --- argparse type for --host-limit: "www.trustpilot.com=0.8" -> ("www.trustpilot.com", 0.8)
+    host, separator, rate = value.partition('=')
+    if not separator or not host.strip():
+        raise argparse.ArgumentTypeError(f"expected HOST=RATE, got {value!r}")
+    return host.strip(), positive_rate(rate)
+
+
+def parse_host_limits(values):
+    # --- [("www.trustpilot.com", 0.8), ...] or ["www.trustpilot.com=0.8", ...] -> {host: rate}
+    host_limits = {}
+    for value in values or []:
+        host, rate = host_limit(value) if isinstance(value, str) else value
+        host_limits[host] = rate
+    return host_limits
@@ -1,318 +1,639 @@
+import argparse
 import json
+import os
 import csv
-import sys
 import time
 import re
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from trustpilot_parser import (
+    REVIEWS_LIST_SELECTOR, ERROR_404_SELECTOR, CARD_SELECTOR,
+    RATING_SELECTORS, RATING_FALLBACK_SELECTOR, RATING_ATTRIBUTES,
+    TITLE_SELECTORS, TITLE_FALLBACK_SELECTOR,
+    TEXT_SELECTORS, TEXT_FALLBACK_SELECTOR, DATE_SELECTOR,
+    extract_rating, rating_from_class, is_title_candidate, is_text_candidate,
+    ordered_selectors, record_selector, parse_reviews_html
+)
+from trustpilot_selector_cache import SelectorRanking
+from trustpilot_http import create_session, fetch_page, parse_http_page, PageBlocked, PageThrottled
+from trustpilot_lean import (
+    apply_lean_options, enable_request_blocking, measure_page_cost, PageLoadMeter
+)
+from trustpilot_rate_limit import (
+    DEFAULT_RATE, DEFAULT_MIN_RATE, DEFAULT_MAX_RATE, MAX_THROTTLE_RETRIES,
+    AdaptiveRateLimiter, parse_host_limits, positive_rate, host_limit
+)
+from trustpilot_checkpoint import PageCheckpoint, checkpoint_path
+from trustpilot_state import (
+    DEFAULT_STATE_FILE, IncrementalState, canonical_dataset_path, append_reviews
+)
 
-def setup_driver():
+def setup_driver(lean=False):
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--window-size=1920,1080")
     chrome_options.add_argument("--disable-notifications")
     chrome_options.add_argument("--disable-popup-blocking")
+    if lean:
+        apply_lean_options(chrome_options)
     driver = webdriver.Chrome(options=chrome_options)
+    if lean:
+        enable_request_blocking(driver)
     return driver
 
+def measure_full_profile(url):
+    # --- one page load in the default profile, used as the baseline for lean-browser savings
+    driver = setup_driver()
+    try:
+        driver.get(url)
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, REVIEWS_LIST_SELECTOR))
+        )
+        return measure_page_cost(driver)
+    except TimeoutException:
+        return None
+    finally:
+        driver.quit()
+
 def extract_company_name(base_url):
     match = re.search(r"/review/([^/?\s]+)", base_url)
     if match:
         return match.group(1).strip("/")
     return "unknown-company"
 
-def extract_rating(rating_text):
-    # Try multiple patterns to extract rating
-    patterns = [
-        r'Rated (\d+)',
-        r'(\d+) out of',
-        r'(\d+) star',
-        r'rating-(\d+)',
-        r'stars-(\d+)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, rating_text, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
-    return None
-
-def scrape_page(driver, url):
+def scrape_page(driver, url, extraction="html", ranking=None):
     driver.get(url)
     try:
         WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "div[class^='styles_wrapper'][data-reviews-list-start='true']"))
+            EC.presence_of_element_located((By.CSS_SELECTOR, REVIEWS_LIST_SELECTOR))
         )
     except TimeoutException:
         try:
-            driver.find_element(By.CSS_SELECTOR, "div[class^='errors_error404']")
+            driver.find_element(By.CSS_SELECTOR, ERROR_404_SELECTOR)
             print(f"Reached a 404 page at: {url}")
             return None
         except NoSuchElementException:
             print(f"Timeout waiting for reviews list at: {url}")
             return []
-    review_cards = driver.find_elements(By.CSS_SELECTOR, "div[class^='styles_cardWrapper']")
-    reviews_data = []
+    if extraction == "html":
+        # --- one page_source round trip, then parse locally
+        reviews_data = parse_reviews_html(driver.page_source, ranking)
+    else:
+        review_cards = driver.find_elements(By.CSS_SELECTOR, CARD_SELECTOR)
+        reviews_data = [extract_card_dom(card, ranking) for card in review_cards]
+    print(f"Scraped {len(reviews_data)} reviews from {url}")    
+    return reviews_data
+
+def extract_card_dom(card, ranking=None):
+    review_data = {}
     
-    for card in review_cards:
-        review_data = {}
-        
-        # Improved rating extraction with multiple approaches
-        rating = None
-        try:
-            # Try multiple selectors for star rating
-            rating_selectors = [
-                "div[class*='star-rating'] img",
-                "div[data-service-review-rating] img",
-                "img[alt*='star']",
-                "img[alt*='Rated']",
-                "div[class*='rating'] img",
-                "[class*='stars'] img",
-                "div[data-service-review-rating]"
-            ]
-            
-            for selector in rating_selectors:
-                try:
-                    rating_element = card.find_element(By.CSS_SELECTOR, selector)
-                    
-                    # Try to get rating from alt text
-                    if rating_element.tag_name == 'img':
-                        alt_text = rating_element.get_attribute("alt")
-                        if alt_text:
-                            rating = extract_rating(alt_text)
-                            if rating:
-                                break
-                    
-                    # Try to get rating from data attributes
-                    for attr in ['data-rating', 'data-stars', 'data-score']:
+    # Improved rating extraction with multiple approaches
+    rating = None
+    try:
+        for selector in ordered_selectors(ranking, 'rating', RATING_SELECTORS):
+            try:
+                rating_element = card.find_element(By.CSS_SELECTOR, selector)
+                
+                # Try to get rating from alt text
+                if rating_element.tag_name == 'img':
+                    alt_text = rating_element.get_attribute("alt")
+                    if alt_text:
+                        rating = extract_rating(alt_text)
+                
+                # Try to get rating from data attributes
+                if not rating:
+                    for attr in RATING_ATTRIBUTES:
                         attr_value = rating_element.get_attribute(attr)
                         if attr_value and attr_value.isdigit():
                             rating = int(attr_value)
                             break
+                
+                record_selector(ranking, 'rating', selector, bool(rating))
+                if rating:
+                    break
                     
+            except NoSuchElementException:
+                record_selector(ranking, 'rating', selector, False)
+                continue
+        
+        # If still no rating found, try to find it in class names or other attributes
+        if not rating:
+            try:
+                rating_elements = card.find_elements(By.CSS_SELECTOR, RATING_FALLBACK_SELECTOR)
+                for elem in rating_elements:
+                    # Check class names for rating info
+                    rating = rating_from_class(elem.get_attribute("class") or "")
                     if rating:
                         break
-                        
-                except NoSuchElementException:
-                    continue
-            
-            # If still no rating found, try to find it in class names or other attributes
-            if not rating:
-                try:
-                    # Look for elements with rating in class names
-                    rating_elements = card.find_elements(By.CSS_SELECTOR, "[class*='rating'], [class*='star'], [data-rating]")
-                    for elem in rating_elements:
-                        # Check class names for rating info
-                        class_name = elem.get_attribute("class") or ""
-                        for i in range(1, 6):  # ratings 1-5
-                            if f"rating-{i}" in class_name or f"stars-{i}" in class_name or f"star-{i}" in class_name:
-                                rating = i
-                                break
-                        if rating:
-                            break
-                        
-                        # Check data attributes
-                        for attr in ['data-rating', 'data-stars', 'data-score']:
-                            attr_value = elem.get_attribute(attr)
-                            if attr_value and attr_value.isdigit():
-                                rating = int(attr_value)
-                                break
-                        if rating:
-                            break
-                except:
-                    pass
                     
-        except Exception as e:
-            print(f"Error extracting rating: {e}")
-        
-        review_data["rating"] = rating
-        
-        # Improved title extraction with multiple selectors
-        title = ""
-        try:
-            title_selectors = [
-                "h2[data-service-review-title-typography='true']",
-                "h2[class^='typography_heading']",
-                "h3[class^='typography_heading']",
-                "h2[class*='heading']",
-                "h3[class*='heading']",
-                "div[data-service-review-title-typography='true']",
-                "span[data-service-review-title-typography='true']",
-                "[class*='review-title']",
-                "[class*='reviewTitle']"
-            ]
-            
-            for selector in title_selectors:
-                try:
-                    title_element = card.find_element(By.CSS_SELECTOR, selector)
-                    potential_title = title_element.text.strip()
-                    if potential_title and len(potential_title) > 2:
-                        title = potential_title
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            # If no specific selector worked, look for any heading elements with substantial text
-            if not title:
-                try:
-                    heading_elements = card.find_elements(By.CSS_SELECTOR, "h1, h2, h3, h4, h5, h6")
-                    for element in heading_elements:
-                        text = element.text.strip()
-                        # Skip if it looks like metadata or very short
-                        if (text and len(text) > 3 and len(text) < 200 and
-                            not re.match(r'^\d+\s*(star|stars)', text.lower()) and
-                            not re.match(r'^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', text)):
-                            title = text
+                    # Check data attributes
+                    for attr in RATING_ATTRIBUTES:
+                        attr_value = elem.get_attribute(attr)
+                        if attr_value and attr_value.isdigit():
+                            rating = int(attr_value)
                             break
-                except:
-                    pass
-                    
-        except Exception as e:
-            print(f"Error extracting title: {e}")
-        
-        review_data["title"] = title
-        
-        # Improved review text extraction with multiple selectors
-        review_text = ""
-        try:
-            # Try multiple possible selectors for review content
-            selectors = [
-                "div[data-service-review-text-typography='true']",
-                "p[data-service-review-text-typography='true']",
-                "div[class*='review-content']",
-                "p[class*='review-content']",
-                "div[class^='typography_body-l']",
-                "p[class^='typography_body-l']",
-                "div[class^='typography_body']",
-                "p[class^='typography_body']",
-                "span[class*='typography_body']"
-            ]
-            
-            for selector in selectors:
-                try:
-                    review_element = card.find_element(By.CSS_SELECTOR, selector)
-                    potential_text = review_element.text.strip()
-                    # Check if this looks like actual review content (not just metadata)
-                    if potential_text and len(potential_text) > 10:
-                        review_text = potential_text
+                    if rating:
                         break
-                except NoSuchElementException:
-                    continue
-            
-            # If no specific selector worked, try to find any text content in the card
-            if not review_text:
-                try:
-                    # Look for any div or p with substantial text content
-                    text_elements = card.find_elements(By.CSS_SELECTOR, "div, p")
-                    for element in text_elements:
-                        text = element.text.strip()
-                        # Skip elements that are likely metadata (short text, dates, etc.)
-                        if (text and len(text) > 20 and 
-                            not re.match(r'^\d+\s*(star|stars|out of)', text.lower()) and
-                            not re.match(r'^\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', text) and
-                            'verified' not in text.lower() and
-                            'helpful' not in text.lower()):
-                            review_text = text
-                            break
-                except:
-                    pass
-                    
-        except Exception as e:
-            print(f"Error extracting review text: {e}")
+            except:
+                pass
+                
+    except Exception as e:
+        print(f"Error extracting rating: {e}")
+    
+    review_data["rating"] = rating
+    
+    # Improved title extraction with multiple selectors
+    title = ""
+    try:
+        for selector in ordered_selectors(ranking, 'title', TITLE_SELECTORS):
+            try:
+                title_element = card.find_element(By.CSS_SELECTOR, selector)
+                potential_title = title_element.text.strip()
+                hit = bool(potential_title) and len(potential_title) > 2
+                record_selector(ranking, 'title', selector, hit)
+                if hit:
+                    title = potential_title
+                    break
+            except NoSuchElementException:
+                record_selector(ranking, 'title', selector, False)
+                continue
         
-        review_data["review"] = review_text
+        # If no specific selector worked, look for any heading elements with substantial text
+        if not title:
+            try:
+                heading_elements = card.find_elements(By.CSS_SELECTOR, TITLE_FALLBACK_SELECTOR)
+                for element in heading_elements:
+                    text = element.text.strip()
+                    if is_title_candidate(text):
+                        title = text
+                        break
+            except:
+                pass
+                
+    except Exception as e:
+        print(f"Error extracting title: {e}")
+    
+    review_data["title"] = title
+    
+    # Improved review text extraction with multiple selectors
+    review_text = ""
+    try:
+        for selector in ordered_selectors(ranking, 'review', TEXT_SELECTORS):
+            try:
+                review_element = card.find_element(By.CSS_SELECTOR, selector)
+                potential_text = review_element.text.strip()
+                # Check if this looks like actual review content (not just metadata)
+                hit = bool(potential_text) and len(potential_text) > 10
+                record_selector(ranking, 'review', selector, hit)
+                if hit:
+                    review_text = potential_text
+                    break
+            except NoSuchElementException:
+                record_selector(ranking, 'review', selector, False)
+                continue
         
+        # If no specific selector worked, try to find any text content in the card
+        if not review_text:
+            try:
+                text_elements = card.find_elements(By.CSS_SELECTOR, TEXT_FALLBACK_SELECTOR)
+                for element in text_elements:
+                    text = element.text.strip()
+                    if is_text_candidate(text):
+                        review_text = text
+                        break
+            except:
+                pass
+                
+    except Exception as e:
+        print(f"Error extracting review text: {e}")
+    
+    review_data["review"] = review_text
+    
+    try:
+        date_element = card.find_element(By.CSS_SELECTOR, DATE_SELECTOR)
+        review_data["date"] = date_element.get_attribute("datetime")
+    except NoSuchElementException:
+        review_data["date"] = ""
+    return review_data
+
+class SeleniumPageScraper:
+    def __init__(self, lean=False, baseline=None, ranking=None):
+        self.driver = setup_driver(lean=lean)
+        self.meter = PageLoadMeter(baseline) if lean else None
+        self.ranking = ranking
+
+    def scrape(self, url):
+        reviews_data = scrape_page(self.driver, url, ranking=self.ranking)
+        if self.meter is not None and reviews_data is not None:
+            self.meter.record(self.driver, url)
+        return reviews_data
+
+    def close(self):
+        if self.meter is not None:
+            self.meter.summary()
+        self.driver.quit()
+
+class HttpPageScraper:
+    # --- browserless engine; a Chrome driver is only started if a page parses to zero cards
+    # --- or is refused with a 403
+    def __init__(self, lean=False, baseline=None, ranking=None):
+        self.session = create_session()
+        self.fallback = None
+        self.fallback_options = {'lean': lean, 'baseline': baseline, 'ranking': ranking}
+        self.ranking = ranking
+
+    def scrape(self, url):
         try:
-            date_element = card.find_element(By.CSS_SELECTOR, "time")
-            review_data["date"] = date_element.get_attribute("datetime")
-        except NoSuchElementException:
-            review_data["date"] = ""
-        reviews_data.append(review_data)
-    print(f"Scraped {len(reviews_data)} reviews from {url}")    
-    return reviews_data
+            html = fetch_page(self.session, url)
+        except PageBlocked:
+            print(f"HTTP 403 at: {url} --> falling back to selenium")
+            return self.scrape_with_browser(url)
+        reviews_data = parse_http_page(html, self.ranking) if html is not None else None
+        if reviews_data is None:
+            print(f"Reached a 404 page at: {url}")
+            return None
+        if not reviews_data:
+            print(f"No review cards over HTTP at: {url} --> falling back to selenium")
+            return self.scrape_with_browser(url)
+        print(f"Scraped {len(reviews_data)} reviews from {url}")
+        return reviews_data
 
-def main():
-    base_url = input("copy-paste the trustpilot review url (eg --> https://www.trustpilot.com/review/choosemuse.com): ").strip() # --- ensure URL is valid
-    while not base_url:
-        base_url = input("Base URL cannot be empty. Please enter a valid URL: ").strip()
-    input_pages = input("Please enter how many pages you want to query (or 'all'): ").strip().lower()
-    if input_pages == 'all':
-        max_pages = float('inf')
-        scrape_all = True
-    else:
-        scrape_all = False
+    def scrape_with_browser(self, url):
+        if self.fallback is None:
+            self.fallback = SeleniumPageScraper(**self.fallback_options)
+        return self.fallback.scrape(url)
+
+    def close(self):
+        self.session.close()
+        if self.fallback is not None:
+            self.fallback.close()
+
+ENGINES = {
+    'selenium': SeleniumPageScraper,
+    'http': HttpPageScraper
+}
+
+def page_url(base_url, page):
+    if page == 1:
+        return base_url
+    return f"{base_url}{'?' if '?' not in base_url else '&'}page={page}"
+
+def record_outcome(limiter, url, page_data):
+    # --- an empty page is how throttling shows up (timeout waiting for the reviews list)
+    if page_data == []:
+        limiter.failure(url, "empty page")
+    elif page_data is not None:
+        limiter.success(url)
+
+def fetch_paced(scraper, limiter, url):
+    # --- a 429 or an empty page backs the host off and retries the same page, so a throttled
+    # --- page is neither the end of the crawl nor checkpointed as done with no reviews
+    for attempt in range(MAX_THROTTLE_RETRIES + 1):
+        limiter.acquire(url)
         try:
-            max_pages = int(input_pages)
-        except ValueError:
-            print("invalid number of pages provided --> defaulting to 1 page...")
-            max_pages = 1
-    company_name = extract_company_name(base_url)
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S") + ".000Z"
-    
-    # Define output filenames for both JSON and CSV
-    json_filename = f"{company_name}_trustpilot_reviews_{timestamp}.json"
-    csv_filename = f"{company_name}_trustpilot_reviews_{timestamp}.csv"
-    driver = setup_driver()
+            page_data = scraper.scrape(url)
+        except PageThrottled as e:
+            limiter.failure(url, "HTTP 429", retry_after=e.retry_after)
+            if attempt == MAX_THROTTLE_RETRIES:
+                raise
+            continue
+        except Exception:
+            limiter.failure(url, "error")
+            raise
+        record_outcome(limiter, url, page_data)
+        if page_data == [] and attempt < MAX_THROTTLE_RETRIES:
+            print(f"Empty page at: {url} --> retrying ({attempt + 1}/{MAX_THROTTLE_RETRIES})")
+            continue
+        return page_data
+
+def scrape_sequential(base_url, max_pages, engine='selenium', limiter=None, stop_when=None,
+                      start_page=1, on_page=None, scraper_options=None):
+    # --- with on_page set, pages are handed off as they complete instead of collected
+    limiter = limiter or AdaptiveRateLimiter()
+    scraper = ENGINES[engine](**(scraper_options or {}))
     all_reviews = []
-    current_page = 1
+    current_page = start_page - 1
     reached_404 = False
     try:
-        print(f"scraping page {current_page}...")
-        page_data = scrape_page(driver, base_url)
-        if page_data is None:
-            reached_404 = True
-        else:
-            all_reviews.extend(page_data)
-        while not reached_404 and current_page < max_pages:
+        while current_page < max_pages:
             current_page += 1
-            next_page_url = f"{base_url}{'?' if '?' not in base_url else '&'}page={current_page}"
+            url = page_url(base_url, current_page)
             print(f"scraping page {current_page}...")
-            page_data = scrape_page(driver, next_page_url)
+            page_data = fetch_paced(scraper, limiter, url)
             if page_data is None:
                 reached_404 = True
                 break
-            all_reviews.extend(page_data)
-            time.sleep(2)
+            if on_page is not None:
+                on_page(current_page, page_data)
+            else:
+                all_reviews.extend(page_data)
+            if page_data and stop_when is not None and stop_when(page_data):
+                break
     finally:
-        driver.quit()
-    
-    # Save data in JSON format
-    with open(json_filename, 'w', encoding='utf-8') as f:
-        json.dump(all_reviews, f, indent=2, ensure_ascii=False)
-    
-    # Save data in CSV format
-    if all_reviews:
-        with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['date', 'rating', 'title', 'review']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            # Write header
-            writer.writeheader()
+        scraper.close()
+    pages_scraped = current_page - start_page + (0 if reached_404 else 1)
+    return all_reviews, pages_scraped, reached_404
+
+def scrape_pool(base_url, max_pages, workers, engine='selenium', limiter=None, stop_when=None,
+                start_page=1, on_page=None, scraper_options=None):
+    # --- one limiter for the whole pool, so the politeness budget is global rather than per worker
+    limiter = limiter or AdaptiveRateLimiter()
+    pages = itertools.count(start_page)
+    lock = threading.Lock()
+    stop = threading.Event()
+    state = {'last_page': max_pages}  # --- lowered to the page before the first 404
+    results = {}
+    errors = []
+
+    def claim_page():
+        with lock:
+            page = next(pages)
+            if stop.is_set() or page > state['last_page']:
+                return None
+            return page
+
+    def worker():
+        scraper = ENGINES[engine](**(scraper_options or {}))
+        try:
+            while True:
+                page = claim_page()
+                if page is None:
+                    return
+                url = page_url(base_url, page)
+                print(f"scraping page {page}...")
+                page_data = fetch_paced(scraper, limiter, url)
+                with lock:
+                    if page_data is None:
+                        state['last_page'] = min(state['last_page'], page - 1)
+                        stop.set()
+                    else:
+                        if on_page is not None:
+                            on_page(page, page_data)
+                        results[page] = page_data if on_page is None else []
+                        if stop_when is not None and stop_when(page_data):
+                            state['last_page'] = min(state['last_page'], page)
+        except Exception as e:
+            errors.append(e)
+            stop.set()
+        finally:
+            scraper.close()
+
+    threads = [threading.Thread(target=worker, name=f"trustpilot-worker-{i + 1}") for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+    # --- merge in page order, dropping anything fetched past the first 404
+    kept_pages = [page for page in sorted(results) if page <= state['last_page']]
+    all_reviews = [review for page in kept_pages for review in results[page]]
+    return all_reviews, len(kept_pages), stop.is_set()
+
+def save_results(reviews, json_filename=None, csv_filename=None):
+    # --- streams both files in one pass so `reviews` can be a generator over the checkpoint
+    # --- either filename may be None to skip that format
+    review_count = 0
+    jsonfile = open(json_filename, 'w', encoding='utf-8') if json_filename else None
+    csvfile = None
+    try:
+        if jsonfile is not None:
+            jsonfile.write("[")
+        for review in reviews:
+            # Save data in JSON format, laid out exactly as json.dump(..., indent=2)
+            if jsonfile is not None:
+                entry = json.dumps(review, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+                jsonfile.write(("," if review_count else "") + "\n  " + entry)
             
-            # Write review data
-            for review in all_reviews:
+            # Save data in CSV format
+            if csv_filename and csvfile is None:
+                csvfile = open(csv_filename, 'w', newline='', encoding='utf-8')
+                fieldnames = ['date', 'rating', 'title', 'review']
+                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                writer.writeheader()
+            if csvfile is not None:
                 writer.writerow({
                     'date': review.get('date', ''),
                     'rating': review.get('rating', ''),
                     'title': review.get('title', ''),
                     'review': review.get('review', '')
                 })
+            review_count += 1
+        if jsonfile is not None:
+            jsonfile.write("\n]" if review_count else "]")
+    finally:
+        if jsonfile is not None:
+            jsonfile.close()
+        if csvfile is not None:
+            csvfile.close()
+    return review_count
+
+def run_incremental(base_url, company_name, workers, engine, state, out_dir=".", scraper_options=None, limiter=None):
+    stop_when = lambda page_data: state.page_reaches_known(company_name, page_data)
+    if workers > 1:
+        scraped, pages_scraped, _ = scrape_pool(base_url, float('inf'), workers, engine=engine, limiter=limiter,
+                                                stop_when=stop_when, scraper_options=scraper_options)
+    else:
+        scraped, pages_scraped, _ = scrape_sequential(base_url, float('inf'), engine=engine, limiter=limiter,
+                                                      stop_when=stop_when, scraper_options=scraper_options)
+    new_reviews = [review for review in scraped if state.is_new(company_name, review)]
+    dataset_path = canonical_dataset_path(company_name, out_dir)
+    append_reviews(dataset_path, new_reviews)
+    state.update(company_name, new_reviews)
+    state.save()
+    print(f"incremental run complete... {len(new_reviews)} new review(s) across {pages_scraped} page(s).")
+    print(f"appended to: {dataset_path}")
+    return len(new_reviews), pages_scraped
+
+def run_full(base_url, company_name, max_pages, workers, engine, out_dir=".", output_format='both',
+             resume=False, scraper_options=None, limiter=None):
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S") + ".000Z"
+    
+    # Define output filenames for both JSON and CSV
+    json_filename = os.path.join(out_dir, f"{company_name}_trustpilot_reviews_{timestamp}.json")
+    csv_filename = os.path.join(out_dir, f"{company_name}_trustpilot_reviews_{timestamp}.csv")
+    checkpoint = PageCheckpoint(checkpoint_path(company_name, out_dir), resume=resume)
+    reached_404 = checkpoint.finished
+    if reached_404:
+        print(f"checkpoint already complete --> exporting {checkpoint.pages_completed} page(s)...")
+    else:
+        start_page = checkpoint.next_page()
+        if start_page > 1:
+            print(f"resuming from page {start_page}...")
+        if workers > 1:
+            _, _, reached_404 = scrape_pool(base_url, max_pages, workers, engine=engine, limiter=limiter,
+                                            start_page=start_page, on_page=checkpoint.write_page,
+                                            scraper_options=scraper_options)
+        else:
+            _, _, reached_404 = scrape_sequential(base_url, max_pages, engine=engine, limiter=limiter,
+                                                  start_page=start_page, on_page=checkpoint.write_page,
+                                                  scraper_options=scraper_options)
+        if reached_404:
+            checkpoint.mark_end()
     
-    if scrape_all and not reached_404:
+    review_count = save_results(checkpoint.iter_reviews(),
+                                json_filename if output_format in ('json', 'both') else None,
+                                csv_filename if output_format in ('csv', 'both') else None)
+    pages_scraped = checkpoint.pages_completed
+    checkpoint.remove()
+    
+    if max_pages == float('inf') and not reached_404:
         print("scraping complete (scraped until no more pages found).")
     else:
-        pages_scraped = current_page if not reached_404 else current_page - 1
-        print(f"query complete... queried {len(all_reviews)} reviews across {pages_scraped} page(s).")
+        print(f"query complete... queried {review_count} reviews across {pages_scraped} page(s).")
     print("results saved to:")
-    print(f"  JSON: {json_filename}")
-    print(f"  CSV:  {csv_filename}")
+    if output_format in ('json', 'both'):
+        print(f"  JSON: {json_filename}")
+    if output_format in ('csv', 'both'):
+        print(f"  CSV:  {csv_filename}")
+    return review_count, pages_scraped
+
+def parse_max_pages(value):
+    if str(value).strip().lower() == 'all':
+        return float('inf')
+    try:
+        return max(1, int(value))
+    except ValueError:
+        print("invalid number of pages provided --> defaulting to 1 page...")
+        return 1
+
+def read_urls(urls, url_file):
+    # --- --url values first, then one URL per line from --url-file ('#' starts a comment)
+    all_urls = list(urls or [])
+    if url_file:
+        with open(url_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if line:
+                    all_urls.append(line)
+    return all_urls
+
+def scrape_company(base_url, args, state, scraper_options, limiter):
+    company_name = extract_company_name(base_url)
+    started = time.monotonic()
+    if args.incremental:
+        review_count, pages_scraped = run_incremental(base_url, company_name, args.workers, args.engine, state,
+                                                      args.out_dir, scraper_options, limiter)
+    else:
+        review_count, pages_scraped = run_full(base_url, company_name, parse_max_pages(args.pages), args.workers,
+                                               args.engine, args.out_dir, args.format, args.resume,
+                                               scraper_options, limiter)
+    elapsed = time.monotonic() - started
+    return {
+        'company': company_name,
+        'reviews': review_count,
+        'pages': pages_scraped,
+        'seconds': elapsed
+    }
+
+def print_throughput(results):
+    print("per-company throughput:")
+    for result in results:
+        seconds = max(result['seconds'], 1e-9)
+        print(f"  {result['company']}: {result['reviews']} reviews, {result['pages']} page(s) in "
+              f"{result['seconds']:.1f}s ({result['reviews'] / seconds:.2f} reviews/s, "
+              f"{result['pages'] / seconds:.2f} pages/s)")
+
+def run_batch(urls, args):
+    os.makedirs(args.out_dir, exist_ok=True)
+    ranking = SelectorRanking(args.selector_cache)
+    # --- every company hits the same host, so one shared limiter keeps the batch polite as a whole
+    limiter = AdaptiveRateLimiter(args.rate, args.min_rate, args.max_rate,
+                                  host_limits=parse_host_limits(args.host_limit), log_path=args.pacing_log)
+    state = IncrementalState(args.state_file) if args.incremental else None
+    scraper_options = {'lean': args.lean_browser, 'ranking': ranking}
+    if args.lean_browser and args.engine == 'selenium':
+        print("measuring a full-profile page load as the lean-browser baseline...")
+        scraper_options['baseline'] = measure_full_profile(urls[0])
+    
+    results = [None] * len(urls)
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+        futures = {executor.submit(scrape_company, url, args, state, scraper_options, limiter): i
+                   for i, url in enumerate(urls)}
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                print(f"Error scraping {urls[futures[future]]}: {e}")
+    
+    ranking.report()
+    ranking.save()
+    results = [result for result in results if result is not None]
+    print_throughput(results)
+    return results
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape Trustpilot reviews to JSON and CSV.")
+    parser.add_argument('--url', action='append', metavar='URL',
+                        help="Trustpilot review URL, repeatable (eg https://www.trustpilot.com/review/choosemuse.com)")
+    parser.add_argument('--url-file', metavar='FILE',
+                        help="file with one Trustpilot review URL per line")
+    parser.add_argument('--pages', default=None,
+                        help="number of pages per company, or 'all' (default: 'all' with --url, prompt otherwise)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="parallel page workers per company (default: 1)")
+    parser.add_argument('--concurrency', type=int, default=2,
+                        help="companies scraped at the same time in batch mode (default: 2)")
+    parser.add_argument('--out-dir', default=".",
+                        help="directory for JSON/CSV output, checkpoints and incremental datasets (default: .)")
+    parser.add_argument('--format', choices=['json', 'csv', 'both'], default='both',
+                        help="output format (default: both)")
+    parser.add_argument('--engine', choices=sorted(ENGINES), default='selenium',
+                        help="page fetcher: headless Chrome (selenium) or plain HTTP with selenium fallback (http)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="stop at already-seen reviews and append only new ones to the canonical dataset")
+    parser.add_argument('--state-file', default=DEFAULT_STATE_FILE,
+                        help=f"high-water mark file for --incremental (default: {DEFAULT_STATE_FILE})")
+    parser.add_argument('--lean-browser', action='store_true',
+                        help="block images, fonts and third-party scripts, load pages eagerly and report the savings")
+    parser.add_argument('--selector-cache', metavar='FILE',
+                        help="persist the adaptive selector ranking and its hit/miss stats across runs")
+    parser.add_argument('--rate', type=positive_rate, default=DEFAULT_RATE,
+                        help=f"initial request rate per host in pages/second (default: {DEFAULT_RATE})")
+    parser.add_argument('--min-rate', type=positive_rate, default=DEFAULT_MIN_RATE,
+                        help=f"floor for the adaptive request rate (default: {DEFAULT_MIN_RATE})")
+    parser.add_argument('--max-rate', type=positive_rate, default=DEFAULT_MAX_RATE,
+                        help=f"ceiling for the adaptive request rate (default: {DEFAULT_MAX_RATE})")
+    parser.add_argument('--host-limit', action='append', type=host_limit, metavar='HOST=RATE',
+                        help="per-host ceiling for the adaptive request rate, repeatable")
+    parser.add_argument('--pacing-log', metavar='FILE',
+                        help="append every pacing decision to FILE as JSON lines")
+    parser.add_argument('--resume', action='store_true',
+                        help="continue an interrupted crawl from its checkpoint instead of starting at page 1")
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args()
+    urls = read_urls(args.url, args.url_file)
+    if not urls:
+        # --- no --url/--url-file: keep the original interactive prompts
+        base_url = input("copy-paste the trustpilot review url (eg --> https://www.trustpilot.com/review/choosemuse.com): ").strip() # --- ensure URL is valid
+        while not base_url:
+            base_url = input("Base URL cannot be empty. Please enter a valid URL: ").strip()
+        urls = [base_url]
+        if args.pages is None and not args.incremental:
+            args.pages = input("Please enter how many pages you want to query (or 'all'): ").strip().lower()
+        if args.workers is None:
+            input_workers = input("How many workers to run in parallel? (default 1): ").strip()
+            try:
+                args.workers = max(1, int(input_workers)) if input_workers else 1
+            except ValueError:
+                print("invalid number of workers provided --> defaulting to 1...")
+                args.workers = 1
+    if args.pages is None:
+        args.pages = 'all'
+    if args.workers is None:
+        args.workers = 1
+    run_batch(urls, args)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""
+Adaptive ranking of the Trustpilot card selectors.
+Once a selector yields a value for a field it is tried first on every
+following card, so the fallback chain is only walked when the cached
+winner stops working. Hit/miss counts are kept per selector and can be
+persisted between runs.
+"""
+import json
+import os
+import threading
+
+
+class SelectorRanking:
+    def __init__(self, path=None):
+        self.path = path
+        self.winners = {}
+        self.stats = {}
+        self.lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            self.winners = saved.get('winners', {})
+            self.stats = saved.get('stats', {})
+
+    def order(self, field, selectors):
+        winner = self.winners.get(field)
+        if winner not in selectors:
+            return selectors
+        return [winner] + [selector for selector in selectors if selector != winner]
+
+    def record(self, field, selector, hit):
+        with self.lock:
+            counts = self.stats.setdefault(field, {}).setdefault(selector, {'hits': 0, 'misses': 0})
+            counts['hits' if hit else 'misses'] += 1
+            if hit:
+                self.winners[field] = selector
+
+    def report(self):
+        for field in sorted(self.stats):
+            print(f"selector stats for {field} (winner: {self.winners.get(field, 'none')}):")
+            ranked = sorted(self.stats[field].items(), key=lambda item: -item[1]['hits'])
+            for selector, counts in ranked:
+                print(f"  {counts['hits']:>6} hit(s) {counts['misses']:>6} miss(es)  {selector}")
+
+    def save(self):
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'winners': self.winners, 'stats': self.stats}, f, indent=2)
+        os.replace(tmp_path, self.path)
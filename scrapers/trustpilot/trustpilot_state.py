@@ -0,0 +1,97 @@
+"""
+High-water mark bookkeeping for incremental Trustpilot scraping.
+Per company we keep the newest review date seen so far plus the content
+hashes of the reviews on that date, so a nightly run can stop paginating
+as soon as it reaches reviews it already has. Reviews without a date
+cannot be placed against the high-water mark, so all of their hashes
+are kept and checked instead.
+"""
+import hashlib
+import json
+import os
+import threading
+
+DEFAULT_STATE_FILE = "trustpilot_state.json"
+
+
+def review_hash(review):
+    content = "\x1f".join([
+        str(review.get('date') or ''),
+        str(review.get('rating') or ''),
+        " ".join(str(review.get('title') or '').split()),
+        " ".join(str(review.get('review') or '').split())
+    ])
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def canonical_dataset_path(company_name, out_dir="."):
+    return os.path.join(out_dir, f"{company_name}_trustpilot_reviews.jsonl")
+
+
+class IncrementalState:
+    def __init__(self, path=DEFAULT_STATE_FILE):
+        self.path = path
+        self.companies = {}
+        self.lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.companies = json.load(f)
+
+    def high_water_mark(self, company_name):
+        entry = self.companies.get(company_name, {})
+        return entry.get('newest_date') or '', set(entry.get('newest_hashes', []))
+
+    def undated_hashes(self, company_name):
+        return set(self.companies.get(company_name, {}).get('undated_hashes', []))
+
+    def is_new(self, company_name, review):
+        date = review.get('date') or ''
+        if not date:
+            return review_hash(review) not in self.undated_hashes(company_name)
+        newest_date, newest_hashes = self.high_water_mark(company_name)
+        if not newest_date or date > newest_date:
+            return True
+        return date == newest_date and review_hash(review) not in newest_hashes
+
+    def page_reaches_known(self, company_name, page_data):
+        # --- reviews come newest first, so one already-seen review means the rest are older
+        newest_date, _ = self.high_water_mark(company_name)
+        if not newest_date and not self.undated_hashes(company_name):
+            return False
+        return any(not self.is_new(company_name, review) for review in page_data)
+
+    def update(self, company_name, reviews):
+        with self.lock:
+            self._update(company_name, reviews)
+
+    def _update(self, company_name, reviews):
+        newest_date, newest_hashes = self.high_water_mark(company_name)
+        undated_hashes = self.undated_hashes(company_name)
+        for review in reviews:
+            date = review.get('date') or ''
+            if not date:
+                undated_hashes.add(review_hash(review))
+                continue
+            if date > newest_date:
+                newest_date, newest_hashes = date, set()
+            if date and date == newest_date:
+                newest_hashes.add(review_hash(review))
+        self.companies[company_name] = {
+            'newest_date': newest_date,
+            'newest_hashes': sorted(newest_hashes),
+            'undated_hashes': sorted(undated_hashes)
+        }
+
+    def save(self):
+        # --- shared by concurrent companies in batch mode
+        with self.lock:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.companies, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+def append_reviews(path, reviews):
+    with open(path, 'a', encoding='utf-8') as f:
+        for review in reviews:
+            f.write(json.dumps(review, ensure_ascii=False) + "\n")